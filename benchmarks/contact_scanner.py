@@ -0,0 +1,95 @@
+"""
+Pathological-input benchmark for the contact scanner in ``extract_text``.
+
+Compares ``scan_contacts`` (single linear pass) against the previous four-regex
+implementation, kept here verbatim as the reference. The legacy e-mail pattern is quadratic
+on long runs of local-part characters (e.g. ``(12)(34)...`` or ``aaaa...@``), so keep
+``--size`` moderate or pass ``--skip-legacy`` for large inputs.
+
+Usage:
+  python benchmarks/contact_scanner.py --size 20000
+  python benchmarks/contact_scanner.py --size 2000000 --skip-legacy
+"""
+
+from __future__ import annotations
+
+import argparse
+import re
+import time
+
+from humanized_selenium_scraper.extract_text import scan_contacts
+
+_LEGACY_NORMAL_EMAIL_RE = re.compile(
+    r"[a-zA-Z0-9._%+\-\(\)]+@[a-zA-Z0-9.\-]+\.[a-zA-Z]{2,}",
+    re.MULTILINE,
+)
+_LEGACY_OBF_EMAIL_RE = re.compile(
+    r"([a-zA-Z0-9._%+\-]+)\s?(\(|\[)?at(\)|\])?\s?([a-zA-Z0-9.\-]+)\s?"
+    r"(\(|\[)?(dot|punkt)(\)|\])?\s?([a-zA-Z]{2,})",
+    re.IGNORECASE,
+)
+_LEGACY_PHONE_PREFIX_RE = re.compile(
+    r"(?:tel|phone|call)[:\s]*(\+?\d{2,4}\(?\d{1,4}\)?\s?\d{3,}[\d\s/\-]*)",
+    re.IGNORECASE,
+)
+_LEGACY_PHONE_SIMPLE_RE = re.compile(
+    r"\+?\d{2,4}[\s./-]*\(?\d{1,4}\)?[\s./-]*\d{3,}[\d\s./-]*",
+    re.IGNORECASE,
+)
+
+
+def legacy_scan(text: str) -> tuple[set[str], set[str]]:
+    phones: set[str] = set()
+    for pattern, group in ((_LEGACY_PHONE_PREFIX_RE, 1), (_LEGACY_PHONE_SIMPLE_RE, 0)):
+        for match in pattern.finditer(text):
+            candidate = match.group(group).strip()
+            if len(re.sub(r"\D", "", candidate)) >= 7:
+                phones.add(candidate)
+    mails = {m.strip() for m in _LEGACY_NORMAL_EMAIL_RE.findall(text)}
+    for match in _LEGACY_OBF_EMAIL_RE.finditer(text):
+        mails.add(f"{match.group(1)}@{match.group(4)}.{match.group(8)}")
+    return phones, mails
+
+
+def _repeat(unit: str, size: int) -> str:
+    return unit * max(size // len(unit), 1)
+
+
+def build_cases(size: int) -> dict[str, str]:
+    page = (
+        "<div class='item'>Kontakt info@example.org Tel. 030 1234567 "
+        "sales (at) example (dot) com</div>\n"
+    )
+    return {
+        "html_page": _repeat(page, size),
+        "minified_js": _repeat("var a=[1234567890,1.5,-2.25e10,0x1f];", size),
+        "digit_space_runs": _repeat("12 345 6789 ", size),
+        "separator_runs": _repeat("12" + " -" * 30 + "3", size),
+        "paren_digits": _repeat("(12)(34)", size),
+        "local_part_run": "a" * size + "@",
+        "at_separated": _repeat("x (at) ", size),
+    }
+
+
+def _time(fn, text: str) -> float:
+    started = time.perf_counter()
+    fn(text)
+    return time.perf_counter() - started
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Contact scanner pathological-input benchmark.")
+    parser.add_argument("--size", type=int, default=20000, help="Approximate input length.")
+    parser.add_argument("--skip-legacy", action="store_true", help="Only time scan_contacts.")
+    args = parser.parse_args(argv)
+
+    print(f"{'case':>18} {'chars':>9} {'scan_contacts':>14} {'legacy':>12}")
+    for name, text in build_cases(args.size).items():
+        new_ms = _time(scan_contacts, text) * 1000
+        old = "-" if args.skip_legacy else f"{_time(legacy_scan, text) * 1000:.1f}ms"
+        print(f"{name:>18} {len(text):>9} {new_ms:>12.1f}ms {old:>12}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
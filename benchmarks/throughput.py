@@ -0,0 +1,181 @@
+"""
+End-to-end throughput harness on the offline simulated web.
+
+Runs ``cli.run`` (and therefore ``Session``) over a generated input CSV whose rows all resolve
+against ``humanized_selenium_scraper.simweb``. Humanized pauses are scaled to zero, so the
+numbers measure the orchestration layer itself.
+
+Usage:
+  python benchmarks/throughput.py --rows 1000
+  python benchmarks/throughput.py --rows 100000 --filler-kb 2 --json
+  python benchmarks/throughput.py --rows 200 --backend chrome   # headless Chrome + local server
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import json
+import logging
+import resource
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any
+from unittest import mock
+
+from humanized_selenium_scraper import cli, scraper
+from humanized_selenium_scraper.config import ScraperConfig
+from humanized_selenium_scraper.emulation import FakeDriver
+from humanized_selenium_scraper.human import scaled_pauses
+from humanized_selenium_scraper.metrics import METRICS
+from humanized_selenium_scraper.simweb import CONSENT_MODES, SimWeb, SimWebServer
+from humanized_selenium_scraper.spec import NavigationSpec, SearchSpec
+
+
+class _PlainHttpDriver:
+    """Delegating driver that downgrades https to http (the local corpus server is plain HTTP)."""
+
+    def __init__(self, driver: Any) -> None:
+        self._driver = driver
+
+    def get(self, url: str) -> None:
+        if url.startswith("https://"):
+            url = "http://" + url[len("https://") :]
+        self._driver.get(url)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._driver, name)
+
+
+def _fake_factory(web: SimWeb, load_latency_s: float):
+    def factory(config: ScraperConfig, *, profile_dir: Path) -> FakeDriver:
+        return FakeDriver(web, load_latency_s=load_latency_s)
+
+    return factory
+
+
+def _chrome_factory(server: SimWebServer):
+    from selenium import webdriver
+    from selenium.webdriver.chrome.options import Options
+    from selenium.webdriver.chrome.service import Service
+
+    def factory(config: ScraperConfig, *, profile_dir: Path) -> _PlainHttpDriver:
+        opts = Options()
+        opts.add_argument("--headless=new")
+        opts.add_argument(f"--user-data-dir={profile_dir}")
+        opts.add_argument(f"--proxy-server=http://{server.address}")
+        opts.add_argument("--proxy-bypass-list=<-loopback>")
+        driver = webdriver.Chrome(service=Service(), options=opts)
+        driver.set_page_load_timeout(config.page_load_timeout_s)
+        driver.implicitly_wait(config.implicit_wait_s)
+        return _PlainHttpDriver(driver)
+
+    return factory
+
+
+def run_harness(args: argparse.Namespace) -> dict[str, Any]:
+    web = SimWeb(
+        companies=args.rows,
+        seed=args.seed,
+        hit_rate=args.hit_rate,
+        filler_kb=args.filler_kb,
+        consent=args.consent,
+    )
+    with tempfile.TemporaryDirectory(prefix="hss-bench-") as tmp:
+        tmp_dir = Path(tmp)
+        input_file = tmp_dir / "input.csv"
+        output_file = tmp_dir / "output.csv"
+        with input_file.open("w", encoding="utf-8", newline="") as handle:
+            writer = csv.writer(handle)
+            for row in web.rows():
+                writer.writerow([row["name"], row["street"], row["plz"], row["city"]])
+
+        server = None
+        if args.backend == "chrome":
+            server = SimWebServer(web).start()
+            factory = _chrome_factory(server)
+        else:
+            factory = _fake_factory(web, args.load_latency_ms / 1000)
+
+        config = ScraperConfig(chrome_profile_root=tmp_dir / "profile")
+        spec = SearchSpec(
+            query_template=args.query_template,
+            navigation=NavigationSpec(tab_pipeline=args.tab_pipeline),
+        )
+        METRICS.reset()
+        if args.trace_memory:
+            tracemalloc.start()
+        started = time.perf_counter()
+        try:
+            with scaled_pauses(0), mock.patch.object(scraper, "create_driver", factory):
+                cli.run(
+                    input_file=input_file,
+                    output_file=output_file,
+                    config=config,
+                    spec=spec,
+                    delimiter=",",
+                    has_header=False,
+                    columns=["name", "street", "plz", "city"],
+                )
+        finally:
+            elapsed = time.perf_counter() - started
+            if server is not None:
+                server.stop()
+        peak_traced = tracemalloc.get_traced_memory()[1] if args.trace_memory else None
+        tracemalloc.stop()
+
+        with output_file.open("r", encoding="utf-8", newline="") as handle:
+            out_rows = list(csv.reader(handle))[1:]
+
+    rows = len(out_rows)
+    counters = METRICS.snapshot()
+    return {
+        "backend": args.backend,
+        "rows": rows,
+        "matched_rows": sum(1 for r in out_rows if r[4]),
+        "elapsed_s": round(elapsed, 3),
+        "rows_per_min": round(rows / elapsed * 60, 1) if elapsed > 0 else None,
+        "page_loads_per_row": round(counters.get("page_loads", 0) / max(rows, 1), 3),
+        "history_back_per_row": round(counters.get("history_back", 0) / max(rows, 1), 3),
+        "peak_traced_mb": round(peak_traced / 2**20, 1) if peak_traced is not None else None,
+        # ru_maxrss is KiB on Linux
+        "max_rss_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+    }
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--rows", type=int, default=1000, help="Input rows (companies).")
+    parser.add_argument("--backend", choices=["fake", "chrome"], default="fake")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--hit-rate", type=float, default=0.8, help="Share of rows with a site.")
+    parser.add_argument("--filler-kb", type=int, default=8, help="Filler text per page (KiB).")
+    parser.add_argument("--consent", choices=CONSENT_MODES, default="every_visit")
+    parser.add_argument(
+        "--load-latency-ms", type=float, default=0.0, help="Fake per-navigation latency."
+    )
+    parser.add_argument("--query-template", default="{name} {city} contact")
+    parser.add_argument(
+        "--tab-pipeline", type=int, default=0, help="Background tabs per driver (0: sequential)."
+    )
+    parser.add_argument("--trace-memory", action="store_true", help="Track peak Python heap.")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON.")
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    logging.basicConfig(level=logging.WARNING)
+    report = run_harness(args)
+    if args.json:
+        print(json.dumps(report))
+    else:
+        for key, value in report.items():
+            print(f"{key:>22}: {value}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
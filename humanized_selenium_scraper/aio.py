@@ -0,0 +1,240 @@
+"""Asyncio orchestration: many sessions (browsers) in one process and one event loop.
+
+Each ``AsyncSession`` wraps a ``scraper.Session`` and awaits ``rows.run_row_steps``, the
+pipeline ``cli.run`` uses (tab pipeline, retries, consent and cookie handling included).
+Navigation, waits and pauses are awaited on the loop: only the individual blocking calls
+(one WebDriver round trip, a preflight request, a page evaluation) go to a bounded thread pool,
+so a session holds no thread while it pauses or between the polls of a wait, and a few
+threads drive many browsers. The event loop feeds rows to the sessions, retries deferred rows
+and paces between rows with ``asyncio.sleep``. ``async_run`` is the async counterpart of
+``cli.run``: it searches up to ``concurrency`` rows at a time and writes results in input order.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Callable
+from concurrent.futures import Executor, ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from functools import partial
+from pathlib import Path
+from typing import Any, TypeVar
+
+from . import scraper
+from .analysis import AnalysisPool
+from .config import ScraperConfig
+from .cookies import CookieStore
+from .dedup import QueryDeduper
+from .human import async_random_pause
+from .io import Shard, enumerate_csv_rows, read_csv_rows, read_input_columns
+from .metrics import METRICS
+from .preflight import Preflight
+from .retry import HostHealth, RetryLane
+from .rows import run_row_steps
+from .sinks import SinkOptions, SinkWriter, open_sink
+from .spec import SearchSpec
+from .steps import Steps, async_run_steps
+
+T = TypeVar("T")
+
+# Threads for blocking WebDriver calls; a call is short, so a few serve many sessions.
+DEFAULT_DRIVER_THREADS = 8
+
+
+@dataclass
+class AsyncSession:
+    """A ``scraper.Session`` whose blocking calls run on ``executor``."""
+
+    session: scraper.Session
+    executor: Executor
+
+    @classmethod
+    async def create(
+        cls,
+        config: ScraperConfig,
+        *,
+        profile_dir: Path,
+        executor: Executor,
+        analysis: AnalysisPool | None = None,
+        health: HostHealth | None = None,
+        preflight: Preflight | None = None,
+        cookies: CookieStore | None = None,
+    ) -> AsyncSession:
+        loop = asyncio.get_running_loop()
+        # Looked up on the module at call time, so tests can swap the driver factory.
+        session = await loop.run_in_executor(
+            executor,
+            partial(
+                scraper.Session.create,
+                config,
+                profile_dir=profile_dir,
+                analysis=analysis,
+                health=health,
+                preflight=preflight,
+                cookies=cookies,
+            ),
+        )
+        return cls(session=session, executor=executor)
+
+    async def call(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, partial(fn, *args, **kwargs))
+
+    async def run(self, steps: Steps[T]) -> T:
+        """Await ``steps``: calls on the executor, pauses and polling on the loop."""
+        return await async_run_steps(steps, self.executor)
+
+    async def run_row(self, spec: SearchSpec, row: dict[str, str], **kwargs: Any) -> bool:
+        """``rows.run_row`` on this session's browser."""
+        return await self.run(run_row_steps(self.session, spec, row, **kwargs))
+
+    async def close(self) -> None:
+        # The analysis pool, preflight client and cookie store are shared; the run closes them.
+        await self.call(self.session.quit_driver)
+
+
+async def async_run(
+    *,
+    input_file: Path,
+    output_file: Path,
+    config: ScraperConfig,
+    spec: SearchSpec,
+    delimiter: str,
+    has_header: bool,
+    columns: list[str] | None,
+    concurrency: int = 4,
+    output_format: str | None = None,
+    sink_options: SinkOptions | None = None,
+    shard: Shard | None = None,
+    dedup: bool = True,
+    driver_threads: int | None = None,
+) -> int:
+    """``cli.run`` with ``concurrency`` browser sessions driven from one event loop.
+
+    Each session gets its own profile directory below ``config.chrome_profile_root``. Their
+    blocking calls share ``driver_threads`` pool threads (default: ``concurrency``, at most
+    ``DEFAULT_DRIVER_THREADS``). Output rows are written in input order.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be >= 1")
+    if driver_threads is not None and driver_threads < 1:
+        raise ValueError("driver_threads must be >= 1")
+    threads = driver_threads or min(concurrency, DEFAULT_DRIVER_THREADS)
+    input_columns = read_input_columns(
+        input_file, delimiter=delimiter, has_header=has_header, columns=columns
+    )
+    row_columns = input_columns or columns
+    deduper = None
+    if dedup:
+        deduper = QueryDeduper.from_rows(
+            spec,
+            read_csv_rows(
+                input_file,
+                delimiter=delimiter,
+                has_header=has_header,
+                columns=row_columns,
+                shard=shard,
+            ),
+        )
+        logging.info("Dedup pre-pass => %s duplicate rows", deduper.duplicate_rows)
+    out_header = [*input_columns, "Website", "Phone", "Email"]
+    writer = SinkWriter(
+        open_sink(output_file, out_header, output_format=output_format), sink_options
+    )
+    rows: asyncio.Queue[tuple[int, int, dict[str, str]] | None] = asyncio.Queue(concurrency * 2)
+    lane = RetryLane.for_config(config)
+
+    async def produce() -> None:
+        for seq, (row_index, row) in enumerate(
+            enumerate_csv_rows(
+                input_file,
+                delimiter=delimiter,
+                has_header=has_header,
+                columns=row_columns,
+                shard=shard,
+            )
+        ):
+            await rows.put((seq, row_index, row))
+        for _ in range(concurrency):
+            await rows.put(None)
+
+    async def search(
+        session: AsyncSession, seq: int, row_index: int, row: dict[str, str], attempt: int
+    ) -> None:
+        searched = await session.run_row(
+            spec,
+            row,
+            seq=seq,
+            row_index=row_index,
+            attempt=attempt,
+            input_columns=input_columns,
+            writer=writer,
+            lane=lane,
+            dedup=deduper,
+        )
+        # A reused result did not touch the browser, so there is nothing to pace.
+        if searched:
+            await async_random_pause(1, 2)
+
+    async def work(session: AsyncSession) -> None:
+        # Deferred rows that are due go first; after the input, wait for the remaining ones.
+        input_done = False
+        while True:
+            deferred = lane.pop_ready() if lane is not None else None
+            if deferred is not None:
+                await search(
+                    session, deferred.seq, deferred.row_index, deferred.row, deferred.attempt
+                )
+            elif not input_done:
+                item = await rows.get()
+                if item is None:
+                    input_done = True
+                else:
+                    await search(session, *item, 1)
+            elif lane is not None and len(lane) > 0:
+                # A cool-down is real time (the host is down), not a humanized pause.
+                await asyncio.sleep(lane.wait_s())
+            else:
+                break
+
+    analysis = AnalysisPool(config.analysis_workers) if config.analysis_workers > 0 else None
+    # One view of host health for all sessions: a host that died for one is dead for all.
+    health = HostHealth.for_config(config)
+    preflight = Preflight.for_config(config)
+    # Consent given in one browser is seeded into all browsers started after it.
+    cookies = CookieStore.for_config(config)
+    sessions: list[AsyncSession] = []
+    with ThreadPoolExecutor(max_workers=threads, thread_name_prefix="webdriver") as pool:
+        try:
+            for index in range(concurrency):
+                profile = config.chrome_profile_root
+                if concurrency > 1:
+                    # Concurrent Chrome instances cannot share one user-data-dir.
+                    profile = profile / f"session-{index}"
+                session_config = replace(config, chrome_profile_root=profile)
+                sessions.append(
+                    await AsyncSession.create(
+                        session_config,
+                        profile_dir=profile,
+                        executor=pool,
+                        analysis=analysis,
+                        health=health,
+                        preflight=preflight,
+                        cookies=cookies,
+                    )
+                )
+            await asyncio.gather(produce(), *(work(session) for session in sessions))
+        finally:
+            await asyncio.gather(*(session.close() for session in sessions))
+            if analysis is not None:
+                analysis.close()
+            if preflight is not None:
+                preflight.close()
+            writer.close()
+
+    logging.info("All rows done => %s", output_file)
+    if deduper is not None:
+        logging.info("Dedup saved %s searches", deduper.saved)
+    logging.info("Run metrics => %s", METRICS.summary())
+    return 0
@@ -0,0 +1,131 @@
+"""Process pool for CPU-heavy page analysis (relevance checks, contact extraction).
+
+Orchestration threads hand a page over and wait on the result without holding the GIL, so
+other browser workers in the same process keep running while a worker process normalizes
+and scans a multi-MB page.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from dataclasses import replace
+from multiprocessing.shared_memory import SharedMemory
+from typing import TYPE_CHECKING, cast
+
+from .extract_selenium import parse_phone_email_snapshot
+from .metrics import METRICS
+from .relevance import PageVerdict, evaluate_chunks, iter_page_chunks
+from .snapshot import PageSnapshot
+
+if TYPE_CHECKING:
+    from .compiled import RowContext
+
+# Below this size the hand-off costs more than analyzing the page in the calling thread.
+DEFAULT_MIN_OFFLOAD_CHARS = 64 * 1024
+
+# (keywords, min hits, require address, street, zip, city tokens, address min score)
+_RelevanceArgs = tuple[
+    tuple[str, ...], int, bool, tuple[str, ...], tuple[str, ...], tuple[str, ...], int
+]
+
+
+def _buffer(block: SharedMemory) -> memoryview:
+    # Only ``None`` after ``close()``
+    return cast(memoryview, block.buf)
+
+
+def _read_shared(name: str, size: int) -> str:
+    block = SharedMemory(name=name)
+    try:
+        return bytes(_buffer(block)[:size]).decode("utf-8")
+    finally:
+        block.close()
+
+
+def _evaluate_shared(name: str, size: int, args: _RelevanceArgs) -> PageVerdict:
+    keywords, min_hits, require_address, street, zip_, city, min_score = args
+    return evaluate_chunks(
+        iter_page_chunks(_read_shared(name, size)),
+        keywords=keywords,
+        min_keyword_hits=min_hits,
+        require_address=require_address,
+        street_tokens=street,
+        zip_tokens=zip_,
+        city_tokens=city,
+        address_min_score=min_score,
+    )
+
+
+def _contacts_shared(name: str, size: int, snapshot: PageSnapshot) -> tuple[str | None, str | None]:
+    return parse_phone_email_snapshot(replace(snapshot, html=_read_shared(name, size)))
+
+
+class AnalysisPool:
+    """``workers`` processes that evaluate pages and extract contacts for the calling thread.
+
+    The page HTML is written once, UTF-8 encoded, into a shared-memory block that workers read
+    directly; only the block name and the small row inputs are pickled. Pages shorter than
+    ``min_chars`` are analyzed inline. Results equal the inline functions'.
+    """
+
+    def __init__(self, workers: int, *, min_chars: int = DEFAULT_MIN_OFFLOAD_CHARS) -> None:
+        if workers < 1:
+            raise ValueError("analysis workers must be >= 1")
+        self.min_chars = max(min_chars, 1)
+        # spawn: forking a process that already runs browser and writer threads is unsafe
+        self._pool = ProcessPoolExecutor(
+            max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+        )
+
+    def close(self) -> None:
+        self._pool.shutdown(wait=True, cancel_futures=True)
+
+    def __enter__(self) -> AnalysisPool:
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        self.close()
+
+    @contextmanager
+    def _shared(self, text: str) -> Iterator[tuple[str, int]]:
+        data = text.encode("utf-8")
+        block = SharedMemory(create=True, size=max(len(data), 1))
+        try:
+            _buffer(block)[: len(data)] = data
+            yield block.name, len(data)
+        finally:
+            block.close()
+            block.unlink()
+
+    def evaluate(self, ctx: RowContext, page_source: str) -> PageVerdict:
+        """``ctx.evaluate_chunks`` over the whole page, in a worker for large pages."""
+        if len(page_source) < self.min_chars:
+            return ctx.evaluate_chunks(iter_page_chunks(page_source))
+        relevance = ctx.compiled.spec.relevance
+        args: _RelevanceArgs = (
+            ctx.keywords,
+            relevance.min_total_keyword_hits,
+            relevance.require_address,
+            ctx.street_tokens,
+            ctx.zip_tokens,
+            ctx.city_tokens,
+            relevance.address.min_score,
+        )
+        with self._shared(page_source) as (name, size):
+            verdict = self._pool.submit(_evaluate_shared, name, size, args).result()
+        METRICS.incr("relevance_chars_examined", verdict.chars_examined)
+        METRICS.incr("analysis_offloaded")
+        return verdict
+
+    def contacts(self, snapshot: PageSnapshot) -> tuple[str | None, str | None]:
+        """``parse_phone_email_snapshot``, in a worker for large pages."""
+        if len(snapshot.html) < self.min_chars:
+            return parse_phone_email_snapshot(snapshot)
+        with self._shared(snapshot.html) as (name, size):
+            future = self._pool.submit(_contacts_shared, name, size, replace(snapshot, html=""))
+            found = future.result()
+        METRICS.incr("analysis_offloaded")
+        return found
@@ -0,0 +1,307 @@
+"""Record page snapshots of a live run and replay the search pipeline from them offline.
+
+``--record DIR`` wraps the browser in a :class:`RecordingDriver`: every snapshot the scraper
+captures (SERPs, candidate pages, subpages) is appended to ``DIR/archive.sqlite`` with the
+requested URL, the final URL, the capture time and the compressed page. ``--replay DIR``
+replaces the browser with a :class:`ReplayDriver` that serves those pages, so a run with
+changed relevance or extraction settings needs no browser and no network.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+from urllib.parse import parse_qs, urlparse
+
+from selenium.common.exceptions import WebDriverException
+
+from .emulation import FakeDriver, SimLink, SimPage
+from .metrics import METRICS
+from .snapshot import SNAPSHOT_SCRIPT, PageSnapshot, SnapshotLink, parse_snapshot
+from .tabs import OPEN_TAB_SCRIPT
+
+ARCHIVE_FILE = "archive.sqlite"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS snapshots (
+    id INTEGER PRIMARY KEY,
+    kind TEXT NOT NULL,
+    request_url TEXT,
+    final_url TEXT NOT NULL,
+    query TEXT,
+    captured_at REAL NOT NULL,
+    body BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS snapshots_request ON snapshots (request_url);
+CREATE INDEX IF NOT EXISTS snapshots_final ON snapshots (final_url);
+CREATE INDEX IF NOT EXISTS snapshots_query ON snapshots (query);
+"""
+
+
+def _normalize_query(query: str) -> str:
+    return " ".join(query.split())
+
+
+def serp_query(url: str, *, google_domain: str) -> str | None:
+    """The search query of a Google results URL, or ``None`` for any other URL."""
+    parsed = urlparse(url)
+    if parsed.netloc.lower() != f"www.{google_domain}" or parsed.path != "/search":
+        return None
+    return _normalize_query(parse_qs(parsed.query).get("q", [""])[0])
+
+
+@dataclass(frozen=True)
+class ArchiveEntry:
+    kind: str  # "serp" | "page" | "error"
+    request_url: str | None
+    final_url: str
+    query: str | None
+    captured_at: float
+    snapshot: PageSnapshot
+    # Load failure message for "error" entries
+    error: str | None = None
+
+
+def _encode(snapshot: PageSnapshot, *, error: str | None = None) -> bytes:
+    payload: dict[str, Any] = {
+        "html": snapshot.html,
+        "links": [[link.href, link.text, link.raw_href] for link in snapshot.links],
+        "metas": list(snapshot.metas),
+        "hidden": list(snapshot.hidden_inputs),
+    }
+    if error is not None:
+        payload["error"] = error
+    return zlib.compress(json.dumps(payload, ensure_ascii=False).encode("utf-8"), 6)
+
+
+def _decode(final_url: str, body: bytes) -> tuple[PageSnapshot, str | None]:
+    payload = json.loads(zlib.decompress(body).decode("utf-8"))
+    return parse_snapshot({**payload, "url": final_url}), payload.get("error")
+
+
+class WebArchive:
+    """Append-only snapshot store in ``DIR/archive.sqlite``; the newest capture of a URL wins.
+
+    Several processes may record into the same directory (SQLite serializes the inserts).
+    """
+
+    def __init__(self, directory: Path, *, busy_timeout_s: float = 30.0) -> None:
+        directory.mkdir(parents=True, exist_ok=True)
+        self.path = directory / ARCHIVE_FILE
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            self.path, timeout=busy_timeout_s, isolation_level=None, check_same_thread=False
+        )
+        self._conn.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return int(self._conn.execute("SELECT COUNT(*) FROM snapshots").fetchone()[0])
+
+    def record(
+        self,
+        snapshot: PageSnapshot,
+        *,
+        request_url: str | None,
+        google_domain: str,
+        captured_at: float | None = None,
+    ) -> None:
+        query = serp_query(snapshot.url, google_domain=google_domain)
+        if query is None:
+            self._insert("page", request_url, snapshot.url, None, captured_at, _encode(snapshot))
+        else:
+            self._insert("serp", None, snapshot.url, query, captured_at, _encode(snapshot))
+
+    def record_error(self, url: str, message: str, *, captured_at: float | None = None) -> None:
+        """Remember that loading ``url`` failed, so a replay fails the same way."""
+        body = _encode(PageSnapshot(url=url, html=""), error=message)
+        self._insert("error", url, url, None, captured_at, body)
+
+    def _insert(
+        self,
+        kind: str,
+        request_url: str | None,
+        final_url: str,
+        query: str | None,
+        captured_at: float | None,
+        body: bytes,
+    ) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO snapshots (kind, request_url, final_url, query, captured_at, body) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    kind,
+                    request_url,
+                    final_url,
+                    query,
+                    time.time() if captured_at is None else captured_at,
+                    body,
+                ),
+            )
+
+    def _latest(self, where: str, params: tuple[str, ...]) -> ArchiveEntry | None:
+        with self._lock:
+            found = self._conn.execute(
+                "SELECT kind, request_url, final_url, query, captured_at, body FROM snapshots "
+                f"WHERE {where} ORDER BY id DESC LIMIT 1",
+                params,
+            ).fetchone()
+        if found is None:
+            return None
+        kind, request_url, final_url, query, captured_at, body = found
+        snapshot, error = _decode(final_url, body)
+        return ArchiveEntry(
+            kind=kind,
+            request_url=request_url,
+            final_url=final_url,
+            query=query,
+            captured_at=captured_at,
+            snapshot=snapshot,
+            error=error,
+        )
+
+    def page(self, url: str) -> ArchiveEntry | None:
+        """Newest page (or load failure) recorded for ``url``; pages also match a final URL."""
+        found = self._latest("kind IN ('page', 'error') AND request_url = ?", (url,))
+        return found or self._latest("kind = 'page' AND final_url = ?", (url,))
+
+    def serp(self, query: str) -> ArchiveEntry | None:
+        return self._latest("kind = 'serp' AND query = ?", (_normalize_query(query),))
+
+
+class RecordingDriver:
+    """Delegating driver that appends every captured page snapshot to a :class:`WebArchive`.
+
+    Remembers the URL each window was asked to load (``get`` or a tab opened by
+    ``OPEN_TAB_SCRIPT``), so replays can look pages up by the URL the scraper requests.
+    """
+
+    def __init__(self, driver: Any, archive: WebArchive, *, google_domain: str) -> None:
+        self._driver = driver
+        self.archive = archive
+        self.google_domain = google_domain
+        self._requested: dict[str, str | None] = {}
+
+    def get(self, url: str) -> None:
+        self._requested[self._driver.current_window_handle] = None
+        try:
+            self._driver.get(url)
+        except WebDriverException as exc:
+            self.archive.record_error(url, exc.msg or type(exc).__name__)
+            raise
+        self._requested[self._driver.current_window_handle] = url
+
+    def back(self) -> None:
+        # The previous page's request URL is unknown here; it is keyed by its final URL.
+        self._requested[self._driver.current_window_handle] = None
+        self._driver.back()
+
+    def execute_script(self, script: str, *args: Any) -> Any:
+        if script == OPEN_TAB_SCRIPT:
+            before = set(self._driver.window_handles)
+            result = self._driver.execute_script(script, *args)
+            for handle in self._driver.window_handles:
+                if handle not in before:
+                    self._requested[handle] = args[0]
+            return result
+        result = self._driver.execute_script(script, *args)
+        if script == SNAPSHOT_SCRIPT and isinstance(result, dict):
+            self.archive.record(
+                parse_snapshot(result),
+                request_url=self._requested.get(self._driver.current_window_handle),
+                google_domain=self.google_domain,
+            )
+        return result
+
+    def quit(self) -> None:
+        try:
+            self._driver.quit()
+        finally:
+            self.archive.close()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._driver, name)
+
+
+def _sim_link(link: SnapshotLink) -> SimLink:
+    return SimLink(link.href, link.text, raw_href=link.raw_href)
+
+
+class ArchiveWeb:
+    """Page server for :class:`FakeDriver` backed by a :class:`WebArchive`.
+
+    Recorded load failures fail again. URLs the recorded run never captured (e.g. candidates
+    after the winning one, reached in a different order) load as blank pages, so they are
+    simply not relevant; unknown queries get an empty result page. Both count as
+    ``replay_misses``. The Google home page is synthesized with a consent button, so consent
+    handling returns at once instead of waiting for every selector.
+    """
+
+    consent = "every_visit"
+
+    def __init__(self, archive: WebArchive, *, google_domain: str) -> None:
+        self.archive = archive
+        self.google_domain = google_domain
+
+    def resolve(self, url: str) -> SimPage | None:
+        parsed = urlparse(url)
+        if parsed.netloc.lower() == f"www.{self.google_domain}":
+            query = serp_query(url, google_domain=self.google_domain)
+            if query is not None:
+                return self.search(query)
+            return SimPage(url=url, title="Google", text="", kind="home", consent_banner=True)
+        entry = self.archive.page(url)
+        if entry is None:
+            METRICS.incr("replay_misses")
+            logging.info("Replay: not archived => %s", url)
+            return SimPage(url=url, title="", text="")
+        if entry.error is not None:
+            raise WebDriverException(entry.error)
+        return self._page(entry, kind="site")
+
+    def search(self, query: str) -> SimPage:
+        entry = self.archive.serp(query)
+        if entry is None:
+            METRICS.incr("replay_misses")
+            logging.info("Replay: no archived results for a query")
+            return SimPage(
+                url=f"https://www.{self.google_domain}/search", title="", text="", kind="serp"
+            )
+        return self._page(entry, kind="serp")
+
+    @staticmethod
+    def _page(entry: ArchiveEntry, *, kind: str) -> SimPage:
+        snapshot = entry.snapshot
+        return SimPage(
+            url=snapshot.url,
+            title="",
+            text="",
+            links=[_sim_link(link) for link in snapshot.links],
+            metas=list(snapshot.metas),
+            hidden_inputs=list(snapshot.hidden_inputs),
+            kind=kind,
+            source=snapshot.html,
+        )
+
+
+class ReplayDriver(FakeDriver):
+    """In-memory driver that serves an archive recorded with :class:`RecordingDriver`."""
+
+    def __init__(self, archive: WebArchive, *, google_domain: str) -> None:
+        super().__init__(ArchiveWeb(archive, google_domain=google_domain))
+        self.archive = archive
+
+    def quit(self) -> None:
+        super().quit()
+        self.archive.close()
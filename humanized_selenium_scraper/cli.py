@@ -1,31 +1,40 @@
 from __future__ import annotations
 
 import argparse
-import csv
+import asyncio
 import logging
-import threading
+import os
+import socket
+import sys
+import time
+from contextlib import AbstractContextManager, nullcontext
 from dataclasses import replace
 from pathlib import Path
 
-from .config import ScraperConfig
-from .exceptions import SkipEntryError
-from .human import random_pause
-from .io import parse_columns_arg, read_csv_rows
-from .logging_utils import redact_query
+from .aio import async_run
+from .config import DRIVER_BACKENDS, RETRY_MODES, TYPING_MODES, ScraperConfig
+from .dedup import QueryDeduper
+from .exceptions import RetryLaterError, SkipEntryError
+from .human import random_pause, scaled_pauses
+from .io import (
+    SHARD_MODES,
+    Shard,
+    enumerate_csv_rows,
+    parse_columns_arg,
+    parse_shard_arg,
+    read_csv_rows,
+    read_input_columns,
+)
+from .logging_utils import setup_logging
+from .merge import merge_main
+from .metrics import METRICS
+from .retry import RetryLane
+from .rows import run_row, search_row
 from .scraper import Session
-from .spec import SearchSpec, render_template
-
-write_lock = threading.Lock()
-
-
-def _write_row(path: Path, *, header: list[str], row: list[str], write_header: bool) -> None:
-    mode = "w" if write_header else "a"
-    with write_lock:
-        with path.open(mode, encoding="utf-8", newline="") as handle:
-            writer = csv.writer(handle)
-            if write_header:
-                writer.writerow(header)
-            writer.writerow(row)
+from .sinks import OUTPUT_FORMATS, SinkOptions, SinkWriter, infer_output_format, open_sink
+from .spec import SERP_MODES, SearchSpec
+from .tune import tune_main
+from .workqueue import LeaseKeeper, WorkQueue
 
 
 def run(
@@ -37,61 +46,172 @@ def run(
     delimiter: str,
     has_header: bool,
     columns: list[str] | None,
+    output_format: str | None = None,
+    sink_options: SinkOptions | None = None,
+    shard: Shard | None = None,
+    dedup: bool = True,
 ) -> int:
-    wrote_header = False
-    input_columns = columns or []
-    if has_header:
-        with input_file.open("r", encoding="utf-8", newline="") as handle:
-            reader = csv.reader(handle, delimiter=delimiter)
-            header = next(reader, None)
-            if not header:
-                raise ValueError("Input CSV is empty.")
-            raw_columns = [h.strip() for h in header if h.strip()]
-            if not raw_columns:
-                raise ValueError("Header row is empty (no column names).")
-            input_columns = list(dict.fromkeys(raw_columns))
-
+    input_columns = read_input_columns(
+        input_file, delimiter=delimiter, has_header=has_header, columns=columns
+    )
+    deduper = None
+    if dedup:
+        deduper = QueryDeduper.from_rows(
+            spec,
+            read_csv_rows(
+                input_file,
+                delimiter=delimiter,
+                has_header=has_header,
+                columns=input_columns or columns,
+                shard=shard,
+            ),
+        )
+        logging.info("Dedup pre-pass => %s duplicate rows", deduper.duplicate_rows)
     out_header = [*input_columns, "Website", "Phone", "Email"]
+    writer = SinkWriter(
+        open_sink(output_file, out_header, output_format=output_format), sink_options
+    )
+    lane = RetryLane.for_config(config)
     session = None
+
+    def search(seq: int, row_index: int, row: dict[str, str], attempt: int) -> None:
+        assert session is not None
+        searched = run_row(
+            session,
+            spec,
+            row,
+            seq=seq,
+            row_index=row_index,
+            attempt=attempt,
+            input_columns=input_columns,
+            writer=writer,
+            lane=lane,
+            dedup=deduper,
+        )
+        # A reused result did not touch the browser, so there is nothing to pace.
+        if searched:
+            random_pause(1, 2)
+
     try:
         session = Session.create(config, profile_dir=config.chrome_profile_root)
-        for row in read_csv_rows(
-            input_file, delimiter=delimiter, has_header=has_header, columns=input_columns or columns
+        for seq, (row_index, row) in enumerate(
+            enumerate_csv_rows(
+                input_file,
+                delimiter=delimiter,
+                has_header=has_header,
+                columns=input_columns or columns,
+                shard=shard,
+            )
         ):
+            # Deferred rows that are due go first, so they are retried during the run.
+            while lane is not None and (deferred := lane.pop_ready()) is not None:
+                search(deferred.seq, deferred.row_index, deferred.row, deferred.attempt)
+            search(seq, row_index, row, 1)
+        while lane is not None and len(lane) > 0:
+            # A cool-down is real time (the host is down), not a humanized pause.
+            time.sleep(lane.wait_s())
+            if (deferred := lane.pop_ready()) is not None:
+                search(deferred.seq, deferred.row_index, deferred.row, deferred.attempt)
+    finally:
+        if session is not None:
+            session.close()
+        writer.close()
+
+    logging.info("All rows done => %s", output_file)
+    if deduper is not None:
+        logging.info("Dedup saved %s searches", deduper.saved)
+    logging.info("Run metrics => %s", METRICS.summary())
+    return 0
+
+
+def run_queue_worker(
+    *,
+    queue: WorkQueue,
+    config: ScraperConfig,
+    spec: SearchSpec,
+    worker_id: str,
+    lease_s: float,
+    poll_s: float = 5.0,
+) -> int:
+    """Claim and process queued rows until none are pending or leased; returns rows done."""
+    input_columns = queue.columns() or []
+    session = None
+    done = 0
+    try:
+        while True:
+            job = queue.claim(worker_id, lease_s=lease_s)
+            if job is None:
+                if queue.is_drained():
+                    break
+                # Other workers hold leases; wait for them to finish or expire.
+                expiry = queue.next_lease_expiry()
+                wait_s = poll_s if expiry is None else min(poll_s, max(expiry - time.time(), 0.1))
+                time.sleep(wait_s)
+                continue
+
+            if session is None:
+                session = Session.create(config, profile_dir=config.chrome_profile_root)
+            found: tuple[str | None, str | None, str | None] | None = None
+            error: Exception | None = None
             try:
-                query = render_template(spec.query_template, row).strip()
-                if not query:
-                    raise ValueError("Rendered query is empty.")
-                logging.info("Processing query => %s", redact_query(query))
-
-                found_url, phone, email = session.search(query=query, row=row, spec=spec)
-                row_out = [
-                    *(row.get(col, "") for col in input_columns),
-                    found_url or "",
-                    phone or "",
-                    email or "",
-                ]
+                with LeaseKeeper(queue, job, worker_id, lease_s=lease_s):
+                    found = search_row(session, spec, job.row, attempt=job.attempts)
+            except RetryLaterError as exc:
+                # The queue is the retry lane: release the row for a later attempt.
+                error = exc
             except SkipEntryError as exc:
+                # Same output as ``rows.process_row``: a skipped row is final, with empty results.
                 logging.warning("SKIP => %s", exc)
-                row_out = [*(row.get(col, "") for col in input_columns), "", "", ""]
+                found = (None, None, None)
             except Exception as exc:
-                logging.warning("process_row failed: %s", exc)
-                row_out = [*(row.get(col, "") for col in input_columns), "", "", ""]
-
-            _write_row(
-                output_file,
-                header=out_header,
-                row=row_out,
-                write_header=not wrote_header,
-            )
-            wrote_header = True
+                error = exc
+            if error is not None:
+                status = queue.fail(job.row_index, worker_id, str(error))
+                logging.warning(
+                    "Queue row %s failed (attempt %s) => %s: %s",
+                    job.row_index,
+                    job.attempts,
+                    status,
+                    error,
+                )
+                METRICS.incr("queue_failures")
+            if found is not None:
+                found_url, phone, email = found
+                inputs = [job.row.get(col, "") for col in input_columns]
+                values = [*inputs, found_url or "", phone or "", email or ""]
+                if queue.complete(job.row_index, worker_id, values):
+                    done += 1
+                else:
+                    logging.warning("Queue row %s lease lost, result dropped", job.row_index)
+            METRICS.incr("rows")
             random_pause(1, 2)
     finally:
         if session is not None:
             session.close()
+    return done
 
-    logging.info("All rows done => %s", output_file)
-    return 0
+
+def export_queue_results(
+    queue: WorkQueue, output_file: Path, *, output_format: str | None = None
+) -> int:
+    """Write all queue results in input order (failed rows get empty result columns).
+
+    Writes to a temporary file first, so several workers may export concurrently.
+    """
+    input_columns = queue.columns() or []
+    header = [*input_columns, "Website", "Phone", "Email"]
+    fmt = output_format or infer_output_format(output_file)
+    tmp_file = output_file.with_name(f".{output_file.name}.{os.getpid()}.tmp")
+    exported = 0
+    with SinkWriter(open_sink(tmp_file, header, output_format=fmt)) as writer:
+        for row_index, row, values in queue.results():
+            if values is None:
+                values = [*(row.get(col, "") for col in input_columns), "", "", ""]
+            writer.submit(row_index, values)
+            exported += 1
+    if tmp_file.exists():
+        os.replace(tmp_file, output_file)
+    return exported
 
 
 def build_parser() -> argparse.ArgumentParser:
@@ -99,7 +219,40 @@ def build_parser() -> argparse.ArgumentParser:
         description="Humanized Selenium scraper (configurable, offline-testable core)."
     )
     parser.add_argument("--input", default="input.csv", help="Input CSV path.")
-    parser.add_argument("--output", default="output.csv", help="Output CSV path.")
+    parser.add_argument("--output", default="output.csv", help="Output path.")
+    parser.add_argument(
+        "--output-format",
+        choices=OUTPUT_FORMATS,
+        help="Output format (default: from --output suffix, else csv).",
+    )
+    parser.add_argument(
+        "--flush-every", type=int, default=100, help="Write output in batches of N rows."
+    )
+    parser.add_argument(
+        "--flush-interval",
+        type=float,
+        default=1.0,
+        help="Flush a partial output batch after this many seconds.",
+    )
+    parser.add_argument("--fsync", action="store_true", help="fsync the output on every flush.")
+    parser.add_argument(
+        "--shard",
+        help="Process only shard i of N (e.g. 2/4); combine outputs with the merge subcommand.",
+    )
+    parser.add_argument(
+        "--shard-mode",
+        choices=SHARD_MODES,
+        default="hash",
+        help=(
+            "hash: by row content (stable across runs); range: contiguous row blocks "
+            "(one extra pass to count rows). Either way each shard reads the whole input."
+        ),
+    )
+    parser.add_argument(
+        "--no-dedup",
+        action="store_true",
+        help="Search every row, even when its query and relevance inputs repeat an earlier row.",
+    )
     parser.add_argument("--google-domain", help="e.g. google.com or google.de")
     parser.add_argument("--delimiter", default=",", help="CSV delimiter (default: ',').")
     parser.add_argument(
@@ -183,21 +336,121 @@ def build_parser() -> argparse.ArgumentParser:
         "--max-links-per-page", type=int, help="How many <a> links to scan on a page."
     )
     parser.add_argument("--subpage-depth", type=int, help="Subpage BFS depth (0 disables).")
+    parser.add_argument(
+        "--tab-pipeline",
+        type=int,
+        metavar="K",
+        help="Load up to K SERP candidates in parallel background tabs (default: sequential).",
+    )
+    parser.add_argument(
+        "--serp-mode",
+        choices=SERP_MODES,
+        help=(
+            "homepage: type the query on Google's homepage (default). direct: load the results "
+            "URL in one navigation (faster, less human-like)."
+        ),
+    )
+    parser.add_argument(
+        "--incremental-relevance",
+        action="store_true",
+        help="Check relevance after load and each scroll step; stop scrolling once it passes.",
+    )
+    parser.add_argument(
+        "--driver-backend",
+        choices=DRIVER_BACKENDS,
+        help="local Chrome (default), one remote WebDriver, or a grid of endpoints.",
+    )
+    parser.add_argument(
+        "--webdriver-url",
+        action="append",
+        default=[],
+        help="Remote WebDriver URL, e.g. http://node1:4444 (repeatable; several imply grid).",
+    )
+    parser.add_argument(
+        "--sessions",
+        type=int,
+        metavar="N",
+        help="Search N rows concurrently with N browsers driven from one asyncio event loop.",
+    )
+    parser.add_argument(
+        "--driver-threads",
+        type=int,
+        metavar="N",
+        help="Threads for the blocking WebDriver calls of --sessions (default: min(sessions, 8)).",
+    )
+    parser.add_argument(
+        "--analysis-workers",
+        type=int,
+        metavar="N",
+        help="Run relevance checks and contact extraction of large pages in N processes.",
+    )
+    parser.add_argument(
+        "--dead-host-cache",
+        metavar="PATH",
+        help="Remember hosts that failed hard (DNS, TLS) in this JSON file and skip them.",
+    )
+    parser.add_argument(
+        "--cookie-store",
+        metavar="PATH",
+        help=(
+            "Share consent cookies through this JSON file: browsers started later (restarts, "
+            "other sessions and workers) get them before their first page load."
+        ),
+    )
+    parser.add_argument(
+        "--preflight",
+        action="store_true",
+        help=(
+            "Check SERP candidates with an HTTP HEAD request first; skip dead links, "
+            "unreachable hosts and non-HTML targets without a browser load."
+        ),
+    )
+    parser.add_argument(
+        "--preflight-timeout",
+        type=int,
+        metavar="S",
+        help="Connect/read timeout of the preflight request in seconds (default: 5).",
+    )
+    parser.add_argument(
+        "--retry-mode",
+        choices=RETRY_MODES,
+        help=(
+            "inline: retry a failed page load in place (default). deferred: move the row to a "
+            "retry lane and search it again later in the run. Output stays in input order, so "
+            "rows after a deferred row are held in memory until it is done; a crash loses them."
+        ),
+    )
+    parser.add_argument(
+        "--retry-cooldown",
+        type=int,
+        metavar="S",
+        help="Deferred retries: seconds before a row or host is tried again (default: 30).",
+    )
+    parser.add_argument(
+        "--typing",
+        choices=TYPING_MODES,
+        help=(
+            "Keystroke timing of the search query, typed in the browser in one call: human "
+            "(50-300 ms per key, default), fast (10-40 ms) or instant."
+        ),
+    )
+    archive = parser.add_mutually_exclusive_group()
+    archive.add_argument(
+        "--record",
+        metavar="DIR",
+        help="Append every captured SERP and page snapshot to an archive in DIR.",
+    )
+    archive.add_argument(
+        "--replay",
+        metavar="DIR",
+        help="Serve pages from an archive recorded with --record (no browser, no pauses).",
+    )
     parser.add_argument("--no-phone", action="store_true", help="Do not extract phone numbers.")
     parser.add_argument("--no-email", action="store_true", help="Do not extract emails.")
     return parser
 
 
-def main(argv: list[str] | None = None) -> int:
-    logging.basicConfig(
-        filename="scraper.log",
-        level=logging.INFO,
-        format="%(asctime)s - %(levelname)s - %(message)s",
-    )
-
-    parser = build_parser()
-    args = parser.parse_args(argv)
-
+def spec_and_config_from_args(args: argparse.Namespace) -> tuple[SearchSpec, ScraperConfig]:
     spec = SearchSpec.presets()[args.preset]
     config = ScraperConfig(google_domain=args.google_domain or "google.com")
 
@@ -207,6 +460,31 @@ def main(argv: list[str] | None = None) -> int:
             config_from_spec, google_domain=args.google_domain or config_from_spec.google_domain
         )
 
+    if args.webdriver_url or args.driver_backend:
+        urls = tuple(args.webdriver_url) or config.webdriver_urls
+        backend = args.driver_backend or ("grid" if len(urls) > 1 else "remote")
+        config = replace(config, driver_backend=backend, webdriver_urls=urls)
+    if args.analysis_workers is not None:
+        config = replace(config, analysis_workers=args.analysis_workers)
+    if args.preflight:
+        config = replace(config, preflight=True)
+    if args.preflight_timeout is not None:
+        config = replace(config, preflight_timeout_s=args.preflight_timeout)
+    if args.retry_mode:
+        config = replace(config, retry_mode=args.retry_mode)
+    if args.retry_cooldown is not None:
+        config = replace(config, retry_cooldown_s=args.retry_cooldown)
+    if args.dead_host_cache:
+        config = replace(config, dead_host_file=Path(args.dead_host_cache))
+    if args.typing:
+        config = replace(config, typing_profile=args.typing)
+    if args.cookie_store:
+        config = replace(config, cookie_store_file=Path(args.cookie_store))
+    if args.record:
+        config = replace(config, record_dir=Path(args.record))
+    if args.replay:
+        config = replace(config, replay_dir=Path(args.replay))
+
     if args.query_template:
         spec = replace(spec, query_template=args.query_template)
 
@@ -279,13 +557,112 @@ def main(argv: list[str] | None = None) -> int:
         )
         spec = replace(spec, navigation=nav)
 
+    if args.tab_pipeline is not None:
+        spec = replace(spec, navigation=replace(spec.navigation, tab_pipeline=args.tab_pipeline))
+    if args.serp_mode:
+        spec = replace(spec, navigation=replace(spec.navigation, serp_mode=args.serp_mode))
+    if args.incremental_relevance:
+        spec = replace(spec, navigation=replace(spec.navigation, incremental_relevance=True))
+
     if args.no_phone:
         spec = replace(spec, extract_phone=False)
     if args.no_email:
         spec = replace(spec, extract_email=False)
 
+    return spec, config
+
+
+def _pacing(config: ScraperConfig) -> AbstractContextManager[None]:
+    """Replays need no humanized pauses: nothing is sent to a real site."""
+    return scaled_pauses(0) if config.replay_dir is not None else nullcontext()
+
+
+def queue_main(argv: list[str]) -> int:
+    setup_logging()
+    parser = build_parser()
+    parser.prog = "humanized_selenium_scraper queue"
+    parser.description = (
+        "Work-queue mode: load the input into an SQLite job table (once) and process rows "
+        "with leases. Start any number of workers against the same --queue-db."
+    )
+    parser.add_argument("--queue-db", default="queue.sqlite", help="SQLite job table path.")
+    parser.add_argument(
+        "--worker-id",
+        default=f"{socket.gethostname()}-{os.getpid()}",
+        help="Unique worker name (default: host-pid).",
+    )
+    parser.add_argument(
+        "--lease-seconds", type=float, default=600.0, help="Lease length per claimed row."
+    )
+    parser.add_argument(
+        "--max-attempts", type=int, default=3, help="Claims per row before it is marked failed."
+    )
+    parser.add_argument(
+        "--no-export",
+        action="store_true",
+        help="Do not write --output when the queue is drained.",
+    )
+    args = parser.parse_args(argv)
+    spec, config = spec_and_config_from_args(args)
+    if config.cookie_store_file is None:
+        # One consent for all workers on this host, next to their profile directories.
+        config = replace(config, cookie_store_file=config.chrome_profile_root / "cookies.json")
+    # Concurrent Chrome instances cannot share one user-data-dir.
+    safe_id = "".join(ch if ch.isalnum() or ch in "-_" else "_" for ch in args.worker_id)
+    config = replace(config, chrome_profile_root=config.chrome_profile_root / safe_id)
+
+    queue = WorkQueue(Path(args.queue_db), max_attempts=args.max_attempts)
+    try:
+        if not any(queue.counts().values()):
+            columns = parse_columns_arg(args.columns) if not args.header else None
+            input_file = Path(args.input)
+            input_columns = read_input_columns(
+                input_file, delimiter=args.delimiter, has_header=args.header, columns=columns
+            )
+            rows = enumerate_csv_rows(
+                input_file,
+                delimiter=args.delimiter,
+                has_header=args.header,
+                columns=input_columns or columns,
+                shard=parse_shard_arg(args.shard, mode=args.shard_mode) if args.shard else None,
+            )
+            loaded = queue.load(rows, columns=input_columns)
+            logging.info("Queue loaded %s rows => %s", loaded, args.queue_db)
+
+        with _pacing(config):
+            done = run_queue_worker(
+                queue=queue,
+                config=config,
+                spec=spec,
+                worker_id=args.worker_id,
+                lease_s=args.lease_seconds,
+            )
+        logging.info("Worker %s done: %s rows, queue=%s", args.worker_id, done, queue.counts())
+        if not args.no_export and queue.is_drained():
+            exported = export_queue_results(
+                queue, Path(args.output), output_format=args.output_format
+            )
+            logging.info("Queue exported %s rows => %s", exported, args.output)
+    finally:
+        queue.close()
+    return 0
+
+
+SUBCOMMANDS = {"merge": merge_main, "queue": queue_main, "tune": tune_main}
+
+
+def main(argv: list[str] | None = None) -> int:
+    args_list = sys.argv[1:] if argv is None else argv
+    if args_list and args_list[0] in SUBCOMMANDS:
+        return SUBCOMMANDS[args_list[0]](args_list[1:])
+
+    setup_logging()
+    parser = build_parser()
+    args = parser.parse_args(args_list)
+
+    spec, config = spec_and_config_from_args(args)
     columns = parse_columns_arg(args.columns) if not args.header else None
-    return run(
+    options = dict(
         input_file=Path(args.input),
         output_file=Path(args.output),
         config=config,
@@ -293,4 +670,16 @@ def main(argv: list[str] | None = None) -> int:
         delimiter=args.delimiter,
         has_header=args.header,
         columns=columns,
+        output_format=args.output_format,
+        sink_options=SinkOptions(
+            batch_size=args.flush_every, flush_interval_s=args.flush_interval, fsync=args.fsync
+        ),
+        shard=parse_shard_arg(args.shard, mode=args.shard_mode) if args.shard else None,
+        dedup=not args.no_dedup,
     )
+    with _pacing(config):
+        if args.sessions is not None:
+            return asyncio.run(
+                async_run(concurrency=args.sessions, driver_threads=args.driver_threads, **options)
+            )
+        return run(**options)
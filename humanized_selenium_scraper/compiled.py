@@ -0,0 +1,138 @@
+"""Search spec prepared once per run, row inputs prepared once per row.
+
+``Session.search`` evaluates every SERP link and subpage against the same row. A
+``RowContext`` holds everything derived from the row (rendered keywords, address tokens,
+query parts), so the per-link work is a host check and one pass over the page.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from functools import lru_cache
+from string import Formatter
+from typing import TYPE_CHECKING
+
+from .metrics import METRICS
+from .relevance import (
+    PageEvaluator,
+    PageVerdict,
+    evaluate_chunks,
+    iter_page_chunks,
+    tokenize_address_component,
+)
+from .spec import SearchSpec, render_template
+from .url_filter import UrlFilter, load_public_suffix_list, query_parts
+
+if TYPE_CHECKING:
+    from .analysis import AnalysisPool
+
+
+def _has_placeholders(template: str) -> bool:
+    return any(field is not None for _text, field, _spec, _conv in Formatter().parse(template))
+
+
+@dataclass(frozen=True)
+class CompiledSpec:
+    spec: SearchSpec
+    # Keywords without placeholders, rendered and lowercased once per run
+    static_keywords: tuple[str, ...]
+    row_keyword_templates: tuple[str, ...]
+    url_filter: UrlFilter
+
+    @classmethod
+    def compile(cls, spec: SearchSpec) -> CompiledSpec:
+        url_spec = spec.url_filter
+        templates = spec.relevance.keyword_templates
+        static = (render_template(t, {}).lower() for t in templates if not _has_placeholders(t))
+        return cls(
+            spec=spec,
+            static_keywords=tuple(k for k in static if k),
+            row_keyword_templates=tuple(t for t in templates if _has_placeholders(t)),
+            url_filter=UrlFilter(
+                allowed_tlds=url_spec.allowed_tlds,
+                domain_keyword_blacklist=url_spec.domain_keyword_blacklist,
+                domain_match=url_spec.domain_match,
+                min_query_part_len=url_spec.min_query_part_len,
+                public_suffixes=load_public_suffix_list() if url_spec.public_suffixes else None,
+            ),
+        )
+
+    def row_context(self, row: dict[str, str], *, query: str) -> RowContext:
+        rendered = (render_template(t, row).lower() for t in self.row_keyword_templates)
+        address = self.spec.relevance.address
+        return RowContext(
+            compiled=self,
+            query=query,
+            keywords=(*self.static_keywords, *(k for k in rendered if k)),
+            street_tokens=tuple(tokenize_address_component(row.get(address.street_field, ""))),
+            zip_tokens=tuple(tokenize_address_component(row.get(address.zip_field, ""))),
+            city_tokens=tuple(tokenize_address_component(row.get(address.city_field, ""))),
+            query_parts=query_parts(query, min_len=self.spec.url_filter.min_query_part_len),
+        )
+
+
+@dataclass(frozen=True)
+class RowContext:
+    compiled: CompiledSpec
+    query: str
+    keywords: tuple[str, ...]
+    street_tokens: tuple[str, ...]
+    zip_tokens: tuple[str, ...]
+    city_tokens: tuple[str, ...]
+    query_parts: tuple[str, ...]
+    # Evaluate large pages in this process pool instead of the calling thread
+    analysis: AnalysisPool | None = field(default=None, compare=False, repr=False)
+
+    def is_relevant_url(self, url: str) -> bool:
+        """Same decision as ``url_filter.is_relevant_url`` for this row's query."""
+        return self.compiled.url_filter.rejection_reason(url, parts=self.query_parts) is None
+
+    def evaluate_page(self, page_source: str) -> bool:
+        """Same decision as ``relevance.evaluate_page`` with this row's spec and inputs."""
+        if self.analysis is not None:
+            return self.analysis.evaluate(self, page_source).relevant
+        return self.evaluate_chunks(iter_page_chunks(page_source)).relevant
+
+    def evaluate_chunks(
+        self, chunks: Iterable[str], *, evaluator: PageEvaluator | None = None
+    ) -> PageVerdict:
+        """Streaming ``evaluate_page``; records examined vs. total page size in metrics.
+
+        With ``evaluator``, ``chunks`` add to the text it has already seen.
+        """
+        if evaluator is not None:
+            verdict = evaluator.feed(chunks)
+        else:
+            relevance = self.compiled.spec.relevance
+            verdict = evaluate_chunks(
+                chunks,
+                keywords=self.keywords,
+                min_keyword_hits=relevance.min_total_keyword_hits,
+                require_address=relevance.require_address,
+                street_tokens=self.street_tokens,
+                zip_tokens=self.zip_tokens,
+                city_tokens=self.city_tokens,
+                address_min_score=relevance.address.min_score,
+            )
+        METRICS.incr("relevance_chars_examined", verdict.chars_examined)
+        return verdict
+
+    def page_evaluator(self) -> PageEvaluator:
+        """A ``PageEvaluator`` for this row, for pages that grow while they are evaluated."""
+        relevance = self.compiled.spec.relevance
+        return PageEvaluator(
+            keywords=self.keywords,
+            min_keyword_hits=relevance.min_total_keyword_hits,
+            require_address=relevance.require_address,
+            street_tokens=self.street_tokens,
+            zip_tokens=self.zip_tokens,
+            city_tokens=self.city_tokens,
+            address_min_score=relevance.address.min_score,
+        )
+
+
+@lru_cache(maxsize=16)
+def compile_spec(spec: SearchSpec) -> CompiledSpec:
+    """``CompiledSpec.compile`` memoized per (hashable, frozen) spec."""
+    return CompiledSpec.compile(spec)
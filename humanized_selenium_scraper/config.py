@@ -4,6 +4,10 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
+DRIVER_BACKENDS = ("local", "remote", "grid")
+RETRY_MODES = ("inline", "deferred")
+TYPING_MODES = ("human", "fast", "instant")
+
 
 @dataclass(frozen=True)
 class ScraperConfig:
@@ -36,7 +40,54 @@ class ScraperConfig:
 
     chrome_profile_root: Path = Path("chrome_profile")
     page_load_timeout_s: int = 20
-    implicit_wait_s: int = 5
+    # Keep at 0: lookups that match nothing would block this long (see ``waits``)
+    implicit_wait_s: int = 0
+    # Explicit waits per phase: page body, Google's search box, Google's results
+    body_wait_s: int = 10
+    search_box_wait_s: int = 10
+    results_wait_s: int = 8
+    # Keystroke timing of the search query (``keystrokes.TYPING_PROFILES``)
+    typing_profile: str = "human"
+    # Append captured snapshots to an archive / serve pages from one instead of a browser
+    record_dir: Path | None = None
+    replay_dir: Path | None = None
+    # Worker processes for page relevance checks and contact extraction (0: inline)
+    analysis_workers: int = 0
+    # "local" Chrome, one "remote" WebDriver URL, or a "grid" of URLs (least-loaded)
+    driver_backend: str = "local"
+    webdriver_urls: tuple[str, ...] = ()
+    # JSON cache of hosts that recently failed hard (DNS, TLS), shared across runs
+    dead_host_file: Path | None = None
+    # "inline" retries a failed load in place; "deferred" moves the row to a retry lane
+    retry_mode: str = "inline"
+    retry_cooldown_s: int = 30
+    # HTTP HEAD check of SERP candidates before the browser loads them
+    preflight: bool = False
+    preflight_timeout_s: int = 5
+    # JSON file of consent cookies seeded into new browsers; None keeps them in this process
+    cookie_store_file: Path | None = None
+
+    def __post_init__(self) -> None:
+        if self.record_dir is not None and self.replay_dir is not None:
+            raise ValueError("record_dir and replay_dir are mutually exclusive")
+        if self.analysis_workers < 0:
+            raise ValueError("analysis_workers must be >= 0")
+        if self.retry_mode not in RETRY_MODES:
+            raise ValueError(f"Unknown retry_mode: {self.retry_mode!r}")
+        if self.typing_profile not in TYPING_MODES:
+            raise ValueError(f"Unknown typing_profile: {self.typing_profile!r}")
+        if self.retry_cooldown_s < 0:
+            raise ValueError("retry_cooldown_s must be >= 0")
+        if min(self.body_wait_s, self.search_box_wait_s, self.results_wait_s) <= 0:
+            raise ValueError("wait timeouts must be > 0")
+        if self.preflight_timeout_s <= 0:
+            raise ValueError("preflight_timeout_s must be > 0")
+        if self.driver_backend not in DRIVER_BACKENDS:
+            raise ValueError(f"Unknown driver_backend: {self.driver_backend!r}")
+        if self.driver_backend == "remote" and len(self.webdriver_urls) != 1:
+            raise ValueError("driver_backend 'remote' needs exactly one webdriver URL")
+        if self.driver_backend == "grid" and not self.webdriver_urls:
+            raise ValueError("driver_backend 'grid' needs at least one webdriver URL")
 
     @classmethod
     def from_mapping(cls, data: dict[str, Any]) -> ScraperConfig:
@@ -61,6 +112,12 @@ class ScraperConfig:
                 return Path(val)
             return None
 
+        def _str_tuple(key: str) -> tuple[str, ...]:
+            val = data.get(key, ())
+            if isinstance(val, str):
+                return (val,)
+            return tuple(str(v) for v in val) if isinstance(val, (list, tuple)) else ()
+
         chrome_root = _path("chrome_profile_root")
         return cls(
             google_domain=str(data.get("google_domain", defaults.google_domain)),
@@ -71,4 +128,19 @@ class ScraperConfig:
             else defaults.chrome_profile_root,
             page_load_timeout_s=_int("page_load_timeout_s", defaults.page_load_timeout_s),
             implicit_wait_s=_int("implicit_wait_s", defaults.implicit_wait_s),
+            body_wait_s=_int("body_wait_s", defaults.body_wait_s),
+            search_box_wait_s=_int("search_box_wait_s", defaults.search_box_wait_s),
+            results_wait_s=_int("results_wait_s", defaults.results_wait_s),
+            typing_profile=str(data.get("typing_profile", defaults.typing_profile)),
+            record_dir=_path("record_dir"),
+            replay_dir=_path("replay_dir"),
+            analysis_workers=_int("analysis_workers", defaults.analysis_workers),
+            driver_backend=str(data.get("driver_backend", defaults.driver_backend)),
+            webdriver_urls=_str_tuple("webdriver_urls"),
+            dead_host_file=_path("dead_host_file"),
+            retry_mode=str(data.get("retry_mode", defaults.retry_mode)),
+            retry_cooldown_s=_int("retry_cooldown_s", defaults.retry_cooldown_s),
+            preflight=bool(data.get("preflight", defaults.preflight)),
+            preflight_timeout_s=_int("preflight_timeout_s", defaults.preflight_timeout_s),
+            cookie_store_file=_path("cookie_store_file"),
         )
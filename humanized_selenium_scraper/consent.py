@@ -0,0 +1,138 @@
+"""Cookie consent in one script round trip, with per-host memory in the browser profile.
+
+All known consent patterns are checked at once in the page, its same-origin iframes and its
+open shadow roots, instead of one ``WebDriverWait`` per selector. The pattern that worked on
+a host is tried first next time. Once consent was given in a profile whose cookies persist,
+or the browser was seeded with consent cookies from a ``cookies.CookieStore``, the probe is
+skipped for that host altogether.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Any
+
+from .config import ScraperConfig
+from .metrics import METRICS
+
+# (id, CSS selector, lowercase text the element must contain or "")
+CONSENT_PATTERNS = (
+    ("google-accept-all", "#L2AGLb", ""),
+    ("akzeptieren", "button", "akzeptieren"),
+    ("accept-id", "button[id*='accept']", ""),
+    ("zustimmen", "button", "zustimmen"),
+    ("zustimmen-role", "[role='button']", "zustimmen"),
+    ("accept-all-label", "button[aria-label='Accept all']", ""),
+    ("cookie-accept-class", "button[class*='cookie'][class*='accept']", ""),
+)
+
+# Clicks the first visible match of arguments[0] (patterns in order) and returns its id.
+CONSENT_PROBE_SCRIPT = """
+var roots = [], seen = new Set();
+function collect(root) {
+  if (!root || seen.has(root)) return;
+  seen.add(root);
+  roots.push(root);
+  var walker = (root.ownerDocument || root).createTreeWalker(root, NodeFilter.SHOW_ELEMENT);
+  for (var el = walker.nextNode(); el; el = walker.nextNode()) {
+    if (el.shadowRoot) collect(el.shadowRoot);
+    if (el.tagName === "IFRAME" || el.tagName === "FRAME") {
+      try { collect(el.contentDocument); } catch (e) {}
+    }
+  }
+}
+collect(document);
+var patterns = arguments[0];
+for (var i = 0; i < patterns.length; i++) {
+  var id = patterns[i][0], css = patterns[i][1], text = patterns[i][2];
+  for (var r = 0; r < roots.length; r++) {
+    var found = roots[r].querySelectorAll(css);
+    for (var k = 0; k < found.length; k++) {
+      var el = found[k], box = el.getBoundingClientRect();
+      if (text && (el.textContent || "").toLowerCase().indexOf(text) < 0) continue;
+      if (box.width <= 0 || box.height <= 0) continue;
+      el.click();
+      return id;
+    }
+  }
+}
+return null;
+"""
+
+CONSENT_FILE = "consent.json"
+
+
+class ConsentMemory:
+    """Per host: the consent pattern that worked, and whether consent was given.
+
+    Kept as JSON next to the browser profile, so it lives and dies with the profile's
+    cookies. ``cookies_persist`` is false for browsers that do not use this profile (remote
+    backends, replays); their consent is never assumed, only the pattern is remembered.
+    """
+
+    def __init__(self, path: Path | None = None, *, cookies_persist: bool = False) -> None:
+        self.path = path
+        self.cookies_persist = cookies_persist and path is not None
+        self._hosts: dict[str, dict[str, Any]] = {}
+        self._seeded: set[str] = set()
+        if path is not None and path.exists():
+            try:
+                self._hosts = json.loads(path.read_text(encoding="utf-8"))
+            except (OSError, ValueError) as exc:
+                logging.warning("Consent memory unreadable => %s (%s)", path, exc)
+
+    @classmethod
+    def for_profile(cls, config: ScraperConfig, profile_dir: Path) -> ConsentMemory:
+        if config.replay_dir is not None:
+            return cls()
+        return cls(profile_dir / CONSENT_FILE, cookies_persist=config.driver_backend == "local")
+
+    def patterns(self, host: str) -> list[tuple[str, str, str]]:
+        """``CONSENT_PATTERNS`` with the one that worked on ``host`` first."""
+        remembered = self._hosts.get(host, {}).get("pattern")
+        return sorted(CONSENT_PATTERNS, key=lambda p: p[0] != remembered)
+
+    def is_given(self, host: str) -> bool:
+        if host in self._seeded:
+            return True
+        return self.cookies_persist and "given_at" in self._hosts.get(host, {})
+
+    def seeded(self, hosts: set[str]) -> None:
+        """The current browser got consent cookies for ``hosts`` (replaces earlier seeds)."""
+        self._seeded = set(hosts)
+
+    def given(self, host: str, pattern: str) -> None:
+        self._hosts[host] = {"pattern": pattern, "given_at": time.time()}
+        self._save()
+
+    def forget(self, host: str) -> None:
+        """Consent was assumed but the page did not behave like it (cookies gone)."""
+        self._seeded.discard(host)
+        if self._hosts.get(host, {}).pop("given_at", None) is not None:
+            self._save()
+
+    def _save(self) -> None:
+        if self.path is None:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(f".{self.path.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(self._hosts), encoding="utf-8")
+        os.replace(tmp, self.path)
+
+
+def accept_cookie_consent(driver: Any, memory: ConsentMemory, host: str) -> bool:
+    """Probe for a consent banner once and click it; ``True`` if something was clicked."""
+    if memory.is_given(host):
+        METRICS.incr("consent_skipped")
+        return False
+    clicked = driver.execute_script(CONSENT_PROBE_SCRIPT, [list(p) for p in memory.patterns(host)])
+    if not clicked:
+        logging.info("No cookie consent banner found (not critical).")
+        return False
+    logging.info("Cookie consent clicked by pattern: %s", clicked)
+    memory.given(host, str(clicked))
+    return True
@@ -0,0 +1,150 @@
+"""Consent cookies shared by every browser of a run, and of a fleet when kept in a file.
+
+After a browser accepted a cookie banner, its consent cookies are exported into a
+``CookieStore``. Browsers created later (driver restarts, other sessions, other worker
+processes sharing the file) get them through the DevTools command ``Network.setCookies``
+before their first navigation, so the banner does not show up for them at all.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+from .config import ScraperConfig
+from .metrics import METRICS
+
+# Google's consent cookies. Identity cookies (NID, ...) stay per browser on purpose.
+CONSENT_COOKIES = ("CONSENT", "SOCS")
+# Browser-session cookies have no expiry; they are shared for this long
+SESSION_COOKIE_TTL_S = 12 * 3600
+
+_FIELDS = ("name", "value", "domain", "path", "secure", "httpOnly", "sameSite", "expiry")
+_SAME_SITE = ("Strict", "Lax", "None")
+
+
+def _cdp_cookie(cookie: dict[str, Any]) -> dict[str, Any]:
+    """A WebDriver cookie as a ``Network.CookieParam``."""
+    param: dict[str, Any] = {
+        k: cookie[k] for k in ("name", "value", "domain", "path") if k in cookie
+    }
+    param["secure"] = bool(cookie.get("secure", False))
+    param["httpOnly"] = bool(cookie.get("httpOnly", False))
+    if cookie.get("sameSite") in _SAME_SITE:
+        param["sameSite"] = cookie["sameSite"]
+    param["expires"] = cookie["expiry"]
+    return param
+
+
+def set_cookies(driver: Any, cookies: list[dict[str, Any]]) -> None:
+    """``Network.setCookies`` on a local Chrome, or through the remote end's CDP endpoint."""
+    params = {"cookies": cookies}
+    if hasattr(driver, "execute_cdp_cmd"):
+        driver.execute_cdp_cmd("Network.setCookies", params)
+    else:
+        driver.execute("executeCdpCommand", {"cmd": "Network.setCookies", "params": params})
+
+
+class CookieStore:
+    """Exported cookies per host, each with an expiry; persisted as JSON when ``path`` is set.
+
+    Thread-safe. Saving merges with the file's current content and seeding picks up what
+    other processes saved, so several processes can share one store. The file is parsed again
+    only when its modification time changed.
+    """
+
+    def __init__(self, path: Path | None = None, *, names: tuple[str, ...] = CONSENT_COOKIES):
+        self.path = path
+        self.names = names
+        self._lock = threading.Lock()
+        self._file_mtime: int | None = None
+        self._file_hosts: dict[str, list[dict[str, Any]]] = {}
+        self._hosts: dict[str, list[dict[str, Any]]] = dict(self._read())
+
+    @classmethod
+    def for_config(cls, config: ScraperConfig) -> CookieStore | None:
+        """``None`` while replaying (there is no browser to seed)."""
+        if config.replay_dir is not None:
+            return None
+        return cls(config.cookie_store_file)
+
+    def _read(self) -> dict[str, list[dict[str, Any]]]:
+        """The file's cookies per host; parsed again only after the file changed."""
+        if self.path is None:
+            return {}
+        try:
+            mtime = self.path.stat().st_mtime_ns
+        except OSError:
+            return {}
+        if mtime == self._file_mtime:
+            return self._file_hosts
+        try:
+            raw = json.loads(self.path.read_text(encoding="utf-8"))
+            hosts = {str(host): list(cookies) for host, cookies in raw.items()}
+        except (OSError, ValueError, AttributeError, TypeError) as exc:
+            logging.warning("Cookie store unreadable => %s (%s)", self.path, exc)
+            return {}
+        self._file_mtime, self._file_hosts = mtime, hosts
+        return hosts
+
+    def cookies(self) -> dict[str, list[dict[str, Any]]]:
+        """Unexpired cookies per host, including ones other processes saved meanwhile."""
+        now = time.time()
+        with self._lock:
+            self._hosts.update(self._read())
+            self._hosts = {
+                host: live
+                for host, cookies in self._hosts.items()
+                if (live := [c for c in cookies if float(c.get("expiry", 0)) > now])
+            }
+            return dict(self._hosts)
+
+    def export(self, driver: Any, host: str) -> int:
+        """Store the consent cookies ``driver`` has for the page it shows on ``host``."""
+        try:
+            found = driver.get_cookies()
+        except Exception as exc:
+            logging.warning("Reading cookies failed => %s (%s)", host, exc)
+            return 0
+        expiry = int(time.time() + SESSION_COOKIE_TTL_S)
+        cookies = [
+            {"expiry": expiry, **{k: c[k] for k in _FIELDS if k in c}}
+            for c in found
+            if c.get("name") in self.names
+        ]
+        if not cookies:
+            return 0
+        with self._lock:
+            self._hosts[host] = cookies
+            if self.path is not None:
+                self._save()
+        logging.info("Exported %s consent cookie(s) => %s", len(cookies), host)
+        return len(cookies)
+
+    def seed(self, driver: Any) -> set[str]:
+        """Set all stored cookies in a fresh ``driver``; returns the hosts they are for."""
+        stored = self.cookies()
+        if not stored:
+            return set()
+        params = [_cdp_cookie(c) for cookies in stored.values() for c in cookies]
+        try:
+            set_cookies(driver, params)
+        except Exception as exc:
+            # E.g. a remote end without CDP; the consent probe still runs as before.
+            logging.info("Seeding cookies failed => %s", exc)
+            return set()
+        METRICS.incr("cookies_seeded", len(params))
+        return set(stored)
+
+    def _save(self) -> None:
+        assert self.path is not None
+        merged = {**self._read(), **self._hosts}
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(f".{self.path.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(merged), encoding="utf-8")
+        os.replace(tmp, self.path)
@@ -0,0 +1,109 @@
+"""Search each distinct query once and fan the result out to every row that renders to it."""
+
+from __future__ import annotations
+
+import threading
+from collections import Counter
+from collections.abc import Iterable
+
+from .spec import SearchSpec, render_template, render_templates
+
+# (normalized query, keywords, street, zip, city)
+DedupKey = tuple[str, tuple[str, ...], str, str, str]
+SearchResult = tuple[str | None, str | None, str | None]
+
+
+def _normalize(value: str) -> str:
+    return " ".join(value.casefold().split())
+
+
+def dedup_key(spec: SearchSpec, row: dict[str, str]) -> DedupKey | None:
+    """Everything ``Session.search`` reads from ``row``; ``None`` if a template does not render.
+
+    Rows with equal keys get the same search result. Address fields only count when the
+    spec requires an address match.
+    """
+    try:
+        query = _normalize(render_template(spec.query_template, row))
+        keywords = tuple(
+            _normalize(k) for k in render_templates(spec.relevance.keyword_templates, row)
+        )
+    except ValueError:
+        return None
+    if not query:
+        return None
+    street = plz = city = ""
+    if spec.relevance.require_address:
+        address = spec.relevance.address
+        street = _normalize(row.get(address.street_field, ""))
+        plz = _normalize(row.get(address.zip_field, ""))
+        city = _normalize(row.get(address.city_field, ""))
+    return query, keywords, street, plz, city
+
+
+class QueryDeduper:
+    """Result cache for duplicate rows, sized by a pre-pass over the input.
+
+    Only keys that occur more than once are cached, and an entry is evicted after its last
+    row was processed, so memory stays bounded by the duplicates still ahead. Only definitive
+    results are cached; after a failed search the next row of the group searches again.
+    """
+
+    def __init__(self, spec: SearchSpec, remaining: Counter[DedupKey]) -> None:
+        self.spec = spec
+        self._remaining = remaining
+        self._results: dict[DedupKey, SearchResult] = {}
+        self._lock = threading.Lock()
+        self.saved = 0
+
+    @classmethod
+    def from_rows(cls, spec: SearchSpec, rows: Iterable[dict[str, str]]) -> QueryDeduper:
+        counts: Counter[DedupKey] = Counter()
+        for row in rows:
+            key = dedup_key(spec, row)
+            if key is not None:
+                counts[key] += 1
+        return cls(spec, Counter({k: n for k, n in counts.items() if n > 1}))
+
+    @property
+    def duplicate_rows(self) -> int:
+        """Searches the pre-pass expects to save (group sizes minus one)."""
+        return sum(self._remaining.values()) - len(self._remaining)
+
+    def key(self, row: dict[str, str]) -> DedupKey | None:
+        key = dedup_key(self.spec, row)
+        with self._lock:
+            return key if key in self._remaining else None
+
+    def lookup(self, key: DedupKey) -> SearchResult | None:
+        with self._lock:
+            found = self._results.get(key)
+            if found is not None:
+                self.saved += 1
+        return found
+
+    def remember(self, key: DedupKey, result: SearchResult) -> None:
+        with self._lock:
+            if self._remaining.get(key, 0) > 1:
+                self._results[key] = result
+
+    def release(self, key: DedupKey) -> None:
+        """Mark one row of ``key`` as final; drops the cached result after the last one.
+
+        Call once per row, when its output is written: not for a deferred row, which is still
+        pending and may reuse the result when it is retried.
+        """
+        with self._lock:
+            left = self._remaining[key] - 1
+            if left <= 0:
+                del self._remaining[key]
+                self._results.pop(key, None)
+            else:
+                self._remaining[key] = left
+
+    def release_row(self, row: dict[str, str]) -> None:
+        """``release`` for a row whose output the caller wrote itself (a deferred row it gave
+        up on)."""
+        key = self.key(row)
+        if key is not None:
+            self.release(key)
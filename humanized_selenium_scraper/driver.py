@@ -1,32 +1,25 @@
 from __future__ import annotations
 
-import os
-import random
 from pathlib import Path
+from typing import Any
 
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
-
+from .archive import RecordingDriver, ReplayDriver, WebArchive
 from .config import ScraperConfig
+from .providers import provider_for
 
 
-def create_driver(config: ScraperConfig, *, profile_dir: Path) -> webdriver.Chrome:
-    user_agents = config.user_agents or [
-        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
-        "(KHTML, like Gecko) Chrome/113.0.0.0 Safari/537.36"
-    ]
-    window_sizes = config.window_sizes or [(1280, 720)]
-    user_agent = random.choice(user_agents)
-    width, height = random.choice(window_sizes)
+def create_driver(config: ScraperConfig, *, profile_dir: Path) -> Any:
+    """Chrome with a random user agent and window size, from ``config.driver_backend``.
 
-    chrome_opts = Options()
-    os.makedirs(profile_dir, exist_ok=True)
-    chrome_opts.add_argument(f"--user-data-dir={profile_dir}")
-    chrome_opts.add_argument(f"--user-agent={user_agent}")
-    chrome_opts.add_argument(f"--window-size={width},{height}")
+    With ``config.replay_dir`` no browser is started: pages come from the archive. With
+    ``config.record_dir`` the browser is wrapped so captured snapshots are archived.
+    """
+    if config.replay_dir is not None:
+        return ReplayDriver(WebArchive(config.replay_dir), google_domain=config.google_domain)
 
-    driver = webdriver.Chrome(service=Service(), options=chrome_opts)
-    driver.set_page_load_timeout(config.page_load_timeout_s)
-    driver.implicitly_wait(config.implicit_wait_s)
+    driver = provider_for(config).create(config, profile_dir=profile_dir)
+    if config.record_dir is not None:
+        return RecordingDriver(
+            driver, WebArchive(config.record_dir), google_domain=config.google_domain
+        )
     return driver
@@ -0,0 +1,356 @@
+"""In-memory WebDriver emulation: pages, links and a driver that navigates them.
+
+``FakeDriver`` serves pages from any :class:`PageServer`. The offline simulated web
+(``simweb.SimWeb``) generates them; archive replay (``archive.ArchiveWeb``) reads them from a
+recorded run.
+"""
+
+from __future__ import annotations
+
+import html
+import time
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import Any, Protocol
+from urllib.parse import urlparse
+
+from selenium.common.exceptions import (
+    NoSuchElementException,
+    NoSuchWindowException,
+    WebDriverException,
+)
+from selenium.webdriver.common.by import By
+from selenium.webdriver.common.keys import Keys
+
+from .consent import CONSENT_PROBE_SCRIPT
+from .human import HEIGHT_SCRIPT
+from .keystrokes import TYPE_SCRIPT
+from .selenium_ops import NET_ERROR_URL_PREFIX
+from .snapshot import SNAPSHOT_SCRIPT
+from .tabs import OPEN_TAB_SCRIPT, READY_STATE_SCRIPT
+
+# Consent patterns that match the simulated banner's button
+_BANNER_PATTERNS = frozenset({"akzeptieren", "accept-id"})
+
+
+@dataclass(frozen=True)
+class SimLink:
+    href: str
+    text: str
+    # The ``href`` attribute as written in the page, when it differs from the absolute URL
+    raw_href: str | None = None
+
+
+@dataclass
+class SimPage:
+    url: str
+    title: str
+    text: str
+    links: list[SimLink] = field(default_factory=list)
+    metas: list[str] = field(default_factory=list)
+    hidden_inputs: list[str] = field(default_factory=list)
+    kind: str = "site"  # "home" | "serp" | "site"
+    consent_banner: bool = False
+    # Serve this markup verbatim instead of rendering the fields above (archived pages)
+    source: str | None = None
+
+    @cached_property
+    def html(self) -> str:
+        if self.source is not None:
+            return self.source
+        parts = [
+            "<!doctype html><html><head>",
+            f"<title>{html.escape(self.title)}</title>",
+            *(f'<meta name="description" content="{html.escape(m)}">' for m in self.metas),
+            "</head><body>",
+        ]
+        if self.consent_banner:
+            parts.append(
+                '<div id="consent"><button id="accept-all" '
+                "onclick=\"document.getElementById('consent').remove()\">"
+                "Alle akzeptieren</button></div>"
+            )
+        if self.kind == "home":
+            parts.append('<form action="/search" method="get"><input name="q" type="text"></form>')
+        parts.append('<div id="search">' if self.kind == "serp" else "<main>")
+        parts.extend(f"<p>{html.escape(line)}</p>" for line in self.text.splitlines() if line)
+        parts.extend(
+            f'<a href="{html.escape(link.href)}">{html.escape(link.text)}</a>'
+            for link in self.links
+        )
+        parts.extend(
+            f'<input type="hidden" value="{html.escape(value)}">' for value in self.hidden_inputs
+        )
+        parts.append("</div>" if self.kind == "serp" else "</main>")
+        parts.append("</body></html>")
+        return "\n".join(parts)
+
+    @property
+    def height(self) -> int:
+        return 600 + len(self.html) // 40
+
+
+class PageServer(Protocol):
+    """What :class:`FakeDriver` navigates: ``simweb.SimWeb`` or an archive replay."""
+
+    consent: str
+
+    def resolve(self, url: str) -> SimPage | None: ...
+
+    def search(self, query: str) -> SimPage: ...
+
+
+class FakeElement:
+    def __init__(
+        self,
+        driver: FakeDriver,
+        tag: str,
+        *,
+        text: str = "",
+        attrs: dict[str, str] | None = None,
+    ) -> None:
+        self._driver = driver
+        self.tag_name = tag
+        self.text = text
+        self._attrs = attrs or {}
+        self._typed = ""
+
+    def get_attribute(self, name: str) -> str | None:
+        return self._attrs.get(name)
+
+    def is_displayed(self) -> bool:
+        return True
+
+    def is_enabled(self) -> bool:
+        return True
+
+    def click(self) -> None:
+        if self._attrs.get("id") == "accept-all":
+            self._driver.accept_consent()
+
+    def send_keys(self, *keys: str) -> None:
+        for chunk in keys:
+            if Keys.RETURN in chunk or Keys.ENTER in chunk:
+                self._driver.submit_search(self._typed)
+                return
+            self._typed += chunk
+
+
+class _FakeSwitchTo:
+    def __init__(self, driver: FakeDriver) -> None:
+        self._driver = driver
+
+    def window(self, handle: str) -> None:
+        if handle not in self._driver._windows:
+            raise NoSuchWindowException(f"no such window: {handle}")
+        self._driver._handle = handle
+
+
+class FakeDriver:
+    """In-memory stand-in for ``webdriver.Chrome`` backed by a ``simweb.SimWeb`` (or any
+    :class:`PageServer`).
+
+    Implements the subset of the WebDriver API the scraper uses (``get``, ``back``,
+    ``page_source``, ``find_element(s)``, ``execute_script``, windows opened with
+    ``window.open``) and counts navigations in ``page_loads``. ``load_latency_s`` adds a
+    fixed delay per navigation; tabs opened by script load in the background instead and
+    report ``document.readyState == "loading"`` until that delay has passed.
+    """
+
+    def __init__(self, web: PageServer, *, load_latency_s: float = 0.0) -> None:
+        self.web = web
+        self.load_latency_s = load_latency_s
+        self.page_loads = 0
+        self.consented = False
+        self._windows: dict[str, list[SimPage]] = {"w0": []}
+        self._ready_at: dict[str, float] = {}
+        self._handle = "w0"
+        self._next_window = 1
+        self._banner_open = False
+        self._cookies: dict[str, dict[str, Any]] = {}
+        self.switch_to = _FakeSwitchTo(self)
+
+    @property
+    def _history(self) -> list[SimPage]:
+        history = self._windows.get(self._handle)
+        if history is None:  # current window was closed, as in Chrome
+            raise NoSuchWindowException(f"no such window: {self._handle}")
+        return history
+
+    @property
+    def window_handles(self) -> list[str]:
+        return list(self._windows)
+
+    @property
+    def current_window_handle(self) -> str:
+        if self._handle not in self._windows:
+            raise NoSuchWindowException(f"no such window: {self._handle}")
+        return self._handle
+
+    def close(self) -> None:
+        if self._windows.pop(self._handle, None) is None:
+            raise NoSuchWindowException(f"no such window: {self._handle}")
+
+    @property
+    def _page(self) -> SimPage:
+        if not self._history:
+            return SimPage(url="about:blank", title="", text="")
+        return self._history[-1]
+
+    @property
+    def current_url(self) -> str:
+        return self._page.url
+
+    @property
+    def title(self) -> str:
+        return self._page.title
+
+    @property
+    def page_source(self) -> str:
+        return self._page.html
+
+    def get(self, url: str) -> None:
+        self.page_loads += 1
+        if self.load_latency_s > 0:
+            time.sleep(self.load_latency_s)
+        page = self.web.resolve(url)
+        if page is None:
+            raise WebDriverException(f"unknown error: net::ERR_NAME_NOT_RESOLVED ({url})")
+        self._open(page)
+
+    def back(self) -> None:
+        # Chrome usually reloads the previous page (SERPs are not served from bfcache).
+        if self.load_latency_s > 0:
+            time.sleep(self.load_latency_s)
+        if len(self._history) > 1:
+            self._history.pop()
+
+    def submit_search(self, query: str) -> None:
+        self.page_loads += 1
+        self._open(self.web.search(query))
+
+    def accept_consent(self) -> None:
+        self.consented = True
+        self._banner_open = False
+        self._cookies["SOCS"] = {
+            "name": "SOCS",
+            "value": "CAISNQ",
+            "domain": ".google.com",
+            "path": "/",
+            "secure": True,
+            "httpOnly": False,
+            "sameSite": "Lax",
+            "expiry": int(time.time()) + 390 * 86400,
+        }
+
+    def get_cookies(self) -> list[dict[str, Any]]:
+        return list(self._cookies.values())
+
+    def execute_cdp_cmd(self, cmd: str, params: dict[str, Any]) -> dict[str, Any]:
+        if cmd == "Network.setCookies":
+            for cookie in params["cookies"]:
+                if cookie.get("expires", time.time() + 1) > time.time():
+                    self._cookies[cookie["name"]] = cookie
+            # Google shows no banner to a browser that has its consent cookie.
+            self.consented = self.consented or "SOCS" in self._cookies
+        return {}
+
+    def _open(self, page: SimPage) -> None:
+        self._banner_open = page.consent_banner and (
+            self.web.consent == "every_visit" or not self.consented
+        )
+        self._history.append(page)
+
+    def find_elements(self, by: str, value: str) -> list[FakeElement]:
+        page = self._page
+        if (by == By.TAG_NAME and value == "a") or (by == By.XPATH and "@href" in value):
+            return [
+                FakeElement(self, "a", text=link.text, attrs={"href": link.href})
+                for link in page.links
+                if by == By.TAG_NAME or "http" in link.href
+            ]
+        if by == By.TAG_NAME and value == "meta":
+            return [FakeElement(self, "meta", attrs={"content": m}) for m in page.metas]
+        if by == By.TAG_NAME and value == "body":
+            return [FakeElement(self, "body", text=page.text)]
+        if by == By.CSS_SELECTOR and value == "input[type='hidden']":
+            return [FakeElement(self, "input", attrs={"value": v}) for v in page.hidden_inputs]
+        if by == By.NAME and value == "q" and page.kind == "home":
+            return [FakeElement(self, "input", attrs={"name": "q"})]
+        if by == By.ID and value == "search" and page.kind == "serp":
+            return [FakeElement(self, "div", attrs={"id": "search"})]
+        if by == By.XPATH and "button" in value and self._banner_open:
+            return [
+                FakeElement(self, "button", text="Alle akzeptieren", attrs={"id": "accept-all"})
+            ]
+        return []
+
+    def find_element(self, by: str, value: str) -> FakeElement:
+        elements = self.find_elements(by, value)
+        if not elements:
+            raise NoSuchElementException(f"{by}={value}")
+        return elements[0]
+
+    def execute_script(self, script: str, *args: Any) -> Any:
+        if script == HEIGHT_SCRIPT:
+            return self._page.height
+        if script == READY_STATE_SCRIPT:
+            return (
+                "loading" if time.monotonic() < self._ready_at.get(self._handle, 0) else "complete"
+            )
+        if script == OPEN_TAB_SCRIPT:
+            self._open_window(args[0])
+        if script == CONSENT_PROBE_SCRIPT:
+            if not self._banner_open:
+                return None
+            self.accept_consent()
+            # The banner's button: <button id="accept-all">Alle akzeptieren</button>
+            return next((p[0] for p in args[0] if p[0] in _BANNER_PATTERNS), None)
+        if script == SNAPSHOT_SCRIPT:
+            page = self._page
+            return {
+                "url": page.url,
+                "html": page.html,
+                "links": [
+                    [link.href, link.text, link.href if link.raw_href is None else link.raw_href]
+                    for link in page.links
+                ],
+                "metas": list(page.metas),
+                "hidden": list(page.hidden_inputs),
+            }
+        return None
+
+    def execute_async_script(self, script: str, *args: Any) -> Any:
+        if script == TYPE_SCRIPT:
+            element = args[0]
+            element.send_keys(args[1])
+            return element._typed
+        return None
+
+    def _open_window(self, url: str) -> None:
+        self.page_loads += 1
+        handle = f"w{self._next_window}"
+        self._next_window += 1
+        try:
+            page = self.web.resolve(url)
+        except WebDriverException:
+            page = None
+        if page is None:
+            # Chrome shows its error page in the tab instead of failing window.open
+            page = SimPage(
+                url=f"{NET_ERROR_URL_PREFIX}chromewebdata/",
+                title=urlparse(url).netloc,
+                text="This site can't be reached\nERR_NAME_NOT_RESOLVED",
+            )
+        self._windows[handle] = [page]
+        self._ready_at[handle] = time.monotonic() + self.load_latency_s
+
+    def set_page_load_timeout(self, timeout_s: float) -> None:
+        return None
+
+    def implicitly_wait(self, timeout_s: float) -> None:
+        return None
+
+    def quit(self) -> None:
+        self._windows = {"w0": []}
+        self._handle = "w0"
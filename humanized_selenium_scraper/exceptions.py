@@ -1,2 +1,19 @@
 class SkipEntryError(Exception):
     """Signals that the current CSV entry should be skipped after repeated failures."""
+
+
+class RetryLaterError(Exception):
+    """A transient load failure; with ``retry_mode = "deferred"`` the row is retried later.
+
+    Not a ``SkipEntryError``: the row is not finished, so callers that cannot defer it must
+    handle this error themselves."""
+
+    def __init__(self, url: str, kind: str) -> None:
+        super().__init__(f"Retry later ({kind}) => {url}")
+        self.url = url
+        self.kind = kind
+
+
+class SearchFailedError(Exception):
+    """A search that found nothing for a transient reason (Google did not load, no search box,
+    no results); unlike an empty result it says nothing about the query."""
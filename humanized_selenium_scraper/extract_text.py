@@ -2,26 +2,33 @@ from __future__ import annotations
 
 import re
 
-_NORMAL_EMAIL_RE = re.compile(
-    r"[a-zA-Z0-9._%+\-\(\)]+@[a-zA-Z0-9.\-]+\.[a-zA-Z]{2,}",
-    re.MULTILINE,
-)
-
-_OBF_EMAIL_RE = re.compile(
-    r"([a-zA-Z0-9._%+\-]+)\s?(\(|\[)?at(\)|\])?\s?([a-zA-Z0-9.\-]+)\s?"
-    r"(\(|\[)?(dot|punkt)(\)|\])?\s?([a-zA-Z]{2,})",
+# One linear-time tokenizer finds every place where a contact could start:
+#  - phone: digit groups joined by short (1-3 char) separator runs; groups always start with a
+#    digit and separators never contain one, so the pattern cannot backtrack
+#  - at: a plain "@" (normal e-mail)
+#  - obf: a standalone "at" / "(at)" / "[at]" (obfuscated e-mail)
+# Everything else is checked in Python with bounded lookaround around the token.
+_CONTACT_TOKEN_RE = re.compile(
+    r"(?P<phone>\+?\(?\d[\d()]*(?:[ \t\n\r\f\v./\-]{1,3}\(?\d[\d()]*)*)"
+    r"|(?P<at>@)"
+    r"|(?P<obf>(?<=[\s(\[])at(?=[\s)\]]))",
     re.IGNORECASE,
 )
-
-_PHONE_PREFIX_RE = re.compile(
-    r"(?:tel|phone|call)[:\s]*(\+?\d{2,4}\(?\d{1,4}\)?\s?\d{3,}[\d\s/\-]*)",
-    re.IGNORECASE,
+_DOMAIN_RUN_RE = re.compile(r"[a-zA-Z0-9.\-]{1,255}")
+_LETTERS_RE = re.compile(r"[a-zA-Z]+")
+_OBF_DOT_RE = re.compile(r"\s?[(\[]?(?:dot|punkt)[)\]]?\s?([a-zA-Z]{2,})", re.IGNORECASE)
+_DIGIT_GROUP_RE = re.compile(r"\d+")
+_PHONE_SEPARATOR_RE = re.compile(r"([ \t\n\r\f\v./\-]+)")
+
+_EMAIL_LOCAL_CHARS = frozenset(
+    "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789._%+-()"
 )
+_OBF_USER_CHARS = _EMAIL_LOCAL_CHARS - {"(", ")"}
+_DIGITS_DELETE = str.maketrans("", "", "0123456789")
 
-_PHONE_SIMPLE_RE = re.compile(
-    r"\+?\d{2,4}[\s./-]*\(?\d{1,4}\)?[\s./-]*\d{3,}[\d\s./-]*",
-    re.IGNORECASE,
-)
+MIN_PHONE_DIGITS = 7
+MAX_PHONE_LEN = 40
+MAX_EMAIL_LOCAL_LEN = 64
 
 
 def decode_antispam_mail(encoded_string: str) -> str:
@@ -33,33 +40,145 @@ def decode_antispam_mail(encoded_string: str) -> str:
     return "".join(_decode_char(ch) for ch in encoded_string)
 
 
-def parse_less_generous_phones(text: str) -> set[str]:
-    phones: set[str] = set()
-
-    for match in _PHONE_PREFIX_RE.finditer(text):
-        candidate = match.group(1).strip()
-        if len(re.sub(r"\D", "", candidate)) >= 7:
-            phones.add(candidate)
+def count_digits(text: str) -> int:
+    """Number of ASCII digits in ``text`` (C-speed, no regex substitution)."""
+    return len(text) - len(text.translate(_DIGITS_DELETE))
+
+
+def _phone_pieces(raw: str) -> list[str]:
+    """``raw`` cut into pieces of at most ``MAX_PHONE_LEN`` chars at its separator runs.
+
+    The old pattern matched such runs whole (e.g. two numbers joined by " - "). Cuts go at
+    the widest separator runs first; where all runs are equally wide, digit groups are packed
+    greedily. A single digit run has nothing to cut at and stays whole.
+    """
+    if len(raw) <= MAX_PHONE_LEN:
+        return [raw]
+    parts = _PHONE_SEPARATOR_RE.split(raw)
+    separators, groups = parts[1::2], parts[2::2]
+    if not separators:
+        return [raw]
+    widest = max(len(sep) for sep in separators)
+    uniform = all(len(sep) == widest for sep in separators)
+    pieces: list[str] = []
+    current = parts[0]
+    for sep, group in zip(separators, groups, strict=True):
+        if (len(sep) == widest and not uniform) or (
+            uniform and len(current) + len(sep) + len(group) > MAX_PHONE_LEN
+        ):
+            pieces.append(current)
+            current = group
+        else:
+            current += sep + group
+    pieces.append(current)
+    if uniform:
+        return pieces
+    return [piece for part in pieces for piece in _phone_pieces(part)]
+
+
+def _phone_candidate(raw: str) -> str | None:
+    candidate = raw.rstrip("(")
+    if count_digits(candidate) < MIN_PHONE_DIGITS:
+        return None
+    # Same shape the old pattern required: a 3+ digit group after the leading group
+    # (or a leading group long enough to be split), which rejects ISO dates like 2024-01-15.
+    groups = _DIGIT_GROUP_RE.findall(candidate)
+    if len(groups[0]) < 5 and not any(len(g) >= 3 for g in groups[1:]):
+        return None
+    return candidate
+
+
+def _scan_back(text: str, end: int, floor: int, chars: frozenset[str]) -> int:
+    start = end
+    floor = max(floor, end - MAX_EMAIL_LOCAL_LEN)
+    while start > floor and text[start - 1] in chars:
+        start -= 1
+    return start
+
+
+def _domain_with_tld(text: str, pos: int) -> tuple[str, int] | None:
+    """Longest ``domain.tld`` (tld = 2+ letters) starting at ``pos``, with its end offset."""
+    run = _DOMAIN_RUN_RE.match(text, pos)
+    if run is None:
+        return None
+    domain = run.group(0)
+    dot = domain.rfind(".")
+    while dot > 0:
+        letters = _LETTERS_RE.match(domain, dot + 1)
+        if letters is not None and letters.end() - dot > 2:
+            return domain[: letters.end()], pos + letters.end()
+        dot = domain.rfind(".", 0, dot)
+    return None
+
+
+def _obfuscated_email(text: str, at_start: int, floor: int) -> tuple[str, int] | None:
+    """Parse ``user (at) domain (dot) tld`` around the ``at`` token at ``at_start``."""
+    user_end = at_start
+    if user_end > 0 and text[user_end - 1] in "([":
+        user_end -= 1
+    if user_end > 0 and text[user_end - 1].isspace():
+        user_end -= 1
+    user_start = _scan_back(text, user_end, floor, _OBF_USER_CHARS)
+    if user_start == user_end:
+        return None
+
+    pos = at_start + 2
+    if pos < len(text) and text[pos] in ")]":
+        pos += 1
+    if pos < len(text) and text[pos].isspace():
+        pos += 1
+    domain = _DOMAIN_RUN_RE.match(text, pos)
+    if domain is None:
+        return None
+    tld = _OBF_DOT_RE.match(text, domain.end())
+    if tld is None:
+        return None
+    user = text[user_start:user_end]
+    return f"{user}@{domain.group(0)}.{tld.group(1)}", tld.end()
+
+
+def scan_contacts(
+    text: str, *, phones: bool = True, emails: bool = True
+) -> tuple[set[str], set[str]]:
+    """Collect phone and e-mail candidates from ``text`` in a single linear pass.
+
+    Every lookaround is bounded (local parts by ``MAX_EMAIL_LOCAL_LEN``, domains by 255 chars)
+    and long phone runs are cut into ``MAX_PHONE_LEN`` pieces, so the cost stays linear even on
+    minified JS or long digit/whitespace runs.
+    """
+    phone_set: set[str] = set()
+    mail_set: set[str] = set()
+    # Like consecutive regex matches, an e-mail never starts inside the previous one.
+    mail_floor = 0
+    for token in _CONTACT_TOKEN_RE.finditer(text):
+        kind = token.lastgroup
+        if kind == "phone":
+            if phones:
+                for piece in _phone_pieces(token.group(0)):
+                    candidate = _phone_candidate(piece)
+                    if candidate is not None:
+                        phone_set.add(candidate)
+        elif not emails:
+            continue
+        elif kind == "at":
+            at = token.start()
+            local_start = _scan_back(text, at, mail_floor, _EMAIL_LOCAL_CHARS)
+            found = _domain_with_tld(text, at + 1) if local_start < at else None
+            if found is not None:
+                domain, mail_floor = found
+                mail_set.add(f"{text[local_start:at]}@{domain}")
+        else:
+            obfuscated = _obfuscated_email(text, token.start(), mail_floor)
+            if obfuscated is not None:
+                address, mail_floor = obfuscated
+                mail_set.add(address)
+    return phone_set, mail_set
 
-    for match in _PHONE_SIMPLE_RE.finditer(text):
-        candidate = match.group(0).strip()
-        if len(re.sub(r"\D", "", candidate)) >= 7:
-            phones.add(candidate)
 
+def parse_less_generous_phones(text: str) -> set[str]:
+    phones, _ = scan_contacts(text, emails=False)
     return phones
 
 
 def parse_phone_and_email_obfuscated(big_source: str) -> tuple[set[str], set[str]]:
-    phones = {phone.strip() for phone in parse_less_generous_phones(big_source)}
-
-    mails: set[str] = set()
-    for match in _NORMAL_EMAIL_RE.findall(big_source):
-        mails.add(match.strip())
-
-    for match in _OBF_EMAIL_RE.finditer(big_source):
-        user = match.group(1)
-        dom = match.group(4)
-        tld = match.group(8)
-        mails.add(f"{user}@{dom}.{tld}".strip())
-
-    return phones, mails
+    return scan_contacts(big_source)
@@ -1,26 +1,87 @@
 from __future__ import annotations
 
+import asyncio
 import random
 import time
+from collections.abc import Iterator
+from contextlib import contextmanager
 
+from . import steps
+from .steps import Steps, call
 
-def human_type(element, text: str) -> None:
-    for ch in text:
-        element.send_keys(ch)
-        time.sleep(random.uniform(0.05, 0.3))
+HEIGHT_SCRIPT = "return document.body ? document.body.scrollHeight : 0"
+SCROLL_SCRIPT = "var b = document.body; if (b) window.scrollTo(0, b.scrollHeight);"
+
+# Multiplier for every humanized pause; the load-test harness sets it to 0.
+PAUSE_SCALE = 1.0
+
+
+def sleep(seconds: float) -> None:
+    """Sleep for a humanized pause, scaled by ``PAUSE_SCALE``."""
+    scaled = seconds * PAUSE_SCALE
+    if scaled > 0:
+        time.sleep(scaled)
+
+
+def sleep_steps(seconds: float) -> Steps[None]:
+    """``sleep`` as a step."""
+    yield from steps.sleep(seconds * PAUSE_SCALE)
+
+
+async def async_sleep(seconds: float) -> None:
+    """``sleep`` for coroutines: the event loop keeps running other sessions meanwhile."""
+    scaled = seconds * PAUSE_SCALE
+    if scaled > 0:
+        await asyncio.sleep(scaled)
+
+
+@contextmanager
+def scaled_pauses(scale: float) -> Iterator[None]:
+    """Temporarily scale all humanized pauses (``0`` disables them)."""
+    global PAUSE_SCALE
+    previous = PAUSE_SCALE
+    PAUSE_SCALE = scale
+    try:
+        yield
+    finally:
+        PAUSE_SCALE = previous
 
 
 def random_pause(base_s: float = 1.0, var_s: float = 2.0) -> None:
-    time.sleep(base_s + random.random() * var_s)
+    sleep(base_s + random.random() * var_s)
+
+
+def random_pause_steps(base_s: float = 1.0, var_s: float = 2.0) -> Steps[None]:
+    yield from sleep_steps(base_s + random.random() * var_s)
+
+
+async def async_random_pause(base_s: float = 1.0, var_s: float = 2.0) -> None:
+    await async_sleep(base_s + random.random() * var_s)
+
+
+def page_height_steps(driver) -> Steps[int]:
+    return (yield from call(driver.execute_script, HEIGHT_SCRIPT)) or 0
+
+
+def scroll_steps(driver, last_height: int, pause_s: float) -> Steps[int | None]:
+    """Scroll to the bottom once; the new page height, or ``None`` if it did not grow.
+
+    Scrolling stops once the height no longer grows, like ``do_infinite_scrolling``.
+    """
+    yield from call(driver.execute_script, SCROLL_SCRIPT)
+    yield from sleep_steps(pause_s)
+    new_height = yield from page_height_steps(driver)
+    return None if new_height == last_height else new_height
+
+
+def infinite_scrolling_steps(driver, max_scroll: int = 3, pause_s: float = 1.0) -> Steps[None]:
+    height = yield from page_height_steps(driver)
+    for _step in range(max_scroll):
+        grown = yield from scroll_steps(driver, height, pause_s)
+        if grown is None:
+            return
+        height = grown
 
 
 def do_infinite_scrolling(driver, max_scroll: int = 3, pause_s: float = 1.0) -> None:
-    height_script = "return document.body ? document.body.scrollHeight : 0"
-    last_height = driver.execute_script(height_script) or 0
-    for _ in range(max_scroll):
-        driver.execute_script("var b = document.body; if (b) window.scrollTo(0, b.scrollHeight);")
-        time.sleep(pause_s)
-        new_height = driver.execute_script(height_script) or 0
-        if new_height == last_height:
-            break
-        last_height = new_height
+    steps.run_steps(infinite_scrolling_steps(driver, max_scroll=max_scroll, pause_s=pause_s))
@@ -1,9 +1,80 @@
 from __future__ import annotations
 
 import csv
-from collections.abc import Iterable
+import zlib
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
 from pathlib import Path
 
+SHARD_MODES = ("hash", "range")
+
+
+@dataclass(frozen=True)
+class Shard:
+    """Shard ``index`` of ``count`` (1-based, as in ``--shard 2/4``)."""
+
+    index: int
+    count: int
+    mode: str = "hash"  # "hash" | "range"
+
+
+def parse_shard_arg(value: str, *, mode: str = "hash") -> Shard:
+    index_s, sep, count_s = value.partition("/")
+    try:
+        index, count = int(index_s), int(count_s)
+    except ValueError:
+        index, count = 0, 0
+    if not sep or count < 1 or not 1 <= index <= count:
+        raise ValueError(f"shard must look like i/N with 1 <= i <= N, got {value!r}")
+    if mode not in SHARD_MODES:
+        raise ValueError(f"Unknown shard mode: {mode!r}")
+    return Shard(index=index, count=count, mode=mode)
+
+
+def shard_of(position: int, row: dict[str, str], *, count: int, mode: str, total: int) -> int:
+    """1-based shard that owns the row at 0-based ``position`` out of ``total`` rows.
+
+    ``hash`` uses a CRC32 of the row values (stable across runs, hosts and input reordering);
+    ``range`` assigns contiguous blocks of roughly ``total / count`` rows.
+    """
+    if mode == "range":
+        return position * count // max(total, 1) + 1
+    if mode != "hash":
+        raise ValueError(f"Unknown shard mode: {mode!r}")
+    key = "\x1f".join(row.values()).encode("utf-8")
+    return zlib.crc32(key) % count + 1
+
+
+def count_csv_rows(
+    path: Path, *, delimiter: str = ",", has_header: bool = False, columns: list[str] | None = None
+) -> int:
+    rows = _iter_csv_rows(path, delimiter=delimiter, has_header=has_header, columns=columns)
+    return sum(1 for _ in rows)
+
+
+def enumerate_csv_rows(
+    path: Path,
+    *,
+    delimiter: str = ",",
+    has_header: bool = False,
+    columns: list[str] | None = None,
+    shard: Shard | None = None,
+) -> Iterator[tuple[int, dict[str, str]]]:
+    """Yield ``(input position, row)``, restricted to ``shard`` when given."""
+    rows = _iter_csv_rows(path, delimiter=delimiter, has_header=has_header, columns=columns)
+    if shard is None or shard.count == 1:
+        yield from enumerate(rows)
+        return
+    # Every shard still parses every row: hash ownership needs the row's content, and the
+    # output keeps the global input position. Only range mode needs the extra counting pass.
+    total = 0
+    if shard.mode == "range":
+        total = count_csv_rows(path, delimiter=delimiter, has_header=has_header, columns=columns)
+    for position, row in enumerate(rows):
+        owner = shard_of(position, row, count=shard.count, mode=shard.mode, total=total)
+        if owner == shard.index:
+            yield position, row
+
 
 def read_csv_rows(
     path: Path,
@@ -11,7 +82,21 @@ def read_csv_rows(
     delimiter: str = ",",
     has_header: bool = False,
     columns: list[str] | None = None,
+    shard: Shard | None = None,
 ) -> Iterable[dict[str, str]]:
+    for _position, row in enumerate_csv_rows(
+        path, delimiter=delimiter, has_header=has_header, columns=columns, shard=shard
+    ):
+        yield row
+
+
+def _iter_csv_rows(
+    path: Path,
+    *,
+    delimiter: str,
+    has_header: bool,
+    columns: list[str] | None,
+) -> Iterator[dict[str, str]]:
     with path.open("r", encoding="utf-8", newline="") as handle:
         if has_header:
             dict_reader = csv.DictReader(handle, delimiter=delimiter)
@@ -34,6 +119,23 @@ def read_csv_rows(
             yield {cols[i]: (row_list[i] or "") for i in range(len(cols))}
 
 
+def read_input_columns(
+    path: Path, *, delimiter: str, has_header: bool, columns: list[str] | None
+) -> list[str]:
+    """Input column names: the (deduplicated) header row, or ``columns`` for headerless CSV."""
+    if not has_header:
+        return columns or []
+    with path.open("r", encoding="utf-8", newline="") as handle:
+        reader = csv.reader(handle, delimiter=delimiter)
+        header = next(reader, None)
+        if not header:
+            raise ValueError("Input CSV is empty.")
+        raw_columns = [h.strip() for h in header if h.strip()]
+        if not raw_columns:
+            raise ValueError("Header row is empty (no column names).")
+        return list(dict.fromkeys(raw_columns))
+
+
 def parse_columns_arg(value: str) -> list[str]:
     cols = [c.strip() for c in value.split(",") if c.strip()]
     if not cols:
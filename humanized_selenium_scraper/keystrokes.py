@@ -0,0 +1,89 @@
+"""Typing in the browser: the whole keystroke sequence in one script call.
+
+``type_text`` sends the characters together with their pre-drawn delays. The page types them
+on its own timers (keydown, keypress, value, input, keyup per character) and answers once it
+is done, so a query costs one WebDriver round trip instead of one ``send_keys`` call and one
+Python-side sleep per character. Delays come from a ``TypingProfile`` and are scaled by
+``human.PAUSE_SCALE`` like every humanized pause.
+"""
+
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass
+from typing import Any
+
+from . import human
+from .config import ScraperConfig
+from .metrics import METRICS
+
+# Selenium's default script timeout is 30 s; longer sequences are split into several calls.
+MAX_BATCH_S = 20.0
+
+# arguments: element, text, delays in seconds (one per character), callback
+TYPE_SCRIPT = """
+var el = arguments[0], keys = Array.from(arguments[1]), delays = arguments[2];
+var done = arguments[arguments.length - 1];
+function key(type, ch) {
+  el.dispatchEvent(new KeyboardEvent(type, {key: ch, bubbles: true, cancelable: true}));
+}
+el.focus();
+var i = 0;
+function next() {
+  if (i >= keys.length) { done(el.value); return; }
+  var ch = keys[i];
+  key("keydown", ch);
+  key("keypress", ch);
+  el.value += ch;
+  el.dispatchEvent(new InputEvent("input", {data: ch, inputType: "insertText", bubbles: true}));
+  key("keyup", ch);
+  setTimeout(next, delays[i++] * 1000);
+}
+next();
+"""
+
+
+@dataclass(frozen=True)
+class TypingProfile:
+    """Pause after each character, drawn uniformly from ``[min_delay_s, max_delay_s]``."""
+
+    min_delay_s: float = 0.05
+    max_delay_s: float = 0.3
+
+    @classmethod
+    def for_config(cls, config: ScraperConfig) -> TypingProfile:
+        return TYPING_PROFILES[config.typing_profile]
+
+    def delays(self, text: str) -> list[float]:
+        return [
+            random.uniform(self.min_delay_s, self.max_delay_s) * human.PAUSE_SCALE for _ in text
+        ]
+
+
+# Keyed by ``config.TYPING_MODES``
+TYPING_PROFILES = {
+    "human": TypingProfile(),
+    "fast": TypingProfile(min_delay_s=0.01, max_delay_s=0.04),
+    "instant": TypingProfile(min_delay_s=0.0, max_delay_s=0.0),
+}
+
+
+def keystroke_batches(text: str, delays: list[float]) -> list[tuple[str, list[float]]]:
+    """``text`` split so that no batch types for longer than ``MAX_BATCH_S``."""
+    batches: list[tuple[str, list[float]]] = []
+    start = 0
+    while start < len(text):
+        end, total = start + 1, delays[start]
+        while end < len(text) and total + delays[end] <= MAX_BATCH_S:
+            total += delays[end]
+            end += 1
+        batches.append((text[start:end], delays[start:end]))
+        start = end
+    return batches
+
+
+def type_text(driver: Any, element: Any, text: str, profile: TypingProfile) -> None:
+    """Type ``text`` into ``element`` with ``profile``'s timing; blocks until it is typed."""
+    for keys, delays in keystroke_batches(text, profile.delays(text)):
+        driver.execute_async_script(TYPE_SCRIPT, element, keys, delays)
+        METRICS.incr("typing_calls")
@@ -1,6 +1,16 @@
 from __future__ import annotations
 
+import logging
+
 
 def redact_query(query: str) -> str:
     tokens = [token for token in query.split() if token]
     return f"<redacted len={len(query)} tokens={len(tokens)}>"
+
+
+def setup_logging() -> None:
+    logging.basicConfig(
+        filename="scraper.log",
+        level=logging.INFO,
+        format="%(asctime)s - %(levelname)s - %(message)s",
+    )
@@ -0,0 +1,146 @@
+"""``merge`` subcommand: stitch per-shard CSV outputs back into input order."""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import logging
+from pathlib import Path
+from typing import Any
+
+from .io import (
+    SHARD_MODES,
+    count_csv_rows,
+    enumerate_csv_rows,
+    parse_columns_arg,
+    read_input_columns,
+    shard_of,
+)
+from .logging_utils import setup_logging
+from .sinks import OUTPUT_FORMATS, SinkWriter, infer_output_format, open_sink
+
+
+class _ShardReader:
+    def __init__(self, shard: int, path: Path) -> None:
+        self.shard = shard
+        self.path = path
+        self.header: list[str] | None = None
+        self._handle: Any = None
+        self._reader: Any = None
+
+    def next_row(self) -> list[str] | None:
+        if self._handle is None:
+            if not self.path.exists():
+                raise ValueError(f"Shard {self.shard} output not found: {self.path}")
+            self._handle = self.path.open("r", encoding="utf-8", newline="")
+            self._reader = csv.reader(self._handle)
+            self.header = next(self._reader, None)
+        return next(self._reader, None)
+
+    def close(self) -> None:
+        if self._handle is not None:
+            self._handle.close()
+
+
+def merge_shard_outputs(
+    *,
+    input_file: Path,
+    shard_outputs: list[Path],
+    output_file: Path,
+    delimiter: str,
+    has_header: bool,
+    columns: list[str] | None,
+    shard_mode: str = "hash",
+    output_format: str | None = None,
+) -> int:
+    """Merge CSV outputs of ``--shard 1/N .. N/N`` runs (given in shard order) into one file.
+
+    The shard of every input row is recomputed, so each output row is taken from the shard that
+    owns it. Raises ``ValueError`` when a shard output is not CSV, is missing rows, has extra
+    (duplicated) rows or a row does not match the input row at that position, and when the
+    input has no rows (there would be no output file). Returns the number of merged rows.
+    """
+    count = len(shard_outputs)
+    if count < 1:
+        raise ValueError("merge needs at least one shard output")
+    for path in shard_outputs:
+        fmt = infer_output_format(path)
+        if fmt != "csv":
+            raise ValueError(
+                f"merge reads CSV shard outputs only, got {fmt}: {path} "
+                "(run the shards with a .csv --output; merge --output-format sets the result's)"
+            )
+    input_columns = read_input_columns(
+        input_file, delimiter=delimiter, has_header=has_header, columns=columns
+    )
+    total = count_csv_rows(input_file, delimiter=delimiter, has_header=has_header, columns=columns)
+    if total == 0:
+        raise ValueError(f"Input has no rows, nothing to merge: {input_file}")
+    readers = [_ShardReader(i + 1, path) for i, path in enumerate(shard_outputs)]
+    writer: SinkWriter | None = None
+    merged = 0
+    try:
+        for position, row in enumerate_csv_rows(
+            input_file, delimiter=delimiter, has_header=has_header, columns=columns
+        ):
+            reader = readers[shard_of(position, row, count=count, mode=shard_mode, total=total) - 1]
+            out_row = reader.next_row()
+            if out_row is None:
+                raise ValueError(f"Shard {reader.shard} is missing input row {position}")
+            expected = [row.get(col, "") for col in input_columns]
+            if out_row[: len(expected)] != expected:
+                raise ValueError(
+                    f"Shard {reader.shard} row does not match input row {position} "
+                    "(duplicated, reordered or wrong --shard-mode?)"
+                )
+            if writer is None:
+                header = reader.header or [*input_columns, "Website", "Phone", "Email"]
+                writer = SinkWriter(open_sink(output_file, header, output_format=output_format))
+            writer.submit(position, out_row)
+            merged += 1
+        for reader in readers:
+            if reader.path.exists() and reader.next_row() is not None:
+                raise ValueError(f"Shard {reader.shard} has extra rows (duplicated input?)")
+    finally:
+        for reader in readers:
+            reader.close()
+        if writer is not None:
+            writer.close()
+    return merged
+
+
+def build_merge_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="humanized_selenium_scraper merge",
+        description="Merge --shard i/N outputs back into input order.",
+    )
+    parser.add_argument("shard_outputs", nargs="+", help="Shard output CSVs, in order 1..N.")
+    parser.add_argument("--input", default="input.csv", help="The unsharded input CSV.")
+    parser.add_argument("--output", default="output.csv", help="Merged output path.")
+    parser.add_argument("--output-format", choices=OUTPUT_FORMATS)
+    parser.add_argument("--delimiter", default=",", help="Input CSV delimiter (default: ',').")
+    parser.add_argument("--header", action="store_true", help="Input has a header row.")
+    parser.add_argument(
+        "--columns",
+        default="name,street,plz,city",
+        help="Column names for headerless CSV (comma-separated).",
+    )
+    parser.add_argument("--shard-mode", choices=SHARD_MODES, default="hash")
+    return parser
+
+
+def merge_main(argv: list[str]) -> int:
+    setup_logging()
+    args = build_merge_parser().parse_args(argv)
+    merged = merge_shard_outputs(
+        input_file=Path(args.input),
+        shard_outputs=[Path(p) for p in args.shard_outputs],
+        output_file=Path(args.output),
+        delimiter=args.delimiter,
+        has_header=args.header,
+        columns=parse_columns_arg(args.columns) if not args.header else None,
+        shard_mode=args.shard_mode,
+        output_format=args.output_format,
+    )
+    logging.info("Merged %s rows => %s", merged, args.output)
+    return 0
@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+import threading
+
+
+class Metrics:
+    """Thread-safe named counters for one scraper run (page loads, searches, rows, ...)."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._counters: dict[str, float] = {}
+
+    def incr(self, name: str, amount: float = 1) -> None:
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + amount
+
+    def get(self, name: str) -> float:
+        with self._lock:
+            return self._counters.get(name, 0)
+
+    def snapshot(self) -> dict[str, float]:
+        with self._lock:
+            return dict(self._counters)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counters.clear()
+
+    def summary(self) -> str:
+        items = sorted(self.snapshot().items())
+        return " ".join(f"{name}={value:g}" for name, value in items)
+
+
+METRICS = Metrics()
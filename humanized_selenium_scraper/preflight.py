@@ -0,0 +1,125 @@
+"""Cheap HTTP check of a candidate URL before the browser spends a navigation on it.
+
+A pooled ``HEAD`` request (a one-byte ranged ``GET`` where servers refuse ``HEAD``) follows
+redirects to the final URL and reads the real content type. Unreachable hosts, dead links and
+non-HTML targets (PDFs and binaries behind extensionless URLs) are ruled out within a short
+timeout instead of a full page load. Anything inconclusive (bot protection, slow responses,
+certificates the browser might still accept) is left to the browser.
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from urllib.parse import urljoin
+
+import urllib3
+from urllib3.exceptions import (
+    ConnectTimeoutError,
+    HTTPError,
+    MaxRetryError,
+    NameResolutionError,
+    NewConnectionError,
+)
+
+from .config import ScraperConfig
+from .retry import FAILURE_CONNECTION, FAILURE_DNS, FAILURE_HTTP_4XX, FAILURE_TIMEOUT
+
+# Not a failure kind of ``retry``: the host is fine, the target just is no web page.
+NOT_HTML = "not_html"
+
+# Statuses that mean the link is dead; others (403, 405, 429, 5xx) may be bot protection.
+_DEAD_STATUSES = frozenset({404, 410})
+_HEAD_REFUSED = frozenset({400, 403, 405, 501})
+_HTML_TYPES = ("text/html", "application/xhtml+xml", "text/plain")
+
+
+@dataclass(frozen=True)
+class PreflightResult:
+    url: str
+    final_url: str
+    status: int | None = None
+    content_type: str = ""
+    # A ``retry`` failure kind or ``NOT_HTML``; ``None`` when the browser should load it
+    failure: str | None = None
+
+
+def _failure_kind(exc: BaseException) -> str | None:
+    reason = exc.reason if isinstance(exc, MaxRetryError) else exc
+    if isinstance(reason, NameResolutionError):
+        return FAILURE_DNS
+    # Before ConnectTimeoutError, which it subclasses
+    if isinstance(reason, NewConnectionError):
+        return FAILURE_CONNECTION
+    if isinstance(reason, ConnectTimeoutError):
+        return FAILURE_TIMEOUT
+    # Read timeouts, TLS errors (Chrome may know intermediates we do not), protocol errors
+    return None
+
+
+class Preflight:
+    """Thread-safe, pooled preflight checks (one connection pool per host)."""
+
+    def __init__(
+        self,
+        *,
+        timeout_s: float = 5.0,
+        max_redirects: int = 5,
+        user_agent: str = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+        "(KHTML, like Gecko) Chrome/113.0.0.0 Safari/537.36",
+    ) -> None:
+        self._pool = urllib3.PoolManager(
+            num_pools=64,
+            maxsize=4,
+            headers={"User-Agent": user_agent, "Accept": "text/html,*/*;q=0.8"},
+            timeout=urllib3.Timeout(connect=timeout_s, read=timeout_s),
+            retries=urllib3.Retry(total=None, connect=0, read=0, redirect=max_redirects),
+        )
+
+    @classmethod
+    def for_config(cls, config: ScraperConfig) -> Preflight | None:
+        """``None`` unless ``config.preflight``, and while replaying (there is no network)."""
+        if not config.preflight or config.replay_dir is not None:
+            return None
+        return cls(timeout_s=config.preflight_timeout_s)
+
+    def close(self) -> None:
+        self._pool.clear()
+
+    def _request(self, method: str, url: str, headers: dict[str, str]) -> tuple[int, str, str]:
+        resp = self._pool.request(method, url, headers=headers, preload_content=False)
+        final_url = url
+        if resp.retries is not None and resp.retries.history:
+            # Locations may be relative to the URL that answered with the redirect.
+            last = resp.retries.history[-1]
+            final_url = urljoin(last.url or url, last.redirect_location or "")
+        try:
+            return resp.status, final_url, resp.headers.get("Content-Type", "")
+        finally:
+            if method == "HEAD":
+                resp.drain_conn()
+                resp.release_conn()
+            else:
+                # The server may ignore the range; never download a whole binary.
+                resp.close()
+
+    def check(self, url: str) -> PreflightResult:
+        try:
+            status, final_url, content_type = self._request("HEAD", url, {})
+            if status in _HEAD_REFUSED:
+                status, final_url, content_type = self._request("GET", url, {"Range": "bytes=0-0"})
+        except HTTPError as exc:
+            kind = _failure_kind(exc)
+            if kind is not None:
+                logging.info("Preflight failed (%s) => %s", kind, url)
+            return PreflightResult(url, url, failure=kind)
+        failure = None
+        if status in _DEAD_STATUSES:
+            failure = FAILURE_HTTP_4XX
+        elif status < 300:
+            media_type = content_type.split(";", 1)[0].strip().lower()
+            if media_type and media_type not in _HTML_TYPES:
+                failure = NOT_HTML
+        if failure is not None:
+            logging.info("Preflight rejected (%s, %s %s) => %s", failure, status, content_type, url)
+        return PreflightResult(url, final_url, status, content_type, failure)
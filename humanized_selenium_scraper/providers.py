@@ -0,0 +1,206 @@
+"""Where browsers come from: local Chrome, one remote WebDriver, or a fleet of endpoints.
+
+``create_driver`` asks the provider for ``config.driver_backend``. Remote backends speak the
+W3C WebDriver protocol (``chromedriver --port``, Selenium standalone server or Grid), so the
+browsers can live on other nodes than the orchestrator.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import random
+import threading
+import time
+import urllib.request
+from collections.abc import Callable
+from functools import partial
+from pathlib import Path
+from typing import Any
+
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service
+
+from .config import ScraperConfig
+
+
+def chrome_options(config: ScraperConfig, *, profile_dir: Path | None) -> Options:
+    """Random user agent and window size; a user-data-dir only for browsers on this host."""
+    user_agents = config.user_agents or [
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+        "(KHTML, like Gecko) Chrome/113.0.0.0 Safari/537.36"
+    ]
+    window_sizes = config.window_sizes or [(1280, 720)]
+    user_agent = random.choice(user_agents)
+    width, height = random.choice(window_sizes)
+
+    chrome_opts = Options()
+    if profile_dir is not None:
+        os.makedirs(profile_dir, exist_ok=True)
+        chrome_opts.add_argument(f"--user-data-dir={profile_dir}")
+    chrome_opts.add_argument(f"--user-agent={user_agent}")
+    chrome_opts.add_argument(f"--window-size={width},{height}")
+    return chrome_opts
+
+
+def _configure(driver: Any, config: ScraperConfig) -> Any:
+    """Page load timeout; implicit waits stay off unless configured (``waits`` does waiting)."""
+    driver.set_page_load_timeout(config.page_load_timeout_s)
+    driver.implicitly_wait(config.implicit_wait_s)
+    return driver
+
+
+def connect_remote(url: str, options: Options) -> Any:
+    return webdriver.Remote(command_executor=url, options=options)
+
+
+def endpoint_status(url: str, *, timeout_s: float = 3.0) -> dict[str, Any] | None:
+    """The ``value`` of ``GET {url}/status``, or ``None`` if the endpoint does not answer."""
+    try:
+        with urllib.request.urlopen(f"{url.rstrip('/')}/status", timeout=timeout_s) as resp:
+            payload = json.load(resp)
+    except (OSError, ValueError) as exc:
+        logging.warning("WebDriver endpoint unreachable => %s (%s)", url, exc)
+        return None
+    value = payload.get("value") if isinstance(payload, dict) else None
+    return value if isinstance(value, dict) else None
+
+
+class LocalChromeProvider:
+    """Today's behavior: a ``webdriver.Chrome`` on this host with its own profile directory."""
+
+    def create(self, config: ScraperConfig, *, profile_dir: Path) -> Any:
+        options = chrome_options(config, profile_dir=profile_dir)
+        return _configure(webdriver.Chrome(service=Service(), options=options), config)
+
+
+class RemoteProvider:
+    """Every browser is a new session on one remote WebDriver URL."""
+
+    def __init__(
+        self, url: str, *, connect: Callable[[str, Options], Any] = connect_remote
+    ) -> None:
+        self.url = url
+        self._connect = connect
+
+    def create(self, config: ScraperConfig, *, profile_dir: Path) -> Any:
+        # The profile path is local to the orchestrator; the remote browser uses its own.
+        options = chrome_options(config, profile_dir=None)
+        return _configure(self._connect(self.url, options), config)
+
+
+class _Lease:
+    """Delegating driver that returns its endpoint slot to the grid on ``quit``."""
+
+    def __init__(self, driver: Any, release: Callable[[], None]) -> None:
+        self._driver = driver
+        self._release: Callable[[], None] | None = release
+
+    def quit(self) -> None:
+        try:
+            self._driver.quit()
+        finally:
+            if self._release is not None:
+                self._release()
+                self._release = None
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._driver, name)
+
+
+class GridProvider:
+    """Least-loaded assignment over several WebDriver endpoints with health checks.
+
+    An endpoint is used while ``/status`` reports ``ready``. Status is checked at most every
+    ``health_ttl_s`` seconds, and immediately after a session could not be created there.
+    Load is the number of live sessions this process opened on the endpoint.
+    """
+
+    def __init__(
+        self,
+        urls: tuple[str, ...],
+        *,
+        health_ttl_s: float = 30.0,
+        connect: Callable[[str, Options], Any] = connect_remote,
+        status: Callable[[str], dict[str, Any] | None] = endpoint_status,
+    ) -> None:
+        if not urls:
+            raise ValueError("grid backend needs at least one WebDriver URL")
+        self.urls = urls
+        self.health_ttl_s = health_ttl_s
+        self._connect = connect
+        self._status = status
+        self._lock = threading.Lock()
+        self._load = dict.fromkeys(urls, 0)
+        self._ready: dict[str, tuple[bool, float]] = {}
+
+    def load(self) -> dict[str, int]:
+        with self._lock:
+            return dict(self._load)
+
+    def _is_ready(self, url: str) -> bool:
+        with self._lock:
+            checked = self._ready.get(url)
+        if checked is not None and time.monotonic() - checked[1] < self.health_ttl_s:
+            return checked[0]
+        # The status request itself runs unlocked; concurrent checks of one URL are harmless.
+        status = self._status(url)
+        ready = bool(status and status.get("ready", False))
+        with self._lock:
+            self._ready[url] = (ready, time.monotonic())
+        if not ready:
+            logging.warning("WebDriver endpoint not ready => %s", url)
+        return ready
+
+    def _pick(self, exclude: set[str]) -> str | None:
+        with self._lock:
+            candidates = sorted(
+                (u for u in self.urls if u not in exclude), key=lambda u: self._load[u]
+            )
+        # Health checks may wait on the network; other sessions keep picking meanwhile.
+        for url in candidates:
+            if self._is_ready(url):
+                with self._lock:
+                    self._load[url] += 1
+                return url
+        return None
+
+    def _release(self, url: str, *, failed: bool = False) -> None:
+        with self._lock:
+            self._load[url] = max(self._load[url] - 1, 0)
+            if failed:
+                # Check the endpoint's status again before the next session goes there.
+                self._ready.pop(url, None)
+
+    def create(self, config: ScraperConfig, *, profile_dir: Path) -> Any:
+        tried: set[str] = set()
+        while (url := self._pick(tried)) is not None:
+            tried.add(url)
+            try:
+                driver = self._connect(url, chrome_options(config, profile_dir=None))
+            except Exception as exc:
+                logging.warning("WebDriver session failed => %s (%s)", url, exc)
+                self._release(url, failed=True)
+                continue
+            return _Lease(_configure(driver, config), partial(self._release, url))
+        raise RuntimeError(f"No ready WebDriver endpoint among {len(self.urls)}")
+
+
+_GRIDS: dict[tuple[str, ...], GridProvider] = {}
+_GRIDS_LOCK = threading.Lock()
+
+
+def provider_for(config: ScraperConfig) -> LocalChromeProvider | RemoteProvider | GridProvider:
+    """Provider for ``config.driver_backend``; grid providers are shared per URL list, so all
+    sessions of a process see the same endpoint load."""
+    if config.driver_backend == "remote":
+        return RemoteProvider(config.webdriver_urls[0])
+    if config.driver_backend == "grid":
+        with _GRIDS_LOCK:
+            grid = _GRIDS.get(config.webdriver_urls)
+            if grid is None:
+                grid = _GRIDS[config.webdriver_urls] = GridProvider(config.webdriver_urls)
+            return grid
+    return LocalChromeProvider()
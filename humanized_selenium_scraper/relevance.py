@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import dataclass
+
 
 def normalize_address_part(text: str) -> str:
     """Lowercase and normalize for matching (umlauts, German street variants)."""
@@ -20,11 +23,22 @@ def tokenize_address_component(text: str) -> list[str]:
 
 
 def address_score(page_source: str, street: str, plz: str, city: str) -> int:
-    page_normalized = normalize_address_part(page_source)
-    street_tokens = tokenize_address_component(street)
-    zip_tokens = tokenize_address_component(plz)
-    city_tokens = tokenize_address_component(city)
+    return address_score_normalized(
+        normalize_address_part(page_source),
+        street_tokens=tokenize_address_component(street),
+        zip_tokens=tokenize_address_component(plz),
+        city_tokens=tokenize_address_component(city),
+    )
+
 
+def address_score_normalized(
+    page_normalized: str,
+    *,
+    street_tokens: Sequence[str],
+    zip_tokens: Sequence[str],
+    city_tokens: Sequence[str],
+) -> int:
+    """``address_score`` on an already normalized page with pre-tokenized address parts."""
     score = 0
     if (
         zip_tokens
@@ -50,16 +64,82 @@ def is_address_present(
 
 
 def keyword_hits(page_source: str, keywords: list[str]) -> int:
-    page_normalized = normalize_address_part(page_source)
-    return sum(page_normalized.count(kw.lower()) for kw in keywords if kw)
+    return keyword_hits_normalized(
+        normalize_address_part(page_source), [kw.lower() for kw in keywords if kw]
+    )
+
+
+def keyword_hits_normalized(page_normalized: str, keywords: Sequence[str]) -> int:
+    """Occurrences of already lowercased ``keywords`` in an already normalized page."""
+    return sum(page_normalized.count(kw) for kw in keywords)
 
 
 def has_min_keyword_hits(page_source: str, keywords: list[str], *, min_total_hits: int) -> bool:
     return keyword_hits(page_source, keywords) >= min_total_hits
 
 
+# Chunk size for evaluating a page string incrementally
+PAGE_CHUNK_CHARS = 64 * 1024
+# normalize_address_part only rewrites runs of letters and ".", so text may be normalized
+# piecewise when every piece ends at one of these characters.
+_NORMALIZE_BOUNDARIES = (" ", "\n", "\t", "\r", "<", ">")
+
+
+@dataclass(frozen=True)
+class PageVerdict:
+    relevant: bool
+    # Characters of the page read before the verdict was certain
+    chars_examined: int
+    keyword_hits: int
+    address_score: int
+
+
+def iter_page_chunks(page_source: str, size: int = PAGE_CHUNK_CHARS) -> Iterator[str]:
+    for start in range(0, len(page_source), size):
+        yield page_source[start : start + size]
+
+
+def iter_normalized(chunks: Iterable[str]) -> Iterator[tuple[str, int]]:
+    """Normalize a chunked page piecewise; yields ``(normalized piece, raw chars consumed)``.
+
+    The concatenated pieces equal ``normalize_address_part`` of the whole page; a chunk is
+    cut at its last boundary character and the rest carried into the next chunk.
+    """
+    carry = ""
+    for chunk in chunks:
+        buf = carry + chunk
+        cut = max(buf.rfind(ch) for ch in _NORMALIZE_BOUNDARIES) + 1
+        if cut <= 0:
+            carry = buf
+            continue
+        carry = buf[cut:]
+        yield normalize_address_part(buf[:cut]), cut
+    if carry:
+        yield normalize_address_part(carry), len(carry)
+
+
+class _StreamCount:
+    """Non-overlapping occurrences of ``needle`` across pieces, as ``str.count`` on the whole."""
+
+    def __init__(self, needle: str) -> None:
+        self.needle = needle
+        self.count = 0
+        self._carry = ""
+
+    def feed(self, piece: str, *, limit: int) -> None:
+        window = self._carry + piece
+        step = len(self.needle)
+        end = 0
+        found = window.find(self.needle)
+        while found >= 0 and self.count < limit:
+            self.count += 1
+            end = found + step
+            found = window.find(self.needle, end)
+        self._carry = window[max(end, len(window) - step + 1) :]
+
+
 def evaluate_page(
-    page_source: str,
+    page_source: str | Iterable[str],
     *,
     keywords: list[str],
     min_keyword_hits: int,
@@ -69,8 +149,119 @@ def evaluate_page(
     city: str = "",
     address_min_score: int = 2,
 ) -> bool:
-    if not has_min_keyword_hits(page_source, keywords, min_total_hits=min_keyword_hits):
-        return False
-    if not require_address:
-        return True
-    return is_address_present(page_source, street, plz, city, min_score=address_min_score)
+    """Keyword threshold plus (optionally) address match; ``page_source`` may be chunked."""
+    chunks = iter_page_chunks(page_source) if isinstance(page_source, str) else page_source
+    verdict = evaluate_chunks(
+        chunks,
+        keywords=[kw.lower() for kw in keywords if kw],
+        min_keyword_hits=min_keyword_hits,
+        require_address=require_address,
+        street_tokens=tokenize_address_component(street),
+        zip_tokens=tokenize_address_component(plz),
+        city_tokens=tokenize_address_component(city),
+        address_min_score=address_min_score,
+    )
+    return verdict.relevant
+
+
+def evaluate_chunks(
+    chunks: Iterable[str],
+    *,
+    keywords: Sequence[str],
+    min_keyword_hits: int,
+    require_address: bool,
+    street_tokens: Sequence[str] = (),
+    zip_tokens: Sequence[str] = (),
+    city_tokens: Sequence[str] = (),
+    address_min_score: int = 2,
+) -> PageVerdict:
+    """``evaluate_page`` over a page given as chunks; stops reading once the page passes.
+
+    ``keywords`` must be lowercased and the address parts tokenized. Keyword counting stops
+    at ``min_keyword_hits`` and every address token is searched only until first seen, so
+    ``keyword_hits`` is capped at the threshold. A failing page is always read to the end.
+    """
+    return PageEvaluator(
+        keywords=keywords,
+        min_keyword_hits=min_keyword_hits,
+        require_address=require_address,
+        street_tokens=street_tokens,
+        zip_tokens=zip_tokens,
+        city_tokens=city_tokens,
+        address_min_score=address_min_score,
+    ).feed(chunks)
+
+
+class PageEvaluator:
+    """``evaluate_chunks`` that keeps its hits and seen address tokens between ``feed`` calls,
+    so text added to a page later can be evaluated without reading the page again.
+
+    Matches do not span two ``feed`` calls; ``chars_examined`` counts the latest call only.
+    """
+
+    def __init__(
+        self,
+        *,
+        keywords: Sequence[str],
+        min_keyword_hits: int,
+        require_address: bool,
+        street_tokens: Sequence[str] = (),
+        zip_tokens: Sequence[str] = (),
+        city_tokens: Sequence[str] = (),
+        address_min_score: int = 2,
+    ) -> None:
+        self.keywords = [kw for kw in keywords if kw]
+        self.min_keyword_hits = min_keyword_hits
+        self.require_address = require_address
+        self.street_tokens = street_tokens
+        self.zip_tokens = zip_tokens
+        self.city_tokens = city_tokens
+        self.address_min_score = address_min_score
+        self.tokens = (
+            set(street_tokens) | set(zip_tokens) | set(city_tokens) if require_address else set()
+        )
+        self.seen: set[str] = set()
+        self.hits = 0
+
+    def score(self) -> int:
+        seen = self.seen
+        found = 0
+        if (
+            self.zip_tokens
+            and self.city_tokens
+            and seen.issuperset(self.zip_tokens)
+            and seen.issuperset(self.city_tokens)
+        ):
+            found += 2
+        if self.street_tokens and seen.issuperset(self.street_tokens):
+            found += 1
+        return found
+
+    def passed(self) -> bool:
+        if self.hits < self.min_keyword_hits:
+            return False
+        return not self.require_address or self.score() >= self.address_min_score
+
+    def feed(self, chunks: Iterable[str]) -> PageVerdict:
+        counters = [_StreamCount(kw) for kw in self.keywords]
+        tokens = self.tokens
+        seen = self.seen
+        overlap = max((len(t) for t in tokens), default=1) - 1
+        tail = ""
+        examined = 0
+        if not self.passed():
+            for piece, consumed in iter_normalized(chunks):
+                examined += consumed
+                if self.hits < self.min_keyword_hits:
+                    for counter in counters:
+                        before = counter.count
+                        counter.feed(piece, limit=self.min_keyword_hits)
+                        self.hits += counter.count - before
+                if tokens - seen:
+                    window = tail + piece
+                    seen.update(t for t in tokens - seen if t in window)
+                    tail = window[-overlap:] if overlap else ""
+                if self.passed():
+                    break
+        score = self.score() if self.require_address else 0
+        return PageVerdict(self.passed(), examined, self.hits, score)
@@ -0,0 +1,339 @@
+"""Failure classification, retry backoff and per-host health for page loads.
+
+``safe_get`` asks ``HostHealth`` before loading a URL and reports every outcome back:
+- Hosts that failed hard (DNS, TLS) go into a negative cache, optionally persisted across runs.
+- Hosts that keep timing out or returning 5xx pages trip a circuit breaker.
+Either way, later rows skip them at once instead of waiting for the same timeouts again.
+With ``retry_mode = "deferred"``, a transient failure moves the whole row to a ``RetryLane``
+instead of being retried in place.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import random
+import re
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from pathlib import Path
+from urllib.parse import urlparse
+
+from selenium.common.exceptions import TimeoutException
+
+from .config import ScraperConfig
+from .metrics import METRICS
+from .url_filter import url_host
+
+FAILURE_DNS = "dns"
+FAILURE_TLS = "tls"
+FAILURE_CONNECTION = "connection"
+FAILURE_TIMEOUT = "timeout"
+FAILURE_HTTP_4XX = "http_4xx"
+FAILURE_HTTP_5XX = "http_5xx"
+FAILURE_BLOCKED = "blocked"
+FAILURE_OTHER = "other"
+
+# Retrying these cannot help within one run; the host is cached as dead.
+HARD_FAILURES = frozenset({FAILURE_DNS, FAILURE_TLS})
+# Per-URL answers: the host itself is fine, the page is not worth retrying.
+PERMANENT_FAILURES = HARD_FAILURES | {FAILURE_HTTP_4XX, FAILURE_BLOCKED}
+
+_MESSAGE_KINDS = (
+    (FAILURE_DNS, ("ERR_NAME_NOT_RESOLVED", "ERR_NAME_RESOLUTION_FAILED", "DNS_PROBE")),
+    (FAILURE_TLS, ("ERR_CERT_", "ERR_SSL_", "SSL_ERROR", "ERR_BAD_SSL")),
+    (
+        FAILURE_CONNECTION,
+        (
+            "ERR_CONNECTION_REFUSED",
+            "ERR_CONNECTION_RESET",
+            "ERR_CONNECTION_CLOSED",
+            "ERR_ADDRESS_UNREACHABLE",
+            "ERR_EMPTY_RESPONSE",
+        ),
+    ),
+    (FAILURE_TIMEOUT, ("ERR_TIMED_OUT", "ERR_CONNECTION_TIMED_OUT", "timeout")),
+)
+# Whole-title matches only ("404", "Error 503", "404 Not Found"), so "500 Pizza" is a page.
+_STATUS_TITLE_RE = re.compile(
+    r"^\s*(?:(?:http\s*)?error\s*)?([45])\d\d(?:\s*[-:]?\s*(?:not found|forbidden|unauthorized"
+    r"|gone|too many requests|internal server error|bad gateway|service unavailable"
+    r"|gateway time-?out|error))?\s*$",
+    re.IGNORECASE,
+)
+
+
+def classify_failure(exc: BaseException) -> str:
+    """Failure kind of a WebDriver exception raised while loading a page."""
+    if isinstance(exc, TimeoutException):
+        return FAILURE_TIMEOUT
+    return classify_error_text(str(exc))
+
+
+def classify_error_text(text: str) -> str:
+    """Failure kind named by a Chrome network error code (``ERR_NAME_NOT_RESOLVED``, ...) in
+    an exception message or on Chrome's error page."""
+    for kind, markers in _MESSAGE_KINDS:
+        if any(marker in text for marker in markers):
+            return kind
+    return FAILURE_OTHER
+
+
+def classify_page(url: str, title: str) -> str | None:
+    """Failure kind of a page that loaded but is an error or block page, else ``None``.
+
+    Browsers do not expose the HTTP status, so error pages are recognized by their title
+    (``404 Not Found``, ``Error 503``); block pages by Google's ``/sorry/`` interstitial.
+    """
+    if urlparse(url).path.startswith("/sorry/"):
+        return FAILURE_BLOCKED
+    match = _STATUS_TITLE_RE.match(title or "")
+    if match is None:
+        return None
+    return FAILURE_HTTP_4XX if match.group(1) == "4" else FAILURE_HTTP_5XX
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """Exponential backoff with full jitter: attempt ``n`` waits up to ``base_s * 2**(n-1)``."""
+
+    base_s: float = 1.0
+    max_s: float = 30.0
+
+    def delay(self, attempt: int) -> float:
+        return random.uniform(0, min(self.max_s, self.base_s * 2 ** max(attempt - 1, 0)))
+
+    def retryable(self, kind: str) -> bool:
+        return kind not in PERMANENT_FAILURES
+
+
+@dataclass
+class CircuitBreaker:
+    """Opens after ``threshold`` consecutive failures; allows one trial after ``cooldown_s``."""
+
+    threshold: int = 3
+    cooldown_s: float = 300.0
+    failures: int = 0
+    opened_at: float | None = None
+
+    def allow(self, now: float) -> bool:
+        if self.opened_at is None:
+            return True
+        if now - self.opened_at >= self.cooldown_s:
+            # Half-open: let one load through; its outcome closes or re-opens the breaker.
+            self.opened_at = None
+            self.failures = self.threshold - 1
+            return True
+        return False
+
+    def record(self, ok: bool, now: float) -> None:
+        if ok:
+            self.failures = 0
+            self.opened_at = None
+            return
+        self.failures += 1
+        if self.failures >= self.threshold:
+            self.opened_at = now
+
+
+class DeadHostCache:
+    """Hosts that failed hard, each with an expiry; persisted as JSON when ``path`` is set.
+
+    Saving merges with the file's current content, so several processes can share one cache.
+    """
+
+    def __init__(self, path: Path | None = None, *, ttl_s: float = 24 * 3600) -> None:
+        self.path = path
+        self.ttl_s = ttl_s
+        self._hosts: dict[str, tuple[str, float]] = self._read()
+
+    def _read(self) -> dict[str, tuple[str, float]]:
+        if self.path is None or not self.path.exists():
+            return {}
+        try:
+            raw = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as exc:
+            logging.warning("Dead-host cache unreadable => %s (%s)", self.path, exc)
+            return {}
+        if not isinstance(raw, dict):
+            logging.warning("Dead-host cache unreadable => %s (not an object)", self.path)
+            return {}
+        now = time.time()
+        hosts: dict[str, tuple[str, float]] = {}
+        for host, entry in raw.items():
+            try:
+                kind, expires = entry
+                expiry = float(expires)
+            except (TypeError, ValueError):
+                logging.warning("Dead-host cache: bad entry ignored => %s", host)
+                continue
+            if expiry > now:
+                hosts[str(host)] = (str(kind), expiry)
+        return hosts
+
+    def reason(self, host: str) -> str | None:
+        found = self._hosts.get(host)
+        if found is None:
+            return None
+        if found[1] <= time.time():
+            del self._hosts[host]
+            return None
+        return found[0]
+
+    def add(self, host: str, kind: str) -> None:
+        self._hosts[host] = (kind, time.time() + self.ttl_s)
+        if self.path is not None:
+            self._save()
+
+    def _save(self) -> None:
+        assert self.path is not None
+        merged = {**self._read(), **self._hosts}
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(f".{self.path.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(merged), encoding="utf-8")
+        os.replace(tmp, self.path)
+
+    def __len__(self) -> int:
+        return len(self._hosts)
+
+
+@dataclass
+class HostHealth:
+    """Retry policy, per-host circuit breakers and the dead-host cache of one session."""
+
+    policy: RetryPolicy = field(default_factory=RetryPolicy)
+    dead: DeadHostCache = field(default_factory=DeadHostCache)
+    breaker_threshold: int = 3
+    breaker_cooldown_s: float = 300.0
+    _breakers: dict[str, CircuitBreaker] = field(default_factory=dict, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    @classmethod
+    def for_config(cls, config: ScraperConfig) -> HostHealth:
+        return cls(dead=DeadHostCache(config.dead_host_file))
+
+    def skip_reason(self, url: str) -> str | None:
+        """Why ``url`` should not be loaded now (dead host, open breaker), or ``None``."""
+        host = url_host(url)
+        if host is None:
+            return None
+        with self._lock:
+            kind = self.dead.reason(host)
+            if kind is not None:
+                return f"dead host ({kind})"
+            breaker = self._breakers.get(host)
+            if breaker is not None and not breaker.allow(time.monotonic()):
+                return "circuit open"
+        return None
+
+    def record(self, url: str, kind: str | None) -> None:
+        """Outcome of one load: ``None`` for success, else the failure kind."""
+        host = url_host(url)
+        if host is None:
+            return
+        with self._lock:
+            if kind in HARD_FAILURES:
+                self.dead.add(host, kind)
+                return
+            if kind in (FAILURE_HTTP_4XX, FAILURE_BLOCKED):
+                # The host answered; only this page (or this client) is refused.
+                return
+            breaker = self._breakers.get(host)
+            if breaker is None:
+                if kind is None:
+                    return
+                breaker = self._breakers[host] = CircuitBreaker(
+                    threshold=self.breaker_threshold, cooldown_s=self.breaker_cooldown_s
+                )
+            breaker.record(kind is None, time.monotonic())
+
+
+@dataclass(frozen=True, order=True)
+class DeferredRow:
+    ready_at: float
+    seq: int
+    row_index: int = field(compare=False)
+    row: dict[str, str] = field(compare=False)
+    attempt: int = field(compare=False)
+    host: str | None = field(default=None, compare=False)
+
+
+class RetryLane:
+    """Rows whose search failed transiently, to be searched again later in the run.
+
+    A row deferred after attempt ``n`` is ready ``cooldown_s * 2**(n-1)`` later. On top of
+    that, no row of a host is retried within ``cooldown_s`` of the latest failure on that
+    host, so the worker searches other rows instead of hammering one that is down right now.
+    Safe to share between threads.
+    """
+
+    def __init__(
+        self,
+        *,
+        cooldown_s: float,
+        max_attempts: int,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.cooldown_s = cooldown_s
+        self.max_attempts = max_attempts
+        self._clock = clock
+        self._rows: list[DeferredRow] = []
+        self._host_ready: dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def for_config(cls, config: ScraperConfig) -> RetryLane | None:
+        if config.retry_mode != "deferred":
+            return None
+        return cls(cooldown_s=config.retry_cooldown_s, max_attempts=config.max_retries)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._rows)
+
+    def defer(
+        self, seq: int, row_index: int, row: dict[str, str], *, attempt: int, url: str
+    ) -> bool:
+        """Schedule attempt ``attempt + 1``; ``False`` once ``max_attempts`` are used up."""
+        if attempt >= self.max_attempts:
+            METRICS.incr("deferred_exhausted")
+            return False
+        now = self._clock()
+        host = url_host(url)
+        ready_at = now + self.cooldown_s * 2 ** (attempt - 1)
+        with self._lock:
+            if host is not None:
+                # Never shortened: a later failure only pushes the host's cool-down further out.
+                cooled = max(self._host_ready.get(host, now), now + self.cooldown_s)
+                self._host_ready[host] = cooled
+            self._rows.append(DeferredRow(ready_at, seq, row_index, row, attempt + 1, host))
+        METRICS.incr("rows_deferred")
+        return True
+
+    def _due_at(self, deferred: DeferredRow) -> float:
+        if deferred.host is None:
+            return deferred.ready_at
+        return max(deferred.ready_at, self._host_ready.get(deferred.host, 0.0))
+
+    def pop_ready(self) -> DeferredRow | None:
+        """The earliest-scheduled row whose own backoff and host cool-down have both passed."""
+        now = self._clock()
+        with self._lock:
+            due = [deferred for deferred in self._rows if self._due_at(deferred) <= now]
+            if not due:
+                return None
+            deferred = min(due)
+            self._rows.remove(deferred)
+        METRICS.incr("deferred_attempts")
+        return deferred
+
+    def wait_s(self) -> float:
+        """Seconds until the next deferred row is ready (0 if one is, or none are left)."""
+        with self._lock:
+            if not self._rows:
+                return 0.0
+            due_at = min(map(self._due_at, self._rows))
+        return max(due_at - self._clock(), 0.0)
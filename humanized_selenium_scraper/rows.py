@@ -0,0 +1,157 @@
+"""One row of a run: search it (or reuse a duplicate's result) and hand its output on.
+
+``run_row_steps`` is the pipeline for one row as step functions (see ``steps``): ``cli.run``
+runs it with ``run_row`` in its thread, ``aio.async_run`` awaits it on the event loop. Both
+front ends therefore share one pipeline; the shared state (deduper, retry lane, writer, host
+health) is thread-safe.
+"""
+
+from __future__ import annotations
+
+import logging
+
+from .dedup import QueryDeduper, SearchResult
+from .exceptions import RetryLaterError, SkipEntryError
+from .logging_utils import redact_query
+from .metrics import METRICS
+from .retry import RetryLane
+from .scraper import Session
+from .sinks import SinkWriter
+from .spec import SearchSpec, render_template
+from .steps import Steps, run_steps
+
+
+def search_row(
+    session: Session, spec: SearchSpec, row: dict[str, str], *, attempt: int = 1
+) -> SearchResult:
+    """Render the query for ``row`` and search it; errors propagate to the caller."""
+    return run_steps(search_row_steps(session, spec, row, attempt=attempt))
+
+
+def search_row_steps(
+    session: Session, spec: SearchSpec, row: dict[str, str], *, attempt: int = 1
+) -> Steps[SearchResult]:
+    query = render_template(spec.query_template, row).strip()
+    if not query:
+        raise ValueError("Rendered query is empty.")
+    logging.info("Processing query => %s", redact_query(query))
+    return (yield from session.search_steps(query=query, row=row, spec=spec, attempt=attempt))
+
+
+def process_row(
+    session: Session,
+    spec: SearchSpec,
+    row: dict[str, str],
+    input_columns: list[str],
+    dedup: QueryDeduper | None = None,
+    *,
+    attempt: int = 1,
+) -> tuple[list[str], bool]:
+    """Output row for ``row``: its input columns plus Website/Phone/Email (empty on failure),
+    and whether the browser was used.
+
+    With ``dedup``, a result already found for an identical query is reused; only definitive
+    results are cached. ``RetryLaterError`` propagates, so the caller can defer the row; the
+    row then still counts as pending for ``dedup`` (see ``QueryDeduper.release_row``).
+    """
+    return run_steps(process_row_steps(session, spec, row, input_columns, dedup, attempt=attempt))
+
+
+def process_row_steps(
+    session: Session,
+    spec: SearchSpec,
+    row: dict[str, str],
+    input_columns: list[str],
+    dedup: QueryDeduper | None = None,
+    *,
+    attempt: int = 1,
+) -> Steps[tuple[list[str], bool]]:
+    inputs = [row.get(col, "") for col in input_columns]
+    key = dedup.key(row) if dedup is not None else None
+    searched = False
+    try:
+        found = dedup.lookup(key) if dedup is not None and key is not None else None
+        if found is None:
+            searched = True
+            found = yield from search_row_steps(session, spec, row, attempt=attempt)
+            if dedup is not None and key is not None:
+                dedup.remember(key, found)
+        else:
+            METRICS.incr("dedup_hits")
+        found_url, phone, email = found
+        values = [*inputs, found_url or "", phone or "", email or ""]
+    except RetryLaterError:
+        raise
+    except SkipEntryError as exc:
+        logging.warning("SKIP => %s", exc)
+        values = [*inputs, "", "", ""]
+    except Exception as exc:
+        logging.warning("process_row failed: %s", exc)
+        values = [*inputs, "", "", ""]
+    if dedup is not None and key is not None:
+        dedup.release(key)
+    return values, searched
+
+
+def run_row(
+    session: Session,
+    spec: SearchSpec,
+    row: dict[str, str],
+    *,
+    seq: int,
+    row_index: int,
+    attempt: int,
+    input_columns: list[str],
+    writer: SinkWriter,
+    lane: RetryLane | None = None,
+    dedup: QueryDeduper | None = None,
+) -> bool:
+    """Process ``row`` and submit its output to ``writer``, or defer it to ``lane``.
+
+    Returns whether the output was written after a browser search, i.e. whether the caller
+    should pause before its next row.
+    """
+    return run_steps(
+        run_row_steps(
+            session,
+            spec,
+            row,
+            seq=seq,
+            row_index=row_index,
+            attempt=attempt,
+            input_columns=input_columns,
+            writer=writer,
+            lane=lane,
+            dedup=dedup,
+        )
+    )
+
+
+def run_row_steps(
+    session: Session,
+    spec: SearchSpec,
+    row: dict[str, str],
+    *,
+    seq: int,
+    row_index: int,
+    attempt: int,
+    input_columns: list[str],
+    writer: SinkWriter,
+    lane: RetryLane | None = None,
+    dedup: QueryDeduper | None = None,
+) -> Steps[bool]:
+    try:
+        values, searched = yield from process_row_steps(
+            session, spec, row, input_columns, dedup, attempt=attempt
+        )
+    except RetryLaterError as exc:
+        if lane is not None and lane.defer(seq, row_index, row, attempt=attempt, url=exc.url):
+            logging.info("Deferred row %s => %s", row_index, exc)
+            return False
+        logging.warning("SKIP => %s", exc)
+        values, searched = [*(row.get(col, "") for col in input_columns), "", "", ""], True
+        if dedup is not None:
+            dedup.release_row(row)
+    writer.submit(row_index, values, seq=seq)
+    METRICS.incr("rows")
+    return searched
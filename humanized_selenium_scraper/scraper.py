@@ -2,40 +2,187 @@ from __future__ import annotations
 
 import logging
 import random
-from dataclasses import dataclass
+from dataclasses import dataclass, field, replace
 from pathlib import Path
 from typing import Any
-from urllib.parse import urlparse
+from urllib.parse import urlencode, urlparse
 
-from selenium.common.exceptions import StaleElementReferenceException
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.support.ui import WebDriverWait
 
+from .analysis import AnalysisPool
+from .compiled import RowContext, compile_spec
 from .config import ScraperConfig
+from .consent import ConsentMemory, accept_cookie_consent
+from .cookies import CookieStore
 from .driver import create_driver
-from .exceptions import SkipEntryError
-from .extract_selenium import parse_phone_email_deep
-from .human import do_infinite_scrolling, human_type, random_pause
-from .relevance import evaluate_page
-from .selenium_ops import click_cookie_consent_if_present, safe_get
-from .spec import SearchSpec, render_templates
-from .url_filter import is_relevant_url
+from .exceptions import RetryLaterError, SearchFailedError, SkipEntryError
+from .extract_selenium import parse_phone_email_snapshot
+from .human import (
+    infinite_scrolling_steps,
+    page_height_steps,
+    random_pause_steps,
+    scroll_steps,
+    sleep_steps,
+)
+from .keystrokes import TypingProfile, type_text
+from .metrics import METRICS
+from .preflight import NOT_HTML, Preflight
+from .relevance import iter_page_chunks
+from .retry import FAILURE_TIMEOUT, HostHealth
+from .selenium_ops import check_loaded_steps, host_skipped, safe_get_steps
+from .snapshot import PageSnapshot, SnapshotLink, capture_html, capture_snapshot
+from .spec import SearchSpec
+from .steps import Steps, call, run_steps
+from .tabs import TabPipeline
+from .waits import WaitPolicy
 
 # Common legal/contact link labels (DE + EN) for subpage link priority
 IMPO_KEYWORDS = ("impressum", "kontakt", "datenschutz", "imprint", "contact", "privacy")
 
 
-def link_priority(element: Any) -> int:
-    try:
-        text = (element.text or "").lower()
-        href = (element.get_attribute("href") or "").lower()
-        if any(keyword in text or keyword in href for keyword in IMPO_KEYWORDS):
-            return 0
-    except Exception:
-        return 1
-    return 1
+def results_url(google_domain: str, query: str, *, num: int, language: str = "") -> str:
+    """Google's results page for ``query``, as the search form would submit it."""
+    params = {"q": query, "num": str(num)}
+    if language:
+        params["hl"] = language
+    return f"https://www.{google_domain}/search?{urlencode(params)}"
+
+
+def snapshot_link_priority(link: SnapshotLink) -> int:
+    text = link.text.lower()
+    href = link.href.lower()
+    return 0 if any(keyword in text or keyword in href for keyword in IMPO_KEYWORDS) else 1
+
+
+def is_candidate_url(href: str, ctx: RowContext) -> bool:
+    """Whether a SERP link is worth visiting (not a PDF, passes the URL filter)."""
+    if not href:
+        return False
+    if href.lower().endswith(".pdf"):
+        logging.info("skip pdf => %s", href)
+        return False
+    return ctx.is_relevant_url(href)
+
+
+def preflight_candidate(
+    preflight: Preflight | None, href: str, ctx: RowContext, health: HostHealth | None
+) -> str | None:
+    """The URL to load for a candidate: its final URL after redirects, or ``None`` if its host
+    is known to be bad, or the preflight rules it out or redirects it somewhere irrelevant."""
+    return run_steps(preflight_candidate_steps(preflight, href, ctx, health))
+
+
+def preflight_candidate_steps(
+    preflight: Preflight | None, href: str, ctx: RowContext, health: HostHealth | None
+) -> Steps[str | None]:
+    if host_skipped(health, href):
+        return None
+    if preflight is None:
+        return href
+    result = yield from call(preflight.check, href)
+    if result.failure is not None:
+        if health is not None and result.failure != NOT_HTML:
+            health.record(href, result.failure)
+        METRICS.incr("preflight_rejected")
+        return None
+    if result.final_url != href and not is_candidate_url(result.final_url, ctx):
+        logging.info("Preflight redirect leaves the filter => %s", result.final_url)
+        METRICS.incr("preflight_rejected")
+        return None
+    return result.final_url
+
+
+def _inserted_text(old: str, new: str) -> str | None:
+    """The text inserted into ``old`` to give ``new``, or ``None`` if ``new`` changed more than
+    one place."""
+    limit = min(len(old), len(new))
+    lo, hi = 0, limit
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if old[:mid] == new[:mid]:
+            lo = mid
+        else:
+            hi = mid - 1
+    prefix = lo
+    lo, hi = 0, limit - prefix
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if old[len(old) - mid :] == new[len(new) - mid :]:
+            lo = mid
+        else:
+            hi = mid - 1
+    if prefix + lo < len(old):
+        return None
+    return new[prefix : len(new) - lo]
+
+
+def scroll_and_evaluate(
+    driver: Any,
+    ctx: RowContext,
+    *,
+    max_scroll: int,
+    pause_s: float,
+    incremental: bool = False,
+) -> tuple[bool, PageSnapshot]:
+    """Scroll a loaded candidate page and decide relevance; returns the verdict and the
+    snapshot it was based on, so callers need not load or read the page again.
+
+    ``incremental`` evaluates after load and after each scroll step that loaded more content,
+    and stops scrolling as soon as the page passes; a failing page is still scrolled until
+    its height stops growing, since more content could change the outcome. A step reads only
+    the markup and evaluates just the text it added (the whole page if more than one place
+    changed); the full snapshot is taken once, when the page passes or scrolling ends.
+    """
+    return run_steps(
+        scroll_and_evaluate_steps(
+            driver, ctx, max_scroll=max_scroll, pause_s=pause_s, incremental=incremental
+        )
+    )
+
+
+def scroll_and_evaluate_steps(
+    driver: Any,
+    ctx: RowContext,
+    *,
+    max_scroll: int,
+    pause_s: float,
+    incremental: bool = False,
+) -> Steps[tuple[bool, PageSnapshot]]:
+    if not incremental:
+        yield from infinite_scrolling_steps(driver, max_scroll=max_scroll, pause_s=pause_s)
+        snapshot = yield from call(capture_snapshot, driver)
+        passed = yield from call(ctx.evaluate_page, snapshot.html)
+        return passed, snapshot
+
+    snapshot = yield from call(capture_snapshot, driver)
+    evaluator = ctx.page_evaluator()
+    verdict = yield from call(
+        ctx.evaluate_chunks, iter_page_chunks(snapshot.html), evaluator=evaluator
+    )
+    if verdict.relevant:
+        METRICS.incr("scroll_steps_skipped", max_scroll)
+        return True, snapshot
+    html = snapshot.html
+    height = yield from page_height_steps(driver)
+    for step in range(1, max_scroll + 1):
+        grown_height = yield from scroll_steps(driver, height, pause_s)
+        if grown_height is None:
+            break
+        height = grown_height
+        grown = yield from call(capture_html, driver)
+        added = _inserted_text(html, grown)
+        if added is None:
+            evaluator, added = ctx.page_evaluator(), grown
+        html = grown
+        verdict = yield from call(ctx.evaluate_chunks, iter_page_chunks(added), evaluator=evaluator)
+        if verdict.relevant:
+            METRICS.incr("scroll_steps_skipped", max_scroll - step)
+            return True, (yield from call(capture_snapshot, driver))
+    if html is not snapshot.html:
+        snapshot = yield from call(capture_snapshot, driver)
+    return False, snapshot
 
 
 def search_subpages(
@@ -48,46 +195,102 @@ def search_subpages(
     max_depth: int,
     query: str,
     attempt: int = 1,
+    context: RowContext | None = None,
+    health: HostHealth | None = None,
 ) -> str | None:
+    ctx = context or compile_spec(spec).row_context(row, query=query)
+    found = find_relevant_subpage(
+        driver,
+        config,
+        base_url=base_url,
+        spec=spec,
+        max_depth=max_depth,
+        ctx=ctx,
+        attempt=attempt,
+        health=health,
+    )
+    return found[0] if found is not None else None
+
+
+def find_relevant_subpage(
+    driver: Any,
+    config: ScraperConfig,
+    *,
+    base_url: str,
+    spec: SearchSpec,
+    max_depth: int,
+    ctx: RowContext,
+    attempt: int = 1,
+    snapshot: PageSnapshot | None = None,
+    health: HostHealth | None = None,
+) -> tuple[str, PageSnapshot] | None:
+    """Same-domain BFS from ``base_url``; returns the first relevant URL and its snapshot.
+
+    Pass ``snapshot`` when ``base_url`` is already loaded and scrolled to skip reloading it.
+    With ``health``, the BFS stops once the host is known to be down.
+    """
+    return run_steps(
+        find_relevant_subpage_steps(
+            driver,
+            config,
+            base_url=base_url,
+            spec=spec,
+            max_depth=max_depth,
+            ctx=ctx,
+            attempt=attempt,
+            snapshot=snapshot,
+            health=health,
+        )
+    )
+
+
+def find_relevant_subpage_steps(
+    driver: Any,
+    config: ScraperConfig,
+    *,
+    base_url: str,
+    spec: SearchSpec,
+    max_depth: int,
+    ctx: RowContext,
+    attempt: int = 1,
+    snapshot: PageSnapshot | None = None,
+    health: HostHealth | None = None,
+) -> Steps[tuple[str, PageSnapshot] | None]:
     if base_url.lower().endswith(".pdf"):
         logging.info("Skip PDF subpage => %s", base_url)
         return None
 
-    if not safe_get(driver, config, base_url, attempt=attempt):
-        return None
-
-    do_infinite_scrolling(driver, max_scroll=3, pause_s=1.2)
-    page_source = driver.page_source
-    keywords = [k.lower() for k in render_templates(spec.relevance.keyword_templates, row)]
-    if evaluate_page(
-        page_source,
-        keywords=keywords,
-        min_keyword_hits=spec.relevance.min_total_keyword_hits,
-        require_address=spec.relevance.require_address,
-        street=row.get(spec.relevance.address.street_field, ""),
-        plz=row.get(spec.relevance.address.zip_field, ""),
-        city=row.get(spec.relevance.address.city_field, ""),
-        address_min_score=spec.relevance.address.min_score,
-    ):
-        return base_url
+    if snapshot is not None:
+        passed = yield from call(ctx.evaluate_page, snapshot.html)
+    else:
+        try:
+            if not (
+                yield from safe_get_steps(driver, config, base_url, attempt=attempt, health=health)
+            ):
+                return None
+        except RetryLaterError as exc:
+            # The candidate itself already passed; a subpage that is down is just skipped.
+            logging.info("Skip subpage => %s", exc)
+            return None
+        passed, snapshot = yield from scroll_and_evaluate_steps(
+            driver,
+            ctx,
+            max_scroll=3,
+            pause_s=1.2,
+            incremental=spec.navigation.incremental_relevance,
+        )
+    if passed:
+        return base_url, snapshot
 
     if max_depth <= 0:
         return None
 
     visited: set[str] = set()
     max_links = spec.navigation.max_links_per_page
-    links = driver.find_elements(By.TAG_NAME, "a")[:max_links]
-    links_sorted = sorted(links, key=link_priority)
-
-    for _idx, link in enumerate(links_sorted):
-        try:
-            href = link.get_attribute("href")
-        except StaleElementReferenceException as exc:
-            logging.warning("Stale subpage BFS => attempt=%s, skipping link", attempt)
-            if attempt >= config.max_retries:
-                raise SkipEntryError("subpages => stale => skip") from exc
-            href = None
+    links_sorted = sorted(snapshot.links[:max_links], key=snapshot_link_priority)
 
+    for link in links_sorted:
+        href = link.href
         if not href:
             continue
         if href.lower().endswith(".pdf"):
@@ -101,18 +304,18 @@ def search_subpages(
             continue
 
         visited.add(href)
-        sub_url = search_subpages(
+        found = yield from find_relevant_subpage_steps(
             driver,
             config,
             base_url=href,
-            row=row,
             spec=spec,
             max_depth=max_depth - 1,
-            query=query,
+            ctx=ctx,
             attempt=attempt,
+            health=health,
         )
-        if sub_url is not None:
-            return sub_url
+        if found is not None:
+            return found
 
     return None
 
@@ -122,18 +325,67 @@ class Session:
     config: ScraperConfig
     driver: Any
     counter: int = 0
+    analysis: AnalysisPool | None = None
+    health: HostHealth = field(default_factory=HostHealth)
+    preflight: Preflight | None = None
+    consent: ConsentMemory = field(default_factory=ConsentMemory)
+    cookies: CookieStore | None = None
+    waits: WaitPolicy = field(default_factory=WaitPolicy)
+    typing: TypingProfile = field(default_factory=TypingProfile)
 
     @classmethod
-    def create(cls, config: ScraperConfig, *, profile_dir: Path) -> Session:
-        return cls(config=config, driver=create_driver(config, profile_dir=profile_dir))
+    def create(
+        cls,
+        config: ScraperConfig,
+        *,
+        profile_dir: Path,
+        analysis: AnalysisPool | None = None,
+        health: HostHealth | None = None,
+        preflight: Preflight | None = None,
+        cookies: CookieStore | None = None,
+    ) -> Session:
+        """Start a browser. The components passed in are shared with other sessions and closed
+        by the caller (see ``quit_driver``); the others are built from ``config``."""
+        driver = create_driver(config, profile_dir=profile_dir)
+        if analysis is None and config.analysis_workers > 0:
+            analysis = AnalysisPool(config.analysis_workers)
+        session = cls(
+            config=config,
+            driver=driver,
+            analysis=analysis,
+            health=health if health is not None else HostHealth.for_config(config),
+            preflight=preflight if preflight is not None else Preflight.for_config(config),
+            consent=ConsentMemory.for_profile(config, profile_dir),
+            cookies=cookies if cookies is not None else CookieStore.for_config(config),
+            waits=WaitPolicy.for_config(config),
+            typing=TypingProfile.for_config(config),
+        )
+        session.seed_cookies()
+        return session
 
-    def close(self) -> None:
+    def seed_cookies(self) -> None:
+        """Give a new browser the consent cookies of earlier ones, before it loads a page."""
+        if self.cookies is not None:
+            self.consent.seeded(self.cookies.seed(self.driver))
+
+    def quit_driver(self) -> None:
+        """Quit the browser only; sessions with shared components close with this."""
         try:
             self.driver.quit()
         except Exception:
             pass
 
+    def close(self) -> None:
+        self.quit_driver()
+        if self.analysis is not None:
+            self.analysis.close()
+        if self.preflight is not None:
+            self.preflight.close()
+
     def maybe_restart_driver(self, *, profile_dir: Path) -> None:
+        run_steps(self.maybe_restart_driver_steps(profile_dir=profile_dir))
+
+    def maybe_restart_driver_steps(self, *, profile_dir: Path) -> Steps[None]:
         if self.counter == 0:
             return
         if self.config.restart_threshold <= 0:
@@ -142,118 +394,272 @@ class Session:
             return
 
         logging.info("Restart driver => threshold")
-        new_driver = create_driver(self.config, profile_dir=profile_dir)
-        try:
-            self.driver.quit()
-        except Exception:
-            pass
+        new_driver = yield from call(create_driver, self.config, profile_dir=profile_dir)
+        yield from call(self.quit_driver)
         self.driver = new_driver
+        yield from call(self.seed_cookies)
 
-    def search(self, *, query: str, row: dict[str, str], spec: SearchSpec, attempt: int = 1):
-        self.maybe_restart_driver(profile_dir=self.config.chrome_profile_root)
-        self.counter += 1
-
-        google_url = f"https://www.{self.config.google_domain}/"
-        if not safe_get(self.driver, self.config, google_url, attempt=attempt):
-            return None, None, None
-
-        random_pause(1, 1.5)
+    def accept_consent_steps(self, host: str) -> Steps[bool]:
+        """``consent.accept_cookie_consent``; a failing probe is not worth failing the row."""
         try:
-            click_cookie_consent_if_present(self.driver)
+            clicked = yield from call(accept_cookie_consent, self.driver, self.consent, host)
         except Exception:
-            pass
+            return False
+        if clicked:
+            yield from sleep_steps(1)
+        return clicked
+
+    def search(
+        self,
+        *,
+        query: str,
+        row: dict[str, str],
+        spec: SearchSpec,
+        attempt: int = 1,
+        context: RowContext | None = None,
+    ) -> tuple[str | None, str | None, str | None]:
+        return run_steps(
+            self.search_steps(query=query, row=row, spec=spec, attempt=attempt, context=context)
+        )
 
-        try:
-            sb = WebDriverWait(self.driver, 10).until(EC.element_to_be_clickable((By.NAME, "q")))
-        except Exception as exc:
-            if attempt >= self.config.max_retries:
-                raise SkipEntryError("No search box => skip") from exc
-            return None, None, None
+    def search_steps(
+        self,
+        *,
+        query: str,
+        row: dict[str, str],
+        spec: SearchSpec,
+        attempt: int = 1,
+        context: RowContext | None = None,
+    ) -> Steps[tuple[str | None, str | None, str | None]]:
+        ctx = context or compile_spec(spec).row_context(row, query=query)
+        if self.analysis is not None:
+            ctx = replace(ctx, analysis=self.analysis)
+        yield from self.maybe_restart_driver_steps(profile_dir=self.config.chrome_profile_root)
+        self.counter += 1
+        METRICS.incr("searches")
+
+        host = f"www.{self.config.google_domain}"
+        if self.cookies is not None and not self.consent.is_given(host):
+            # Another browser of the run may have given consent since this one started.
+            yield from call(self.seed_cookies)
+        direct = spec.navigation.serp_mode == "direct"
+        # Google loads bypass ``self.health``: a breaker or dead-host entry for the search host
+        # would fail every row until it expires, not just one candidate.
+        if direct:
+            # One navigation straight to the results: no homepage, search box or typing.
+            serp_url = results_url(
+                self.config.google_domain,
+                query,
+                num=spec.navigation.max_google_results,
+                language=spec.navigation.serp_language,
+            )
+            if not (yield from safe_get_steps(self.driver, self.config, serp_url, attempt=attempt)):
+                raise SearchFailedError("Google did not load")
+            clicked = yield from self.accept_consent_steps(host)
+        else:
+            google_url = f"https://{host}/"
+            if not (
+                yield from safe_get_steps(self.driver, self.config, google_url, attempt=attempt)
+            ):
+                raise SearchFailedError("Google did not load")
+            yield from random_pause_steps(1, 1.5)
+            clicked = yield from self.accept_consent_steps(host)
 
-        human_type(sb, query)
-        random_pause(0.5, 1.0)
-        sb.send_keys(Keys.RETURN)
-        random_pause(1, 2)
+            try:
+                sb = yield from self.waits.until_steps(
+                    self.driver, "search_box", EC.element_to_be_clickable((By.NAME, "q"))
+                )
+            except Exception as exc:
+                # A banner we assumed to be accepted may be what hides the search box.
+                self.consent.forget(host)
+                if attempt >= self.config.max_retries:
+                    raise SkipEntryError("No search box => skip") from exc
+                raise SearchFailedError("No search box") from exc
+
+            yield from call(type_text, self.driver, sb, query, self.typing)
+            yield from random_pause_steps(0.5, 1.0)
+            yield from call(sb.send_keys, Keys.RETURN)
+            METRICS.incr("page_loads")
+            yield from random_pause_steps(1, 2)
 
         try:
-            WebDriverWait(self.driver, 8).until(EC.presence_of_element_located((By.ID, "search")))
+            yield from self.waits.until_steps(
+                self.driver, "results", EC.presence_of_element_located((By.ID, "search"))
+            )
         except Exception as exc:
+            if direct:
+                # Without a homepage, a consent interstitial shows up in place of the results.
+                self.consent.forget(host)
             if attempt >= self.config.max_retries:
                 raise SkipEntryError("No google results => skip") from exc
-            return None, None, None
-
-        do_infinite_scrolling(self.driver, max_scroll=2, pause_s=1.0)
-        glinks = self.driver.find_elements(By.XPATH, "//a[contains(@href,'http')]")
-        top = glinks[: spec.navigation.max_google_results]
-        random.shuffle(top)
-
-        for _idx, link in enumerate(top):
+            raise SearchFailedError("No google results") from exc
+        if clicked and self.cookies is not None:
+            yield from call(self.cookies.export, self.driver, host)
+
+        yield from infinite_scrolling_steps(self.driver, max_scroll=2, pause_s=1.0)
+        serp = yield from call(capture_snapshot, self.driver)
+        top = [link.href for link in serp.links if "http" in link.raw_href]
+        top = top[: spec.navigation.max_google_results]
+        # A replay visits candidates in SERP order, so two replays of one archive agree.
+        replaying = self.config.replay_dir is not None
+        if not replaying:
+            random.shuffle(top)
+
+        if spec.navigation.tab_pipeline > 1:
+            return (
+                yield from self._search_candidates_in_tabs(top, ctx=ctx, spec=spec, attempt=attempt)
+            )
+
+        # A candidate that failed transiently only defers the row if no other one matches.
+        deferred: RetryLaterError | None = None
+        for href in top:
+            if not is_candidate_url(href, ctx):
+                continue
+            target = yield from preflight_candidate_steps(self.preflight, href, ctx, self.health)
+            if target is None:
+                continue
+            href = target
             try:
-                href = link.get_attribute("href")
-            except StaleElementReferenceException as exc:
-                if attempt >= self.config.max_retries:
-                    raise SkipEntryError(f"stale google link => skip => {exc}") from exc
-                logging.warning("Stale google link => skipping (attempt=%s)", attempt)
-                href = None
-
-            if not href:
+                loaded = yield from safe_get_steps(
+                    self.driver, self.config, href, attempt=attempt, health=self.health
+                )
+            except RetryLaterError as exc:
+                deferred = exc
                 continue
-            if href.lower().endswith(".pdf"):
-                logging.info("skip pdf => %s", href)
+            if not loaded:
                 continue
 
-            if not is_relevant_url(
-                query,
-                href,
-                allowed_tlds=spec.url_filter.allowed_tlds,
-                domain_keyword_blacklist=spec.url_filter.domain_keyword_blacklist,
-                domain_match=spec.url_filter.domain_match,
-                min_query_part_len=spec.url_filter.min_query_part_len,
-            ):
-                continue
+            passed, snapshot = yield from scroll_and_evaluate_steps(
+                self.driver,
+                ctx,
+                max_scroll=3,
+                pause_s=1.2,
+                incremental=spec.navigation.incremental_relevance,
+            )
+            if passed:
+                return (
+                    yield from self._finish_candidate(
+                        href, snapshot, ctx=ctx, spec=spec, attempt=attempt
+                    )
+                )
 
-            if not safe_get(self.driver, self.config, href, attempt=attempt):
-                continue
+            if not replaying and random.random() < 0.7:
+                yield from call(self.driver.back)
+                METRICS.incr("history_back")
+                yield from random_pause_steps(0.7, 1.5)
 
-            do_infinite_scrolling(self.driver, max_scroll=3, pause_s=1.2)
-            ps = self.driver.page_source
-            keywords = [k.lower() for k in render_templates(spec.relevance.keyword_templates, row)]
-            if evaluate_page(
-                ps,
-                keywords=keywords,
-                min_keyword_hits=spec.relevance.min_total_keyword_hits,
-                require_address=spec.relevance.require_address,
-                street=row.get(spec.relevance.address.street_field, ""),
-                plz=row.get(spec.relevance.address.zip_field, ""),
-                city=row.get(spec.relevance.address.city_field, ""),
-                address_min_score=spec.relevance.address.min_score,
-            ):
-                sub_url = None
-                if spec.navigation.subpage_depth > 0:
-                    sub_url = search_subpages(
+        if deferred is not None:
+            raise deferred
+        return None, None, None
+
+    def _search_candidates_in_tabs(
+        self,
+        hrefs: list[str],
+        *,
+        ctx: RowContext,
+        spec: SearchSpec,
+        attempt: int,
+    ) -> Steps[tuple[str | None, str | None, str | None]]:
+        """Like the sequential candidate loop, but candidates load in background tabs.
+
+        The SERP tab is never navigated, so there is no ``back()``; losing tabs are closed.
+        Each tab goes through ``check_loaded`` like a ``safe_get`` load.
+        """
+        home = yield from call(getattr, self.driver, "current_window_handle")
+        pipeline = TabPipeline(
+            self.driver,
+            width=spec.navigation.tab_pipeline,
+            load_timeout_s=self.config.page_load_timeout_s,
+            home=home,
+        )
+        pending = iter(hrefs)
+
+        def next_candidate() -> Steps[str | None]:
+            for href in pending:
+                if not is_candidate_url(href, ctx):
+                    continue
+                target = yield from preflight_candidate_steps(
+                    self.preflight, href, ctx, self.health
+                )
+                if target is not None:
+                    return target
+            return None
+
+        deferred: RetryLaterError | None = None
+        try:
+            while (found := (yield from pipeline.next_steps(next_candidate))) is not None:
+                tab, ready = found
+                try:
+                    loaded = yield from check_loaded_steps(
                         self.driver,
                         self.config,
-                        base_url=href,
-                        row=row,
-                        spec=spec,
-                        max_depth=spec.navigation.subpage_depth,
-                        query=query,
+                        tab.url,
                         attempt=attempt,
+                        health=self.health,
+                        failure=None if ready else FAILURE_TIMEOUT,
                     )
-                target_url = sub_url or href
-                if safe_get(self.driver, self.config, target_url, attempt=attempt):
-                    do_infinite_scrolling(self.driver, max_scroll=1, pause_s=1.0)
-                    phone, email = None, None
-                    if spec.extract_phone or spec.extract_email:
-                        phone, email = parse_phone_email_deep(self.driver)
-                        if not spec.extract_phone:
-                            phone = None
-                        if not spec.extract_email:
-                            email = None
-                    return target_url, phone, email
-
-            if random.random() < 0.7:
-                self.driver.back()
-                random_pause(0.7, 1.5)
-
+                except RetryLaterError as exc:
+                    deferred = exc
+                    loaded = False
+                if loaded:
+                    passed, snapshot = yield from scroll_and_evaluate_steps(
+                        self.driver,
+                        ctx,
+                        max_scroll=3,
+                        pause_s=1.2,
+                        incremental=spec.navigation.incremental_relevance,
+                    )
+                    if passed:
+                        result = yield from self._finish_candidate(
+                            tab.url, snapshot, ctx=ctx, spec=spec, attempt=attempt
+                        )
+                        yield from call(pipeline.close_all)
+                        return result
+                yield from call(pipeline.close, tab)
+        except Exception:
+            yield from call(pipeline.close_all)
+            raise
+        yield from call(pipeline.close_all)
+        if deferred is not None:
+            raise deferred
         return None, None, None
+
+    def _finish_candidate(
+        self,
+        href: str,
+        snapshot: PageSnapshot,
+        *,
+        ctx: RowContext,
+        spec: SearchSpec,
+        attempt: int,
+    ) -> Steps[tuple[str, str | None, str | None]]:
+        """Subpage search and contact extraction for a relevant, still loaded candidate.
+
+        Extraction reads the winning page's snapshot; nothing is loaded again.
+        """
+        target_url, target = href, snapshot
+        if spec.navigation.subpage_depth > 0:
+            found = yield from find_relevant_subpage_steps(
+                self.driver,
+                self.config,
+                base_url=href,
+                spec=spec,
+                max_depth=spec.navigation.subpage_depth,
+                ctx=ctx,
+                attempt=attempt,
+                snapshot=snapshot,
+                health=self.health,
+            )
+            if found is not None:
+                target_url, target = found
+        phone, email = None, None
+        if spec.extract_phone or spec.extract_email:
+            if self.analysis is not None:
+                phone, email = yield from call(self.analysis.contacts, target)
+            else:
+                phone, email = yield from call(parse_phone_email_snapshot, target)
+            if not spec.extract_phone:
+                phone = None
+            if not spec.extract_email:
+                email = None
+        return target_url, phone, email
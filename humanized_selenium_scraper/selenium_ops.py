@@ -1,21 +1,29 @@
 from __future__ import annotations
 
 import logging
-import time
 
-from selenium.common.exceptions import (
-    ElementNotInteractableException,
-    TimeoutException,
-    WebDriverException,
-)
+from selenium.common.exceptions import ElementNotInteractableException, WebDriverException
 from selenium.webdriver import ActionChains
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.support.ui import WebDriverWait
 
 from .config import ScraperConfig
-from .exceptions import SkipEntryError
-from .human import random_pause
+from .exceptions import RetryLaterError, SkipEntryError
+from .human import sleep, sleep_steps
+from .metrics import METRICS
+from .retry import (
+    FAILURE_BLOCKED,
+    HostHealth,
+    RetryPolicy,
+    classify_error_text,
+    classify_failure,
+    classify_page,
+)
+from .steps import Steps, call, run_steps
+from .waits import WaitPolicy
+
+# Where Chrome shows its own error page (DNS, TLS, connection) instead of the site.
+NET_ERROR_URL_PREFIX = "chrome-error://"
 
 
 def click_element_robust(driver, elem, tries: int = 2) -> bool:
@@ -30,7 +38,7 @@ def click_element_robust(driver, elem, tries: int = 2) -> bool:
             )
             try:
                 driver.execute_script("arguments[0].scrollIntoView(true);", elem)
-                time.sleep(0.5)
+                sleep(0.5)
                 ActionChains(driver).move_to_element(elem).pause(0.5).click().perform()
                 return True
             except Exception as exc:
@@ -41,55 +49,137 @@ def click_element_robust(driver, elem, tries: int = 2) -> bool:
     return False
 
 
-def click_cookie_consent_if_present(driver) -> None:
-    # Selectors for common consent buttons (EN + DE wording)
-    possible_selectors = [
-        (
-            "//button[contains(translate(., 'ABCDEFGHIJKLMNOPQRSTUVWXYZ',"
-            "'abcdefghijklmnopqrstuvwxyz'),'akzeptieren')]"
-        ),
-        "//button[contains(.,'Alle akzeptieren')]",
-        "//button[contains(@id,'accept')]",
-        "//button[contains(.,'Zustimmen')]",
-        "//div[contains(.,'Zustimmen')]",
-        "//button[@aria-label='Accept all']",
-        "//button[contains(@class,'cookie') and contains(@class,'accept')]",
-    ]
-    for selector in possible_selectors:
-        try:
-            btn = WebDriverWait(driver, 3).until(EC.element_to_be_clickable((By.XPATH, selector)))
-            if click_element_robust(driver, btn, tries=2):
-                time.sleep(1)
-                logging.info("Cookie consent clicked by selector: %s", selector)
-                return
-        except Exception:
-            continue
-    logging.info("No matching cookie consent selector found (not critical).")
+def host_skipped(health: HostHealth | None, url: str) -> bool:
+    """Whether ``url``'s host is dead or its circuit is open (logged and counted)."""
+    if health is None or (reason := health.skip_reason(url)) is None:
+        return False
+    logging.info("Skipping %s => %s", reason, url)
+    METRICS.incr("hosts_skipped")
+    return True
 
 
-def safe_get(driver, config: ScraperConfig, url: str, *, attempt: int = 1) -> bool:
+def after_load_failure(
+    health: HostHealth | None,
+    config: ScraperConfig,
+    url: str,
+    kind: str,
+    *,
+    attempt: int,
+) -> float | None:
+    """Record a failed load; the backoff before the next attempt, or ``None`` to give up on
+    ``url``. Raises ``SkipEntryError`` for block pages and once attempts are exhausted, and
+    ``RetryLaterError`` instead of backing off in place with ``retry_mode = "deferred"``."""
+    policy = health.policy if health is not None else RetryPolicy()
+    if health is not None:
+        health.record(url, kind)
+    if kind == FAILURE_BLOCKED:
+        raise SkipEntryError(f"Blocked => {url}")
+    if not policy.retryable(kind):
+        logging.info("Skipping (%s) => %s", kind, url)
+        return None
+    if attempt >= config.max_retries:
+        raise SkipEntryError(f"Too many failures ({kind}) => {url}")
+    if config.retry_mode == "deferred":
+        raise RetryLaterError(url, kind)
+    if health is not None and health.skip_reason(url) is not None:
+        logging.info("Circuit open, not retrying => %s", url)
+        return None
+    METRICS.incr("retries")
+    return policy.delay(attempt)
+
+
+def safe_get(
+    driver,
+    config: ScraperConfig,
+    url: str,
+    *,
+    attempt: int = 1,
+    health: HostHealth | None = None,
+) -> bool:
+    """Load ``url`` and wait for its body; ``False`` if it is not worth loading (PDF, known-bad
+    host) or failed permanently (DNS, TLS, 4xx). Transient failures are retried with backoff."""
+    return run_steps(safe_get_steps(driver, config, url, attempt=attempt, health=health))
+
+
+def safe_get_steps(
+    driver,
+    config: ScraperConfig,
+    url: str,
+    *,
+    attempt: int = 1,
+    health: HostHealth | None = None,
+) -> Steps[bool]:
     if url.lower().endswith(".pdf"):
         logging.info("SKIP PDF => %s", url)
         return False
-    current_attempt = attempt
-    while True:
-        try:
-            driver.get(url)
-            WebDriverWait(driver, 10).until(EC.presence_of_element_located((By.TAG_NAME, "body")))
+    if host_skipped(health, url):
+        return False
+    waits = WaitPolicy.for_config(config)
+    METRICS.incr("page_loads")
+    failure = None
+    try:
+        yield from call(driver.get, url)
+        yield from waits.until_steps(
+            driver, "page_body", EC.presence_of_element_located((By.TAG_NAME, "body"))
+        )
+    except WebDriverException as exc:
+        failure = classify_failure(exc)
+        logging.warning("WebDriverException (%s) => %s (attempt=%s)", failure, exc, attempt)
+    return (
+        yield from check_loaded_steps(
+            driver, config, url, attempt=attempt, health=health, failure=failure
+        )
+    )
+
+
+def loaded_page_failure(driver) -> str | None:
+    """Failure kind of the page in the current tab, or ``None`` if it is real content.
+
+    Besides error and block pages this recognizes Chrome's network error page, which a tab
+    opened with ``window.open`` shows where ``driver.get`` would have raised.
+    """
+    url = driver.current_url
+    if url.startswith(NET_ERROR_URL_PREFIX):
+        return classify_error_text(driver.find_element(By.TAG_NAME, "body").text)
+    return classify_page(url, driver.title)
+
+
+def check_loaded(
+    driver,
+    config: ScraperConfig,
+    url: str,
+    *,
+    attempt: int = 1,
+    health: HostHealth | None = None,
+    failure: str | None = None,
+) -> bool:
+    """Second half of ``safe_get`` for a load of ``url`` that already happened (also in a
+    background tab): classify the current page, record the outcome in ``health`` and retry a
+    transient failure with ``safe_get``. Pass ``failure`` if the load itself failed."""
+    return run_steps(
+        check_loaded_steps(driver, config, url, attempt=attempt, health=health, failure=failure)
+    )
+
+
+def check_loaded_steps(
+    driver,
+    config: ScraperConfig,
+    url: str,
+    *,
+    attempt: int = 1,
+    health: HostHealth | None = None,
+    failure: str | None = None,
+) -> Steps[bool]:
+    kind = failure
+    if kind is None:
+        kind = yield from call(loaded_page_failure, driver)
+        if kind is None:
+            if health is not None:
+                health.record(url, None)
             return True
-        except WebDriverException as exc:
-            msg = str(exc)
-            if "ERR_CERT_DATE_INVALID" in msg:
-                logging.info("Skipping insecure (cert) => %s", url)
-                return False
-            logging.warning("WebDriverException => %s (attempt=%s)", msg, current_attempt)
-            if current_attempt >= config.max_retries:
-                raise SkipEntryError(f"Too many failures => {url}") from exc
-            random_pause(1, 1.5)
-            current_attempt += 1
-        except TimeoutException as exc:
-            logging.warning("Timeout => attempt=%s, url=%s", current_attempt, url)
-            if current_attempt >= config.max_retries:
-                raise SkipEntryError(f"Timeout x{config.max_retries} => {url}") from exc
-            random_pause(1, 1.5)
-            current_attempt += 1
+        logging.warning("Error page (%s) => %s (attempt=%s)", kind, url, attempt)
+    delay = after_load_failure(health, config, url, kind, attempt=attempt)
+    if delay is None:
+        return False
+    yield from sleep_steps(delay)
+    return (yield from safe_get_steps(driver, config, url, attempt=attempt + 1, health=health))
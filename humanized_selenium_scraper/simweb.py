@@ -0,0 +1,274 @@
+"""Offline simulated web: generated company sites and fake SERPs.
+
+Served to the in-memory ``emulation.FakeDriver``, it is used by the throughput harness
+(``benchmarks/throughput.py``) and by offline tests to drive ``cli.run`` / ``Session``
+end-to-end without a browser or network access. The same corpus can
+be served over plain HTTP (``SimWebServer``) for runs against a real headless Chrome.
+"""
+
+from __future__ import annotations
+
+import random
+import re
+import threading
+from collections.abc import Iterator
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+from urllib.parse import parse_qs, quote_plus, urlparse
+
+from .emulation import SimLink, SimPage
+
+_NAME_STEMS = (
+    "brenner",
+    "holzbau",
+    "autohaus",
+    "baeckerei",
+    "malerei",
+    "elektro",
+    "gartenbau",
+    "metallbau",
+)
+_CITIES = (
+    ("Berlin", "10115"),
+    ("Hamburg", "20095"),
+    ("Koeln", "50667"),
+    ("Leipzig", "04109"),
+    ("Dresden", "01067"),
+    ("Bremen", "28195"),
+)
+_STREETS = ("Hauptstrasse", "Bahnhofstrasse", "Gartenweg", "Lindenallee", "Marktplatz")
+_FILLER_WORDS = (
+    "qualitaet service angebot team erfahrung region kunden projekt beratung termin "
+    "leistung handwerk tradition zuverlaessig modern planung ausfuehrung"
+).split()
+_SITE_HOST_RE = re.compile(r"^[a-z]+(\d+)-[a-z]+\.de$")
+_SITE_PATHS = ("/", "/kontakt", "/impressum", "/leistungen", "/ueber-uns")
+CONSENT_MODES = ("every_visit", "once", "never")
+
+
+@dataclass(frozen=True)
+class SimCompany:
+    index: int
+    name: str
+    street: str
+    plz: str
+    city: str
+    host: str | None
+
+    def row(self) -> dict[str, str]:
+        return {"name": self.name, "street": self.street, "plz": self.plz, "city": self.city}
+
+
+class SimWeb:
+    """Deterministic, lazily generated site graph for ``companies`` input rows.
+
+    Each company has a website with probability ``hit_rate`` (home, contact, imprint and filler
+    pages). Its SERP lists the site between ``distractors`` decoy results: social profiles,
+    directory entries and city portals that pass or fail the URL filter but never the relevance
+    check. Nothing is stored per company, so 100k-row corpora cost no memory up front.
+    """
+
+    def __init__(
+        self,
+        *,
+        companies: int = 1000,
+        seed: int = 0,
+        hit_rate: float = 0.8,
+        distractors: int = 4,
+        filler_kb: int = 8,
+        consent: str = "every_visit",
+        google_domain: str = "google.com",
+    ) -> None:
+        if consent not in CONSENT_MODES:
+            raise ValueError(f"Unknown consent mode: {consent!r}")
+        self.companies = companies
+        self.seed = seed
+        self.hit_rate = hit_rate
+        self.distractors = distractors
+        self.consent = consent
+        self.google_host = f"www.{google_domain}"
+        rng = random.Random(seed)
+        words = [rng.choice(_FILLER_WORDS) for _ in range(max(filler_kb, 0) * 1024 // 8)]
+        self._filler = "\n".join(" ".join(words[i : i + 12]) for i in range(0, len(words), 12))
+
+    def company(self, index: int) -> SimCompany:
+        rng = random.Random(self.seed * 1_000_003 + index)
+        stem = rng.choice(_NAME_STEMS)
+        city, plz = rng.choice(_CITIES)
+        name = f"{stem.capitalize()}{index}"
+        street = f"{rng.choice(_STREETS)} {rng.randint(1, 120)}"
+        host = f"{name.lower()}-{city.lower()}.de" if rng.random() < self.hit_rate else None
+        return SimCompany(index=index, name=name, street=street, plz=plz, city=city, host=host)
+
+    def rows(self) -> Iterator[dict[str, str]]:
+        for index in range(self.companies):
+            yield self.company(index).row()
+
+    def resolve(self, url: str) -> SimPage | None:
+        """Return the page at ``url``, or ``None`` if its host does not exist."""
+        parsed = urlparse(url)
+        host = parsed.netloc.lower().split(":")[0]
+        path = parsed.path or "/"
+        if host == self.google_host:
+            if path == "/search":
+                return self.search(parse_qs(parsed.query).get("q", [""])[0])
+            return self._home_page(url)
+        match = _SITE_HOST_RE.match(host)
+        if match is None:
+            return self._distractor_page(url, host)
+        index = int(match.group(1))
+        if index >= self.companies:
+            return None
+        company = self.company(index)
+        if company.host != host:
+            return None
+        return self._site_page(company, url, path)
+
+    def search(self, query: str) -> SimPage:
+        tokens = query.lower().split()
+        company = None
+        for token in tokens:
+            stem = token.rstrip("0123456789")
+            digits = token[len(stem) :]
+            if stem.isalpha() and digits and int(digits) < self.companies:
+                company = self.company(int(digits))
+                break
+        links: list[SimLink] = []
+        if company is not None:
+            slug = company.name.lower()
+            city = company.city.lower()
+            decoys = [
+                SimLink(f"https://www.facebook.com/{slug}", f"{company.name} | Facebook"),
+                SimLink(f"https://branchenbuch-{city}.de/eintrag/{slug}", f"{company.name} ..."),
+                SimLink(f"https://www.stadtportal-{city}.de/news/{company.index}", "News"),
+                SimLink(f"https://news.example.org/{slug}", "Presse"),
+                SimLink(f"https://www.{slug}.invalid/", company.name),
+            ]
+            links.extend(decoys[: self.distractors])
+            if company.host is not None:
+                links.insert(len(links) // 2, SimLink(f"https://{company.host}/", company.name))
+        links.append(SimLink(f"https://{self.google_host}/preferences", "Einstellungen"))
+        return SimPage(
+            url=f"https://{self.google_host}/search?q={quote_plus(query)}",
+            title=f"{query} - Google Suche",
+            text=f"Ungefaehr {len(links)} Ergebnisse",
+            links=links,
+            kind="serp",
+        )
+
+    def _home_page(self, url: str) -> SimPage:
+        return SimPage(
+            url=url,
+            title="Google",
+            text="",
+            kind="home",
+            consent_banner=self.consent != "never",
+        )
+
+    def _site_page(self, company: SimCompany, url: str, path: str) -> SimPage:
+        base = f"https://{company.host}"
+        nav = [
+            SimLink(f"{base}/leistungen", "Leistungen"),
+            SimLink(f"{base}/ueber-uns", "Ueber uns"),
+            SimLink(f"{base}/kontakt", "Kontakt"),
+            SimLink(f"{base}/impressum", "Impressum"),
+            SimLink("https://www.facebook.com/share", "Teilen"),
+        ]
+        address = f"{company.street}, {company.plz} {company.city}"
+        phone = f"+49 30 {company.index % 9000 + 1000} {company.index:06d}"
+        if path not in _SITE_PATHS:
+            return SimPage(url=url, title="404", text="Seite nicht gefunden", links=nav)
+        if path in ("/kontakt", "/impressum"):
+            user = "info" if path == "/kontakt" else "office"
+            text = "\n".join(
+                [
+                    f"{company.name} contact",
+                    f"Contact {company.name} - address: {address}",
+                    f"Telefon: {phone}",
+                    f"Mail: {user}@{company.host}",
+                    f"{company.name} contact form",
+                ]
+            )
+            return SimPage(
+                url=url,
+                title=f"Kontakt - {company.name}",
+                text=f"{text}\n{self._filler}",
+                links=nav,
+                metas=[f"{company.name} {company.city}"],
+                hidden_inputs=[f"form-{company.index}"],
+            )
+        footer = f"{company.name} - contact us - address: {address} - Telefon: {phone}"
+        return SimPage(
+            url=url,
+            title=company.name,
+            text=f"Willkommen bei {company.name}\n{self._filler}\n{footer}",
+            links=nav,
+            metas=[f"{company.name} {company.city}"],
+        )
+
+    def _distractor_page(self, url: str, host: str) -> SimPage | None:
+        if host.endswith(".invalid"):
+            return None
+        return SimPage(
+            url=url,
+            title=host,
+            text=f"Eintraege und Neuigkeiten\n{urlparse(url).path}\n{self._filler}",
+            links=[SimLink(f"https://{host}/", "Start")],
+        )
+
+
+class SimWebServer:
+    """Serve a :class:`SimWeb` over plain HTTP, usable as Chrome's ``--proxy-server``.
+
+    Requests carry absolute URLs when the server acts as a proxy, so generated host names
+    survive unchanged; plain requests fall back to the ``Host`` header.
+    """
+
+    def __init__(self, web: SimWeb, *, host: str = "127.0.0.1", port: int = 0) -> None:
+        self.web = web
+        handler = _make_handler(web)
+        self._server = ThreadingHTTPServer((host, port), handler)
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def address(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"{host!s}:{port}"
+
+    def start(self) -> SimWebServer:
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> SimWebServer:
+        return self.start()
+
+    def __exit__(self, *_exc: object) -> None:
+        self.stop()
+
+
+def _make_handler(web: SimWeb) -> type[BaseHTTPRequestHandler]:
+    class _Handler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            url = self.path
+            if not urlparse(url).netloc:
+                url = f"http://{self.headers.get('Host', '')}{self.path}"
+            page = web.resolve(url)
+            if page is None:
+                self.send_error(502, "Unknown host")
+                return
+            body = page.html.encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format: str, *args: Any) -> None:
+            return None
+
+    return _Handler
@@ -0,0 +1,317 @@
+"""Buffered result sinks (CSV, JSONL, Parquet, SQLite) fed by a single writer thread."""
+
+from __future__ import annotations
+
+import csv
+import json
+import logging
+import os
+import queue
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Protocol
+
+OUTPUT_FORMATS = ("csv", "jsonl", "parquet", "sqlite")
+ROW_INDEX_COLUMN = "row_index"
+
+_SUFFIX_FORMATS = {
+    ".jsonl": "jsonl",
+    ".ndjson": "jsonl",
+    ".parquet": "parquet",
+    ".sqlite": "sqlite",
+    ".sqlite3": "sqlite",
+    ".db": "sqlite",
+}
+
+# A result row: (0-based input position, values aligned to the output header)
+ResultRow = tuple[int, list[str]]
+
+
+class ResultSink(Protocol):
+    def write_rows(self, rows: list[ResultRow]) -> None: ...
+
+    def flush(self, *, fsync: bool) -> None: ...
+
+    def close(self) -> None: ...
+
+
+class CsvSink:
+    """CSV with the header as first line; created/overwritten on the first batch."""
+
+    def __init__(self, path: Path, header: list[str], *, delimiter: str = ",") -> None:
+        self.path = path
+        self.header = header
+        self.delimiter = delimiter
+        self._handle: Any = None
+        self._writer: Any = None
+
+    def write_rows(self, rows: list[ResultRow]) -> None:
+        if self._handle is None:
+            self._handle = self.path.open("w", encoding="utf-8", newline="")
+            self._writer = csv.writer(self._handle, delimiter=self.delimiter)
+            self._writer.writerow(self.header)
+        self._writer.writerows(values for _idx, values in rows)
+
+    def flush(self, *, fsync: bool) -> None:
+        if self._handle is None:
+            return
+        self._handle.flush()
+        if fsync:
+            os.fsync(self._handle.fileno())
+
+    def close(self) -> None:
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+
+
+class JsonlSink:
+    """One JSON object per line: ``row_index`` plus one key per output column."""
+
+    def __init__(self, path: Path, header: list[str]) -> None:
+        _check_header(header)
+        self.path = path
+        self.header = header
+        self._handle: Any = None
+
+    def write_rows(self, rows: list[ResultRow]) -> None:
+        if self._handle is None:
+            self._handle = self.path.open("w", encoding="utf-8")
+        lines = []
+        for row_index, values in rows:
+            record = {ROW_INDEX_COLUMN: row_index, **dict(zip(self.header, values, strict=True))}
+            lines.append(json.dumps(record, ensure_ascii=False))
+        self._handle.write("\n".join(lines) + "\n")
+
+    def flush(self, *, fsync: bool) -> None:
+        if self._handle is None:
+            return
+        self._handle.flush()
+        if fsync:
+            os.fsync(self._handle.fileno())
+
+    def close(self) -> None:
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+
+
+class SqliteSink:
+    """Table ``results`` (``row_index`` + TEXT columns) with an index on ``row_index``.
+
+    An existing ``results`` table is replaced on the first batch, mirroring CSV overwrite.
+    """
+
+    def __init__(self, path: Path, header: list[str], *, table: str = "results") -> None:
+        _check_header(header)
+        self.path = path
+        self.header = header
+        self.table = table
+        self._conn: sqlite3.Connection | None = None
+
+    def _open(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, check_same_thread=False)
+        table = _quote_ident(self.table)
+        columns = ", ".join(f"{_quote_ident(c)} TEXT" for c in self.header)
+        conn.execute(f"DROP TABLE IF EXISTS {table}")
+        conn.execute(f"CREATE TABLE {table} ({ROW_INDEX_COLUMN} INTEGER NOT NULL, {columns})")
+        conn.execute(
+            f"CREATE INDEX {_quote_ident(self.table + '_row_index')} "
+            f"ON {table} ({ROW_INDEX_COLUMN})"
+        )
+        conn.commit()
+        return conn
+
+    def write_rows(self, rows: list[ResultRow]) -> None:
+        if self._conn is None:
+            self._conn = self._open()
+        placeholders = ", ".join("?" for _ in range(len(self.header) + 1))
+        self._conn.executemany(
+            f"INSERT INTO {_quote_ident(self.table)} VALUES ({placeholders})",
+            [(row_index, *values) for row_index, values in rows],
+        )
+
+    def flush(self, *, fsync: bool) -> None:
+        # sqlite3's default synchronous=FULL already syncs on commit
+        if self._conn is not None:
+            self._conn.commit()
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.commit()
+            self._conn.close()
+            self._conn = None
+
+
+class ParquetSink:
+    """Parquet file written one row group per flushed batch (requires ``pyarrow``)."""
+
+    def __init__(self, path: Path, header: list[str]) -> None:
+        _check_header(header)
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError as exc:
+            raise ValueError(
+                "Parquet output requires pyarrow (install the 'parquet' extra)"
+            ) from exc
+        self._pa = pa
+        self._pq = pq
+        self.path = path
+        self.header = header
+        self._schema = pa.schema(
+            [(ROW_INDEX_COLUMN, pa.int64()), *((c, pa.string()) for c in header)]
+        )
+        self._writer: Any = None
+        self._pending: list[ResultRow] = []
+
+    def write_rows(self, rows: list[ResultRow]) -> None:
+        self._pending.extend(rows)
+
+    def flush(self, *, fsync: bool) -> None:
+        if not self._pending:
+            return
+        if self._writer is None:
+            self._writer = self._pq.ParquetWriter(str(self.path), self._schema)
+        columns: list[list[Any]] = [[idx for idx, _values in self._pending]]
+        columns.extend(
+            [values[i] for _idx, values in self._pending] for i in range(len(self.header))
+        )
+        self._writer.write_table(self._pa.Table.from_arrays(columns, schema=self._schema))
+        self._pending.clear()
+
+    def close(self) -> None:
+        self.flush(fsync=False)
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+
+def infer_output_format(path: Path) -> str:
+    return _SUFFIX_FORMATS.get(path.suffix.lower(), "csv")
+
+
+def open_sink(path: Path, header: list[str], *, output_format: str | None = None) -> ResultSink:
+    fmt = output_format or infer_output_format(path)
+    if fmt == "csv":
+        return CsvSink(path, header)
+    if fmt == "jsonl":
+        return JsonlSink(path, header)
+    if fmt == "sqlite":
+        return SqliteSink(path, header)
+    if fmt == "parquet":
+        return ParquetSink(path, header)
+    raise ValueError(
+        f"Unknown output format: {fmt!r} (expected one of {', '.join(OUTPUT_FORMATS)})"
+    )
+
+
+@dataclass(frozen=True)
+class SinkOptions:
+    batch_size: int = 100
+    flush_interval_s: float = 1.0
+    fsync: bool = False
+
+
+_CLOSE = object()
+
+
+class SinkWriter:
+    """Funnel results from any number of worker threads into one sink on a writer thread.
+
+    Rows are buffered and written in batches of ``batch_size``; a partial batch is flushed at
+    the latest every ``flush_interval_s`` seconds, so a crash loses at most that much output.
+    Errors raised by the sink surface on the next ``submit`` or on ``close``.
+
+    Rows submitted with ``seq`` (0, 1, 2, ... in input order) are held back until every row
+    with a lower ``seq`` was submitted, so output stays in input order however late a row
+    finishes. Held rows are only in memory, so the flush interval does not cover them until
+    the gap closes. Rows still held on ``close`` (a gap left by a failed run) are written anyway.
+    """
+
+    def __init__(self, sink: ResultSink, options: SinkOptions | None = None) -> None:
+        self.sink = sink
+        self.options = options or SinkOptions()
+        self._queue: queue.Queue[Any] = queue.Queue()
+        self._error: BaseException | None = None
+        self._held: dict[int, ResultRow] = {}
+        self._next_seq = 0
+        self._order_lock = threading.Lock()
+        self._thread = threading.Thread(target=self._run, name="result-sink", daemon=True)
+        self._thread.start()
+
+    def submit(self, row_index: int, values: list[str], *, seq: int | None = None) -> None:
+        self._raise_if_failed()
+        if seq is None:
+            self._queue.put((row_index, values))
+            return
+        with self._order_lock:
+            self._held[seq] = (row_index, values)
+            while self._next_seq in self._held:
+                self._queue.put(self._held.pop(self._next_seq))
+                self._next_seq += 1
+
+    def close(self) -> None:
+        with self._order_lock:
+            for seq in sorted(self._held):
+                self._queue.put(self._held.pop(seq))
+        if self._thread.is_alive():
+            self._queue.put(_CLOSE)
+            self._thread.join()
+        self._raise_if_failed()
+
+    def __enter__(self) -> SinkWriter:
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        self.close()
+
+    def _raise_if_failed(self) -> None:
+        if self._error is not None:
+            raise RuntimeError(f"Result sink failed: {self._error}") from self._error
+
+    def _run(self) -> None:
+        batch: list[ResultRow] = []
+        last_flush = time.monotonic()
+        try:
+            while True:
+                timeout = max(self.options.flush_interval_s - (time.monotonic() - last_flush), 0)
+                try:
+                    item = self._queue.get(timeout=timeout if batch else None)
+                except queue.Empty:
+                    item = None
+                if item is _CLOSE:
+                    break
+                if item is not None:
+                    batch.append(item)
+                due = time.monotonic() - last_flush >= self.options.flush_interval_s
+                if batch and (len(batch) >= self.options.batch_size or due):
+                    self._write(batch)
+                    batch = []
+                    last_flush = time.monotonic()
+            if batch:
+                self._write(batch)
+        except BaseException as exc:  # surfaced to producers via _raise_if_failed
+            logging.error("Result sink failed: %s", exc)
+            self._error = exc
+        finally:
+            try:
+                self.sink.close()
+            except Exception as exc:
+                self._error = self._error or exc
+
+    def _write(self, batch: list[ResultRow]) -> None:
+        self.sink.write_rows(batch)
+        self.sink.flush(fsync=self.options.fsync)
+
+
+def _check_header(header: list[str]) -> None:
+    if ROW_INDEX_COLUMN in header:
+        raise ValueError(f"Column name {ROW_INDEX_COLUMN!r} is reserved for this output format.")
+
+
+def _quote_ident(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
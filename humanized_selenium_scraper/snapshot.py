@@ -0,0 +1,69 @@
+"""One-round-trip capture of a loaded page for relevance checks and contact extraction."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any
+
+# Returns the final URL, the serialized DOM and the link/meta/hidden-input harvest at once,
+# instead of one WebDriver call per element.
+SNAPSHOT_SCRIPT = """
+var d = document;
+function each(sel, f) { return Array.prototype.map.call(d.querySelectorAll(sel), f); }
+return {
+  url: location.href,
+  html: d.documentElement ? d.documentElement.outerHTML : "",
+  links: each("a", function (a) {
+    return [a.href || "", a.innerText || "", a.getAttribute("href") || ""];
+  }),
+  metas: each("meta", function (m) { return m.getAttribute("content") || ""; }),
+  hidden: each("input[type='hidden']", function (i) { return i.value || ""; })
+};
+"""
+
+HTML_SCRIPT = "return document.documentElement ? document.documentElement.outerHTML : '';"
+
+
+@dataclass(frozen=True)
+class SnapshotLink:
+    # Absolute URL (what ``get_attribute("href")`` returns), rendered text, raw attribute
+    href: str
+    text: str
+    raw_href: str
+
+
+@dataclass(frozen=True)
+class PageSnapshot:
+    url: str
+    html: str
+    links: tuple[SnapshotLink, ...] = ()
+    metas: tuple[str, ...] = ()
+    hidden_inputs: tuple[str, ...] = ()
+
+
+def capture_snapshot(driver: Any) -> PageSnapshot:
+    data = driver.execute_script(SNAPSHOT_SCRIPT)
+    if not isinstance(data, dict):
+        # Driver without script support for this page: fall back to the DOM source only.
+        return PageSnapshot(url=driver.current_url, html=driver.page_source)
+    return parse_snapshot(data)
+
+
+def capture_html(driver: Any) -> str:
+    """Only the page markup of ``capture_snapshot``, for checks that need no links."""
+    html = driver.execute_script(HTML_SCRIPT)
+    return html if isinstance(html, str) else driver.page_source
+
+
+def parse_snapshot(data: dict[str, Any]) -> PageSnapshot:
+    """Build a snapshot from the object ``SNAPSHOT_SCRIPT`` returns."""
+    return PageSnapshot(
+        url=str(data.get("url") or ""),
+        html=str(data.get("html") or ""),
+        links=tuple(
+            SnapshotLink(href=str(href), text=str(text), raw_href=str(raw))
+            for href, text, raw in data.get("links") or ()
+        ),
+        metas=tuple(str(m) for m in data.get("metas") or ()),
+        hidden_inputs=tuple(str(v) for v in data.get("hidden") or ()),
+    )
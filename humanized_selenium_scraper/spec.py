@@ -8,6 +8,8 @@ from typing import Any
 from .config import ScraperConfig
 from .url_filter import DEFAULT_ALLOWED_TLDS, DEFAULT_DOMAIN_KEYWORD_BLACKLIST
 
+SERP_MODES = ("homepage", "direct")
+
 
 @dataclass(frozen=True)
 class AddressSpec:
@@ -23,6 +25,8 @@ class UrlFilterSpec:
     allowed_tlds: tuple[str, ...] = DEFAULT_ALLOWED_TLDS
     domain_keyword_blacklist: tuple[str, ...] = DEFAULT_DOMAIN_KEYWORD_BLACKLIST
     min_query_part_len: int = 3
+    # Match query parts against the host without its public suffix (bundled PSL data)
+    public_suffixes: bool = False
 
 
 @dataclass(frozen=True)
@@ -30,6 +34,18 @@ class NavigationSpec:
     max_google_results: int = 20
     max_links_per_page: int = 30
     subpage_depth: int = 2
+    # Evaluate relevance after load and after each scroll step; stop once the page passes
+    incremental_relevance: bool = False
+    # SERP candidates loading in parallel background tabs (0 or 1: visit one at a time)
+    tab_pipeline: int = 0
+    # "homepage": type the query like a user; "direct": load the results URL (one navigation)
+    serp_mode: str = "homepage"
+    # Interface language of direct results URLs (``hl``), e.g. "de"; empty: Google's choice
+    serp_language: str = ""
+
+    def __post_init__(self) -> None:
+        if self.serp_mode not in SERP_MODES:
+            raise ValueError(f"Unknown serp_mode: {self.serp_mode!r}")
 
 
 @dataclass(frozen=True)
@@ -72,7 +88,11 @@ class SearchSpec:
             raw = path.read_text(encoding="utf-8")
         except UnicodeDecodeError as e:
             raise ValueError(f"Spec file must be UTF-8 encoded: {path}") from e
-        data = tomllib.loads(raw)
+        return cls.from_mapping(tomllib.loads(raw))
+
+    @classmethod
+    def from_mapping(cls, data: dict[str, Any]) -> tuple[SearchSpec, ScraperConfig]:
+        """Spec and config from parsed spec-file tables (see ``example_search_spec.toml``)."""
         defaults = cls()
         search_data = _as_dict(data.get("search", {}))
         relevance_data = _as_dict(search_data.pop("relevance", data.get("relevance", {})))
@@ -128,6 +148,10 @@ class SearchSpec:
                     url_filter_data.get("min_query_part_len"),
                     defaults.url_filter.min_query_part_len,
                 ),
+                public_suffixes=_safe_bool(
+                    url_filter_data.get("public_suffixes"),
+                    defaults.url_filter.public_suffixes,
+                ),
             ),
             navigation=NavigationSpec(
                 max_google_results=_safe_int(
@@ -142,6 +166,18 @@ class SearchSpec:
                     navigation_data.get("subpage_depth"),
                     defaults.navigation.subpage_depth,
                 ),
+                incremental_relevance=_safe_bool(
+                    navigation_data.get("incremental_relevance"),
+                    defaults.navigation.incremental_relevance,
+                ),
+                tab_pipeline=_safe_int(
+                    navigation_data.get("tab_pipeline"),
+                    defaults.navigation.tab_pipeline,
+                ),
+                serp_mode=str(navigation_data.get("serp_mode", defaults.navigation.serp_mode)),
+                serp_language=str(
+                    navigation_data.get("serp_language", defaults.navigation.serp_language)
+                ),
             ),
             extract_phone=_safe_bool(
                 search_data.get("extract_phone"),
@@ -0,0 +1,100 @@
+"""The search pipeline as steps, so the same code runs blocking or on an event loop.
+
+Pipeline functions that talk to the browser, sleep or wait are written as generators
+("step functions", named ``*_steps``). They ``yield from call(fn, ...)`` for every blocking
+call (a WebDriver round trip, an HTTP preflight, a page evaluation) and ``yield from
+sleep(seconds)`` for every pause, and get the call's result or exception back. Everything
+else (host health, caches, dedup) runs inline.
+
+``run_steps`` executes steps in the calling thread; ``cli.run`` and the plain functions
+(``safe_get``, ``Session.search``, ...) use it. ``async_run_steps`` awaits each call on an
+executor and each pause with ``asyncio.sleep``, so a session occupies a thread only for the
+duration of one call, never for a pause or between the polls of a wait.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Callable, Generator
+from concurrent.futures import Executor
+from dataclasses import dataclass, field
+from functools import partial
+from typing import Any, TypeVar
+
+# TypeVar rather than PEP 695 syntax: the package still imports on Python 3.11.
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class Call:
+    fn: Callable[..., Any]
+    args: tuple[Any, ...] = ()
+    kwargs: dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class Pause:
+    # Wall-clock seconds; humanized pauses are scaled before they become a ``Pause``
+    seconds: float
+
+
+Steps = Generator[Call | Pause, Any, T]
+
+
+def call(fn: Callable[..., T], *args: Any, **kwargs: Any) -> Steps[T]:  # noqa: UP047
+    """``fn(*args, **kwargs)`` as one blocking step; returns its result or raises its error."""
+    return (yield Call(fn, args, kwargs))
+
+
+def done(result: T) -> Steps[T]:  # noqa: UP047
+    """Steps that return ``result`` without doing anything."""
+    return result
+    yield  # unreachable; makes this a generator
+
+
+def sleep(seconds: float) -> Steps[None]:
+    """Wait ``seconds`` of real time (backoff, polling); see ``human.sleep_steps`` for pauses."""
+    if seconds > 0:
+        yield Pause(seconds)
+
+
+def run_steps(steps: Steps[T]) -> T:  # noqa: UP047
+    """Run ``steps`` to completion in the calling thread."""
+    value: Any = None
+    error: BaseException | None = None
+    while True:
+        try:
+            effect = steps.throw(error) if error is not None else steps.send(value)
+        except StopIteration as stop:
+            return stop.value
+        value, error = None, None
+        if isinstance(effect, Pause):
+            time.sleep(effect.seconds)
+            continue
+        try:
+            value = effect.fn(*effect.args, **effect.kwargs)
+        except Exception as exc:
+            error = exc
+
+
+async def async_run_steps(steps: Steps[T], executor: Executor) -> T:  # noqa: UP047
+    """Run ``steps`` from a coroutine: calls on ``executor``, pauses with ``asyncio.sleep``."""
+    loop = asyncio.get_running_loop()
+    value: Any = None
+    error: BaseException | None = None
+    while True:
+        try:
+            effect = steps.throw(error) if error is not None else steps.send(value)
+        except StopIteration as stop:
+            return stop.value
+        value, error = None, None
+        if isinstance(effect, Pause):
+            await asyncio.sleep(effect.seconds)
+            continue
+        try:
+            value = await loop.run_in_executor(
+                executor, partial(effect.fn, *effect.args, **effect.kwargs)
+            )
+        except Exception as exc:
+            error = exc
@@ -0,0 +1,127 @@
+"""Load SERP candidates in background tabs of one driver while the current one is evaluated."""
+
+from __future__ import annotations
+
+import logging
+import time
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass
+from typing import Any
+
+from . import steps
+from .human import random_pause_steps
+from .metrics import METRICS
+from .steps import Steps, call, run_steps
+
+OPEN_TAB_SCRIPT = "window.open(arguments[0], '_blank');"
+READY_STATE_SCRIPT = "return document.readyState"
+
+
+@dataclass(frozen=True)
+class Tab:
+    url: str
+    handle: str
+
+
+class TabPipeline:
+    """Keeps up to ``width`` candidate URLs loading in background tabs.
+
+    ``run`` yields each tab once it finished loading or timed out (oldest first), with the
+    driver switched to it, and closes it when the caller asks for the next one. URLs are
+    drawn lazily, so a host that failed in one tab can be filtered out before the next opens.
+    ``next_steps`` hands out one tab per call, as steps (see ``steps``). The tab the pipeline
+    was created in (the SERP, or ``home``) is never navigated; ``close_all`` returns to it.
+    """
+
+    def __init__(
+        self,
+        driver: Any,
+        *,
+        width: int,
+        load_timeout_s: float,
+        poll_s: float = 0.1,
+        home: str | None = None,
+    ) -> None:
+        if width < 1:
+            raise ValueError("tab pipeline width must be >= 1")
+        self.driver = driver
+        self.width = width
+        self.load_timeout_s = load_timeout_s
+        self.poll_s = poll_s
+        self.home = home if home is not None else driver.current_window_handle
+        self._open: deque[Tab] = deque()
+        self._loading: deque[Tab] = deque()
+
+    def open(self, url: str) -> Tab | None:
+        """Start loading ``url`` in a new background tab; ``None`` if no tab appeared."""
+        before = set(self.driver.window_handles)
+        self.driver.switch_to.window(self.home)
+        self.driver.execute_script(OPEN_TAB_SCRIPT, url)
+        new = [h for h in self.driver.window_handles if h not in before]
+        if not new:
+            logging.warning("Tab pipeline: window.open was blocked")
+            return None
+        METRICS.incr("page_loads")
+        METRICS.incr("tabs_opened")
+        tab = Tab(url=url, handle=new[0])
+        self._open.append(tab)
+        return tab
+
+    def wait_ready(self, tab: Tab) -> bool:
+        """Switch to ``tab`` and wait until its document finished loading."""
+        return run_steps(self.wait_ready_steps(tab))
+
+    def wait_ready_steps(self, tab: Tab) -> Steps[bool]:
+        yield from call(self.driver.switch_to.window, tab.handle)
+        deadline = time.monotonic() + self.load_timeout_s
+        while (yield from call(self.driver.execute_script, READY_STATE_SCRIPT)) != "complete":
+            if time.monotonic() >= deadline:
+                logging.warning("Tab pipeline: load timeout => %s", tab.url)
+                return False
+            yield from steps.sleep(self.poll_s)
+        return True
+
+    def close(self, tab: Tab) -> None:
+        if tab not in self._open:
+            return
+        self._open.remove(tab)
+        try:
+            self.driver.switch_to.window(tab.handle)
+            self.driver.close()
+        except Exception as exc:
+            logging.warning("Tab pipeline: close failed => %s", exc)
+        self.driver.switch_to.window(self.home)
+
+    def close_all(self) -> None:
+        self._loading.clear()
+        while self._open:
+            self.close(self._open[0])
+        self.driver.switch_to.window(self.home)
+
+    def run(self, urls: Iterable[str]) -> Iterator[tuple[Tab, bool]]:
+        """``(tab, ready)`` for each URL that got a tab; ``ready`` is ``False`` on a timeout."""
+        pending = iter(urls)
+        while found := run_steps(self.next_steps(lambda: steps.done(next(pending, None)))):
+            yield found
+            self.close(found[0])
+
+    def next_steps(
+        self, next_url: Callable[[], Steps[str | None]]
+    ) -> Steps[tuple[Tab, bool] | None]:
+        """Open tabs for the URLs ``next_url`` returns until ``width`` are loading, then wait
+        for the oldest; ``None`` once there are no URLs and no tabs left. The caller closes the
+        returned tab."""
+        while len(self._loading) < self.width:
+            url = yield from next_url()
+            if url is None:
+                break
+            tab = yield from call(self.open, url)
+            if tab is not None:
+                self._loading.append(tab)
+                yield from random_pause_steps(0.2, 0.4)
+        if not self._loading:
+            return None
+        tab = self._loading.popleft()
+        ready = yield from self.wait_ready_steps(tab)
+        return tab, ready
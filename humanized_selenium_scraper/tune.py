@@ -0,0 +1,244 @@
+"""``tune`` subcommand: evaluate spec variants over an archive recorded with ``--record``.
+
+Every variant runs the full search pipeline against a replay of the archive, so relevance,
+URL filter, navigation and extraction settings can be compared without a browser. Work is
+split into (variant, row chunk) tasks and spread over a process pool.
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import itertools
+import logging
+import os
+import sys
+import tomllib
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import Any
+
+from .config import ScraperConfig
+from .human import scaled_pauses
+from .io import enumerate_csv_rows, parse_columns_arg, read_input_columns
+from .logging_utils import setup_logging
+from .metrics import METRICS
+from .scraper import Session
+from .spec import SearchSpec, render_template
+
+REPORT_COLUMNS = (
+    "variant",
+    "rows",
+    "matched",
+    "match_rate",
+    "extracted",
+    "extraction_yield",
+    "page_loads",
+    "page_loads_per_row",
+)
+
+
+@dataclass(frozen=True)
+class Variant:
+    name: str
+    spec: SearchSpec
+
+
+@dataclass(frozen=True)
+class TuneResult:
+    variant: str
+    rows: int
+    matched: int
+    extracted: int
+    page_loads: float
+
+    def report_row(self) -> dict[str, str]:
+        per_row = max(self.rows, 1)
+        return {
+            "variant": self.variant,
+            "rows": str(self.rows),
+            "matched": str(self.matched),
+            "match_rate": f"{self.matched / per_row:.3f}",
+            "extracted": str(self.extracted),
+            "extraction_yield": f"{self.extracted / per_row:.3f}",
+            "page_loads": f"{self.page_loads:g}",
+            "page_loads_per_row": f"{self.page_loads / per_row:.2f}",
+        }
+
+
+def _merge(base: dict[str, Any], overrides: dict[str, Any]) -> dict[str, Any]:
+    merged = dict(base)
+    for key, value in overrides.items():
+        if isinstance(value, dict) and isinstance(merged.get(key), dict):
+            merged[key] = _merge(merged[key], value)
+        else:
+            merged[key] = value
+    return merged
+
+
+def _dotted(key: str, value: Any) -> dict[str, Any]:
+    for part in reversed(key.split(".")):
+        value = {part: value}
+    return value
+
+
+def load_variants(grid: dict[str, Any], base: dict[str, Any]) -> list[Variant]:
+    """Spec variants from a parsed grid file, applied as overrides on the ``base`` spec tables.
+
+    ``[[variant]]`` entries are named override tables (e.g. ``relevance = {...}``). ``[grid]``
+    maps dotted keys (``"relevance.min_total_keyword_hits"``) to value lists and expands to
+    their cartesian product, applied to every variant. Without either, only ``base`` runs.
+    """
+    entries = grid.get("variant", [{"name": "base"}])
+    axes = grid.get("grid", {})
+    if not isinstance(entries, list) or not all(isinstance(e, dict) for e in entries):
+        raise ValueError("[[variant]] entries must be tables")
+    if not isinstance(axes, dict) or not all(isinstance(v, list) and v for v in axes.values()):
+        raise ValueError("[grid] values must be non-empty lists")
+
+    variants: list[Variant] = []
+    for index, entry in enumerate(entries):
+        overrides = {k: v for k, v in entry.items() if k != "name"}
+        name = str(entry.get("name", f"variant{index + 1}"))
+        for combo in itertools.product(*axes.values()):
+            data = _merge(base, overrides)
+            labels = []
+            for key, value in zip(axes, combo, strict=True):
+                data = _merge(data, _dotted(key, value))
+                labels.append(f"{key.rsplit('.', 1)[-1]}={value}")
+            spec, _config = SearchSpec.from_mapping(data)
+            variants.append(Variant(" ".join([name, *labels]), spec))
+    names = [v.name for v in variants]
+    if len(set(names)) != len(names):
+        raise ValueError("Variant names must be unique")
+    return variants
+
+
+def _evaluate_chunk(
+    variant: Variant, rows: list[dict[str, str]], config: ScraperConfig
+) -> TuneResult:
+    """Search ``rows`` with one variant against the replay archive (runs in a pool worker).
+
+    A replay tries SERP candidates in result order, so page-load counts are comparable
+    across variants.
+    """
+    loads_before = METRICS.get("page_loads")
+    matched = extracted = 0
+    session = Session.create(config, profile_dir=config.chrome_profile_root)
+    try:
+        with scaled_pauses(0):
+            for row in rows:
+                try:
+                    query = render_template(variant.spec.query_template, row).strip()
+                    if not query:
+                        continue
+                    url, phone, email = session.search(query=query, row=row, spec=variant.spec)
+                except Exception as exc:
+                    logging.warning("tune %s: row failed: %s", variant.name, exc)
+                    continue
+                matched += bool(url)
+                extracted += bool(phone or email)
+    finally:
+        session.close()
+    return TuneResult(
+        variant=variant.name,
+        rows=len(rows),
+        matched=matched,
+        extracted=extracted,
+        page_loads=METRICS.get("page_loads") - loads_before,
+    )
+
+
+def tune(
+    *,
+    variants: list[Variant],
+    rows: list[dict[str, str]],
+    config: ScraperConfig,
+    workers: int,
+) -> list[TuneResult]:
+    """Evaluate every variant over ``rows``; results are in variant order."""
+    if config.replay_dir is None:
+        raise ValueError("tune needs a replay archive (config.replay_dir)")
+    chunk_size = max(1, -(-len(rows) // max(workers, 1)))
+    chunks = [rows[i : i + chunk_size] for i in range(0, len(rows), chunk_size)] or [[]]
+    tasks = [(v, chunk, config) for v in variants for chunk in chunks]
+    if workers <= 1:
+        partial = [_evaluate_chunk(*task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            partial = list(pool.map(_evaluate_chunk, *zip(*tasks, strict=True)))
+
+    totals = {v.name: TuneResult(v.name, 0, 0, 0, 0) for v in variants}
+    for result in partial:
+        total = totals[result.variant]
+        totals[result.variant] = replace(
+            total,
+            rows=total.rows + result.rows,
+            matched=total.matched + result.matched,
+            extracted=total.extracted + result.extracted,
+            page_loads=total.page_loads + result.page_loads,
+        )
+    return list(totals.values())
+
+
+def _write_report(results: list[TuneResult], handle: Any) -> None:
+    writer = csv.DictWriter(handle, fieldnames=REPORT_COLUMNS)
+    writer.writeheader()
+    writer.writerows(result.report_row() for result in results)
+
+
+def tune_main(argv: list[str]) -> int:
+    setup_logging()
+    parser = argparse.ArgumentParser(
+        prog="humanized_selenium_scraper tune",
+        description=(
+            "Evaluate spec variants (TOML overrides) over an archive recorded with --record and "
+            "report match rate, extraction yield and page loads per variant."
+        ),
+    )
+    parser.add_argument("--input", default="input.csv", help="Input CSV of the recorded run.")
+    parser.add_argument("--replay", required=True, metavar="DIR", help="Archive directory.")
+    parser.add_argument("--grid", required=True, help="TOML file with [[variant]] / [grid].")
+    parser.add_argument("--spec", help="Base TOML spec file the variants override.")
+    parser.add_argument("--delimiter", default=",", help="CSV delimiter (default: ',').")
+    parser.add_argument("--header", action="store_true", help="Input CSV has a header row.")
+    parser.add_argument(
+        "--columns",
+        default="name,street,plz,city",
+        help="Column names for headerless CSV (comma-separated).",
+    )
+    parser.add_argument(
+        "--workers", type=int, default=os.cpu_count() or 1, help="Worker processes."
+    )
+    parser.add_argument("--report", help="Write the report as CSV here (default: stdout).")
+    args = parser.parse_args(argv)
+
+    base: dict[str, Any] = {}
+    if args.spec:
+        base = tomllib.loads(Path(args.spec).read_text(encoding="utf-8"))
+    variants = load_variants(tomllib.loads(Path(args.grid).read_text(encoding="utf-8")), base)
+    _spec, config = SearchSpec.from_mapping(base)
+    config = replace(config, record_dir=None, replay_dir=Path(args.replay))
+
+    columns = parse_columns_arg(args.columns) if not args.header else None
+    input_file = Path(args.input)
+    input_columns = read_input_columns(
+        input_file, delimiter=args.delimiter, has_header=args.header, columns=columns
+    )
+    rows = [
+        row
+        for _index, row in enumerate_csv_rows(
+            input_file,
+            delimiter=args.delimiter,
+            has_header=args.header,
+            columns=input_columns or columns,
+        )
+    ]
+    results = tune(variants=variants, rows=rows, config=config, workers=args.workers)
+    if args.report:
+        with open(args.report, "w", encoding="utf-8", newline="") as handle:
+            _write_report(results, handle)
+    else:
+        _write_report(results, sys.stdout)
+    return 0
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
-from urllib.parse import urlparse
+import re
+from collections.abc import Iterable
+from functools import lru_cache
+from pathlib import Path
 
 DEFAULT_ALLOWED_TLDS = (
     ".de",
@@ -41,6 +44,194 @@ DEFAULT_DOMAIN_KEYWORD_BLACKLIST = (
 )
 
 
+# Netloc of an absolute or scheme-relative URL, as urllib.parse.urlsplit finds it
+_NETLOC_RE = re.compile(r"(?:[a-z][a-z0-9+.\-]*:)?//([^/?#]*)")
+_C0_CONTROL_OR_SPACE = "".join(chr(c) for c in range(0x21))
+_UNSAFE_URL_CHARS = str.maketrans("", "", "\t\r\n")
+
+BUNDLED_PUBLIC_SUFFIX_LIST = Path(__file__).with_name("data") / "public_suffix_list.dat"
+
+# Reasons reported by UrlFilter.rejection_reason / filter_many
+REJECT_SCHEME = "scheme"
+REJECT_PDF = "pdf"
+REJECT_TLD = "tld"
+REJECT_BLACKLIST = "blacklist"
+REJECT_QUERY_PART = "query_part"
+
+
+def url_host(url: str) -> str | None:
+    """Lowercase host of a candidate URL, or ``None`` for blob/data URLs and PDFs."""
+    url_lower = url.lower()
+    if url_lower.startswith(("blob:", "data:")):
+        return None
+    if url_lower.endswith(".pdf"):
+        return None
+    return _host(url_lower)
+
+
+def _host(url_lower: str) -> str:
+    url_lower = url_lower.lstrip(_C0_CONTROL_OR_SPACE)
+    if "\t" in url_lower or "\r" in url_lower or "\n" in url_lower:
+        url_lower = url_lower.translate(_UNSAFE_URL_CHARS)
+    match = _NETLOC_RE.match(url_lower)
+    if match is None:
+        return ""
+    return match.group(1).rpartition("@")[2].partition(":")[0]
+
+
+def query_parts(query: str, *, min_len: int = 3) -> tuple[str, ...]:
+    """Lowercased query words a relevant host must contain one of (``query_part`` mode)."""
+    return tuple(p for p in query.lower().split() if len(p) >= min_len)
+
+
+class PublicSuffixList:
+    """Public suffix rules (``com``, ``co.uk``, ``*.ck``, ``!www.ck``) for label lookups."""
+
+    def __init__(self, rules: Iterable[str]) -> None:
+        self._rules: set[str] = set()
+        self._wildcards: set[str] = set()
+        self._exceptions: set[str] = set()
+        for raw in rules:
+            rule = raw.strip().lower()
+            if not rule or rule.startswith("//"):
+                continue
+            rule = rule.split()[0]
+            if rule.startswith("!"):
+                self._exceptions.add(rule[1:])
+            elif rule.startswith("*."):
+                self._wildcards.add(rule[2:])
+            else:
+                self._rules.add(rule)
+
+    @classmethod
+    def from_file(cls, path: Path) -> PublicSuffixList:
+        with path.open("r", encoding="utf-8") as handle:
+            return cls(handle)
+
+    def public_suffix(self, host: str) -> str:
+        """Longest matching public suffix of ``host`` (the last label if no rule matches)."""
+        labels = host.strip(".").split(".")
+        for i in range(len(labels)):
+            candidate = ".".join(labels[i:])
+            if candidate in self._exceptions:
+                return ".".join(labels[i + 1 :])
+            if candidate in self._rules:
+                return candidate
+            if i > 0 and candidate in self._wildcards:
+                return ".".join(labels[i - 1 :])
+        return labels[-1]
+
+    def registrable_domain(self, host: str) -> str | None:
+        """Public suffix plus one label (``shop.example.co.uk`` -> ``example.co.uk``)."""
+        host = host.strip(".")
+        suffix = self.public_suffix(host)
+        if host == suffix:
+            return None
+        return ".".join(host[: -len(suffix) - 1].split(".")[-1:] + [suffix])
+
+
+@lru_cache(maxsize=4)
+def load_public_suffix_list(path: Path = BUNDLED_PUBLIC_SUFFIX_LIST) -> PublicSuffixList:
+    return PublicSuffixList.from_file(path)
+
+
+class UrlFilter:
+    """Compiled ``is_relevant_url`` for checking many URLs against the same settings.
+
+    Allowed TLDs are matched as whole trailing labels through a suffix set (``.co.uk``
+    matches ``shop.co.uk``, ``.de`` does not match ``made``); blacklist keywords are
+    matched as substrings of the host with one compiled alternation. With
+    ``public_suffixes``, query parts are matched against the host without its public
+    suffix, so a query word such as ``com`` or ``berlin`` (a TLD) cannot match the suffix.
+    """
+
+    def __init__(
+        self,
+        *,
+        allowed_tlds: Iterable[str] = DEFAULT_ALLOWED_TLDS,
+        domain_keyword_blacklist: Iterable[str] = DEFAULT_DOMAIN_KEYWORD_BLACKLIST,
+        domain_match: str = "query_part",  # "query_part" | "any"
+        min_query_part_len: int = 3,
+        public_suffixes: PublicSuffixList | None = None,
+    ) -> None:
+        if domain_match not in ("query_part", "any"):
+            raise ValueError(f"Unknown domain_match mode: {domain_match!r}")
+        self._suffixes = frozenset(t.lower().strip(".") for t in allowed_tlds if t.strip("."))
+        # Longest allowed suffix in labels; bounds the walk in _has_allowed_suffix
+        self._max_suffix_labels = max((s.count(".") + 1 for s in self._suffixes), default=0)
+        keywords = sorted({k.lower() for k in domain_keyword_blacklist if k}, key=len)
+        self._blacklist = re.compile("|".join(map(re.escape, keywords))) if keywords else None
+        self.domain_match = domain_match
+        self.min_query_part_len = min_query_part_len
+        self.public_suffixes = public_suffixes
+
+    def rejection_reason(self, url: str, *, parts: tuple[str, ...] = ()) -> str | None:
+        """Why ``url`` is not relevant for a query with ``parts``, or ``None`` if it is."""
+        url_lower = url.lower()
+        if url_lower.startswith(("blob:", "data:")):
+            return REJECT_SCHEME
+        if url_lower.endswith(".pdf"):
+            return REJECT_PDF
+        host = _host(url_lower)
+        if not self._has_allowed_suffix(host):
+            return REJECT_TLD
+        if self._blacklist is not None and self._blacklist.search(host):
+            return REJECT_BLACKLIST
+        if self.domain_match == "any":
+            return None
+        if self.public_suffixes is not None:
+            suffix = self.public_suffixes.public_suffix(host)
+            host = host[: -len(suffix) - 1] if host != suffix else ""
+        if any(part in host for part in parts):
+            return None
+        return REJECT_QUERY_PART
+
+    def accepts(self, url: str, *, query: str = "") -> bool:
+        parts = query_parts(query, min_len=self.min_query_part_len)
+        return self.rejection_reason(url, parts=parts) is None
+
+    def filter_many(
+        self, urls: Iterable[str], *, query: str = ""
+    ) -> tuple[list[str], list[tuple[str, str]]]:
+        """Split ``urls`` into accepted URLs and ``(url, reason)`` rejections, keeping order."""
+        parts = query_parts(query, min_len=self.min_query_part_len)
+        accepted: list[str] = []
+        rejected: list[tuple[str, str]] = []
+        for url in urls:
+            reason = self.rejection_reason(url, parts=parts)
+            if reason is None:
+                accepted.append(url)
+            else:
+                rejected.append((url, reason))
+        return accepted, rejected
+
+    def _has_allowed_suffix(self, host: str) -> bool:
+        # Walk trailing labels right to left; a suffix must be preceded by at least one label.
+        end = len(host)
+        for _ in range(self._max_suffix_labels):
+            end = host.rfind(".", 0, end)
+            if end < 0:
+                return False
+            if host[end + 1 :] in self._suffixes:
+                return True
+        return False
+
+
+@lru_cache(maxsize=32)
+def _cached_filter(
+    allowed_tlds: tuple[str, ...],
+    domain_keyword_blacklist: tuple[str, ...],
+    domain_match: str,
+    min_query_part_len: int,
+) -> UrlFilter:
+    return UrlFilter(
+        allowed_tlds=allowed_tlds,
+        domain_keyword_blacklist=domain_keyword_blacklist,
+        domain_match=domain_match,
+        min_query_part_len=min_query_part_len,
+    )
+
+
 def is_relevant_url(
     query: str,
     url: str,
@@ -50,24 +241,7 @@ def is_relevant_url(
     domain_match: str = "query_part",  # "query_part" | "any"
     min_query_part_len: int = 3,
 ) -> bool:
-    url_lower = url.lower()
-    if url_lower.startswith(("blob:", "data:")):
-        return False
-    if url_lower.endswith(".pdf"):
-        return False
-
-    netloc = urlparse(url).netloc.lower()
-    host = netloc.split("@")[-1].split(":")[0]
-
-    if not any(host.endswith(tld) for tld in allowed_tlds):
-        return False
-    if any(keyword in host for keyword in domain_keyword_blacklist):
-        return False
-
-    if domain_match == "any":
-        return True
-    if domain_match != "query_part":
-        raise ValueError(f"Unknown domain_match mode: {domain_match!r}")
-
-    query_parts = [p for p in query.lower().split() if len(p) >= min_query_part_len]
-    return any(part in host for part in query_parts)
+    url_filter = _cached_filter(
+        tuple(allowed_tlds), tuple(domain_keyword_blacklist), domain_match, min_query_part_len
+    )
+    return url_filter.accepts(url, query=query)
@@ -0,0 +1,76 @@
+"""Explicit, condition-based waits with one timeout per phase.
+
+Browsers run with implicit waits off, so a lookup that matches nothing (no meta tags, no
+hidden inputs, no links) returns at once. Where the scraper does have to wait, it names the
+phase, and the seconds spent waiting are added to the ``wait_s_<phase>`` metric. A wait is
+a polling loop of steps (see ``steps``): one call per check of the condition, a pause between.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any, Literal, TypeVar
+
+from selenium.common.exceptions import NoSuchElementException, TimeoutException
+
+from . import steps
+from .config import ScraperConfig
+from .metrics import METRICS
+from .steps import Steps, call, run_steps
+
+T = TypeVar("T")
+
+# Page body after a navigation, Google's search box, Google's result list
+WAIT_PHASES = ("page_body", "search_box", "results")
+
+
+@dataclass(frozen=True)
+class WaitPolicy:
+    page_body_s: float = 10.0
+    search_box_s: float = 10.0
+    results_s: float = 8.0
+    poll_s: float = 0.25
+
+    @classmethod
+    def for_config(cls, config: ScraperConfig) -> WaitPolicy:
+        return cls(
+            page_body_s=config.body_wait_s,
+            search_box_s=config.search_box_wait_s,
+            results_s=config.results_wait_s,
+        )
+
+    def timeout(self, phase: str) -> float:
+        if phase not in WAIT_PHASES:
+            raise ValueError(f"Unknown wait phase: {phase!r}")
+        return float(getattr(self, f"{phase}_s"))
+
+    def record(self, phase: str, waited_s: float, *, timed_out: bool) -> None:
+        METRICS.incr(f"wait_s_{phase}", waited_s)
+        if timed_out:
+            METRICS.incr("wait_timeouts")
+
+    def until(self, driver: Any, phase: str, condition: Callable[[Any], Literal[False] | T]) -> T:
+        """``WebDriverWait(...).until(condition)`` with the timeout of ``phase``."""
+        return run_steps(self.until_steps(driver, phase, condition))
+
+    def until_steps(
+        self, driver: Any, phase: str, condition: Callable[[Any], Literal[False] | T]
+    ) -> Steps[T]:
+        """``until`` as steps; like ``WebDriverWait``, a missing element counts as not yet."""
+        timeout = self.timeout(phase)
+        start = time.monotonic()
+        while True:
+            try:
+                result = yield from call(condition, driver)
+            except NoSuchElementException:
+                result = False
+            waited = time.monotonic() - start
+            if result:
+                self.record(phase, waited, timed_out=False)
+                return result
+            if waited >= timeout:
+                self.record(phase, waited, timed_out=True)
+                raise TimeoutException(f"Timed out waiting for {phase} after {timeout:g} s")
+            yield from steps.sleep(self.poll_s)
@@ -0,0 +1,216 @@
+"""SQLite-backed job table with time-limited leases for elastic worker processes.
+
+Every input row is one job. Workers claim a job with a lease, write the result back and
+release it; a job whose lease expired (crashed or stuck worker) becomes claimable again.
+At most the currently leased row of a crashed worker is redone, and nothing is lost.
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+import time
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    row_index INTEGER PRIMARY KEY,
+    payload TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    lease_owner TEXT,
+    lease_expires REAL,
+    result TEXT,
+    error TEXT
+);
+CREATE INDEX IF NOT EXISTS jobs_status ON jobs (status, lease_expires);
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+"""
+
+JOB_STATUSES = ("pending", "leased", "done", "failed")
+
+
+@dataclass(frozen=True)
+class Job:
+    row_index: int
+    row: dict[str, str]
+    attempts: int
+
+
+class WorkQueue:
+    """Job table in an SQLite file shared by all workers (same host or shared filesystem).
+
+    Uses the default rollback journal (not WAL) so the file also works on network
+    filesystems. ``max_attempts`` caps claims per row; a row that fails or whose lease
+    expires that often is marked ``failed``.
+    """
+
+    def __init__(self, path: Path, *, max_attempts: int = 3, busy_timeout_s: float = 30.0):
+        self.path = path
+        self.max_attempts = max_attempts
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            path, timeout=busy_timeout_s, isolation_level=None, check_same_thread=False
+        )
+        self._conn.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        self._conn.close()
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield self._conn
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+
+    def load(self, rows: Iterable[tuple[int, dict[str, str]]], *, columns: list[str]) -> int:
+        """Insert jobs for ``(row_index, row)`` pairs; existing rows are kept (idempotent)."""
+        with self._transaction() as conn:
+            conn.execute(
+                "INSERT OR IGNORE INTO meta (key, value) VALUES ('columns', ?)",
+                (json.dumps(columns),),
+            )
+            before = conn.total_changes
+            conn.executemany(
+                "INSERT OR IGNORE INTO jobs (row_index, payload) VALUES (?, ?)",
+                ((idx, json.dumps(row, ensure_ascii=False)) for idx, row in rows),
+            )
+            return conn.total_changes - before
+
+    def columns(self) -> list[str] | None:
+        with self._lock:
+            found = self._conn.execute("SELECT value FROM meta WHERE key = 'columns'").fetchone()
+        return json.loads(found[0]) if found else None
+
+    def claim(self, worker_id: str, *, lease_s: float) -> Job | None:
+        """Lease the lowest pending (or lease-expired) row, or return ``None``."""
+        now = time.time()
+        with self._transaction() as conn:
+            conn.execute(
+                "UPDATE jobs SET status = 'failed', error = 'lease expired', lease_owner = NULL "
+                "WHERE status = 'leased' AND lease_expires < ? AND attempts >= ?",
+                (now, self.max_attempts),
+            )
+            found = conn.execute(
+                "SELECT row_index, payload, attempts FROM jobs "
+                "WHERE status = 'pending' OR (status = 'leased' AND lease_expires < ?) "
+                "ORDER BY row_index LIMIT 1",
+                (now,),
+            ).fetchone()
+            if found is None:
+                return None
+            row_index, payload, attempts = found
+            conn.execute(
+                "UPDATE jobs SET status = 'leased', lease_owner = ?, lease_expires = ?, "
+                "attempts = attempts + 1 WHERE row_index = ?",
+                (worker_id, now + lease_s, row_index),
+            )
+        return Job(row_index=row_index, row=json.loads(payload), attempts=attempts + 1)
+
+    def renew(self, row_index: int, worker_id: str, *, lease_s: float) -> bool:
+        with self._transaction() as conn:
+            cur = conn.execute(
+                "UPDATE jobs SET lease_expires = ? "
+                "WHERE row_index = ? AND status = 'leased' AND lease_owner = ?",
+                (time.time() + lease_s, row_index, worker_id),
+            )
+            return cur.rowcount == 1
+
+    def complete(self, row_index: int, worker_id: str, values: list[str]) -> bool:
+        """Store the result; ``False`` if the lease was lost to another worker meanwhile."""
+        with self._transaction() as conn:
+            cur = conn.execute(
+                "UPDATE jobs SET status = 'done', result = ?, error = NULL, lease_owner = NULL "
+                "WHERE row_index = ? AND status = 'leased' AND lease_owner = ?",
+                (json.dumps(values, ensure_ascii=False), row_index, worker_id),
+            )
+            return cur.rowcount == 1
+
+    def fail(self, row_index: int, worker_id: str, error: str) -> str:
+        """Release a failed row for retry, or mark it ``failed`` after ``max_attempts``."""
+        with self._transaction() as conn:
+            conn.execute(
+                "UPDATE jobs SET "
+                "status = CASE WHEN attempts >= ? THEN 'failed' ELSE 'pending' END, error = ?, "
+                "lease_owner = NULL, lease_expires = NULL "
+                "WHERE row_index = ? AND status = 'leased' AND lease_owner = ?",
+                (self.max_attempts, error[:500], row_index, worker_id),
+            )
+            found = conn.execute(
+                "SELECT status FROM jobs WHERE row_index = ?", (row_index,)
+            ).fetchone()
+        return found[0] if found else "missing"
+
+    def counts(self) -> dict[str, int]:
+        with self._lock:
+            found = self._conn.execute("SELECT status, COUNT(*) FROM jobs GROUP BY status")
+            counts = dict.fromkeys(JOB_STATUSES, 0)
+            counts.update(dict(found.fetchall()))
+        return counts
+
+    def is_drained(self) -> bool:
+        counts = self.counts()
+        return counts["pending"] == 0 and counts["leased"] == 0
+
+    def next_lease_expiry(self) -> float | None:
+        with self._lock:
+            found = self._conn.execute(
+                "SELECT MIN(lease_expires) FROM jobs WHERE status = 'leased'"
+            ).fetchone()
+        return found[0] if found else None
+
+    def results(
+        self, *, batch_size: int = 1000
+    ) -> Iterator[tuple[int, dict[str, str], list[str] | None]]:
+        """``(row_index, input row, result values or None)`` in input order.
+
+        Reads ``batch_size`` rows at a time, so exporting a large queue keeps memory bounded
+        and does not hold the lock while the caller writes.
+        """
+        last = -1
+        while True:
+            with self._lock:
+                found = self._conn.execute(
+                    "SELECT row_index, payload, result FROM jobs WHERE row_index > ? "
+                    "ORDER BY row_index LIMIT ?",
+                    (last, batch_size),
+                )
+                batch = found.fetchall()
+            if not batch:
+                return
+            for row_index, payload, result in batch:
+                yield row_index, json.loads(payload), json.loads(result) if result else None
+            last = batch[-1][0]
+
+
+class LeaseKeeper:
+    """Background heartbeat that renews a job's lease while the worker processes it."""
+
+    def __init__(self, queue: WorkQueue, job: Job, worker_id: str, *, lease_s: float) -> None:
+        self._queue = queue
+        self._job = job
+        self._worker_id = worker_id
+        self._lease_s = lease_s
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="lease-keeper", daemon=True)
+
+    def __enter__(self) -> LeaseKeeper:
+        self._thread.start()
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self._lease_s / 3):
+            self._queue.renew(self._job.row_index, self._worker_id, lease_s=self._lease_s)
@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import csv
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from humanized_selenium_scraper import scraper
+from humanized_selenium_scraper.emulation import FakeDriver, PageServer
+from humanized_selenium_scraper.simweb import SimWeb
+
+
+@pytest.fixture
+def write_input(tmp_path) -> Callable[[SimWeb], Path]:
+    """Write the rows of a ``SimWeb`` as a headerless ``name,street,plz,city`` input CSV."""
+
+    def write(web: SimWeb) -> Path:
+        path = tmp_path / "input.csv"
+        with path.open("w", encoding="utf-8", newline="") as handle:
+            csv.writer(handle).writerows(
+                [row["name"], row["street"], row["plz"], row["city"]] for row in web.rows()
+            )
+        return path
+
+    return write
+
+
+@pytest.fixture
+def serve_web(monkeypatch) -> Callable[..., list[FakeDriver]]:
+    """Make sessions browse a ``SimWeb`` through ``FakeDriver`` instead of starting Chrome.
+
+    Returns the list the created drivers are appended to.
+    """
+
+    def serve(web: PageServer, **driver_options: Any) -> list[FakeDriver]:
+        drivers: list[FakeDriver] = []
+
+        def factory(config, *, profile_dir):
+            drivers.append(FakeDriver(web, **driver_options))
+            return drivers[-1]
+
+        monkeypatch.setattr(scraper, "create_driver", factory)
+        return drivers
+
+    return serve
@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+
+from humanized_selenium_scraper import cli, scraper
+from humanized_selenium_scraper.aio import async_run
+from humanized_selenium_scraper.config import ScraperConfig
+from humanized_selenium_scraper.emulation import FakeDriver
+from humanized_selenium_scraper.human import scaled_pauses
+from humanized_selenium_scraper.metrics import METRICS
+from humanized_selenium_scraper.simweb import SimWeb
+from humanized_selenium_scraper.spec import NavigationSpec, SearchSpec
+
+
+def test_async_run_matches_sync_run_in_input_order(tmp_path, monkeypatch, write_input) -> None:
+    web = SimWeb(companies=12, filler_kb=1)
+    profiles = []
+
+    def factory(config, *, profile_dir):
+        profiles.append(profile_dir)
+        return FakeDriver(web, load_latency_s=0.01)
+
+    monkeypatch.setattr(scraper, "create_driver", factory)
+    input_path = write_input(web)
+    options = dict(
+        input_file=input_path,
+        config=ScraperConfig(chrome_profile_root=tmp_path / "profile"),
+        spec=SearchSpec(query_template="{name} {city} contact"),
+        delimiter=",",
+        has_header=False,
+        columns=["name", "street", "plz", "city"],
+    )
+    with scaled_pauses(0):
+        cli.run(output_file=tmp_path / "sync.csv", **options)
+        profiles.clear()
+        started = time.perf_counter()
+        asyncio.run(async_run(output_file=tmp_path / "async.csv", concurrency=4, **options))
+        elapsed = time.perf_counter() - started
+
+    assert len(set(profiles)) == 4
+    sync_rows = (tmp_path / "sync.csv").read_text(encoding="utf-8")
+    assert (tmp_path / "async.csv").read_text(encoding="utf-8") == sync_rows
+    assert elapsed < 5
+
+
+def test_async_sessions_run_the_tab_pipeline(tmp_path, monkeypatch, serve_web, write_input) -> None:
+    web = SimWeb(companies=6, filler_kb=1)
+    serve_web(web)
+    monkeypatch.setattr(scraper.random, "shuffle", lambda _items: None)
+    input_path = write_input(web)
+    options = dict(
+        input_file=input_path,
+        config=ScraperConfig(chrome_profile_root=tmp_path / "profile"),
+        delimiter=",",
+        has_header=False,
+        columns=["name", "street", "plz", "city"],
+    )
+    with scaled_pauses(0):
+        cli.run(
+            output_file=tmp_path / "sync.csv", spec=SearchSpec(query_template="{name}"), **options
+        )
+        METRICS.reset()
+        tabs = SearchSpec(query_template="{name}", navigation=NavigationSpec(tab_pipeline=3))
+        asyncio.run(
+            async_run(output_file=tmp_path / "async.csv", spec=tabs, concurrency=2, **options)
+        )
+
+    assert METRICS.get("tabs_opened") > 0
+    assert METRICS.get("history_back") == 0
+    expected = (tmp_path / "sync.csv").read_text(encoding="utf-8")
+    assert (tmp_path / "async.csv").read_text(encoding="utf-8") == expected
+
+
+def test_sessions_outnumber_driver_threads(tmp_path, monkeypatch, write_input) -> None:
+    web = SimWeb(companies=12, filler_kb=1)
+    drivers: list[FakeDriver] = []
+    threads: set[str] = set()
+
+    class RecordingDriver(FakeDriver):
+        def get(self, url: str) -> None:
+            threads.add(threading.current_thread().name)
+            super().get(url)
+
+    def factory(config, *, profile_dir):
+        drivers.append(RecordingDriver(web, load_latency_s=0.01))
+        return drivers[-1]
+
+    monkeypatch.setattr(scraper, "create_driver", factory)
+    input_path = write_input(web)
+    options = dict(
+        input_file=input_path,
+        config=ScraperConfig(chrome_profile_root=tmp_path / "profile"),
+        spec=SearchSpec(query_template="{name} {city} contact"),
+        delimiter=",",
+        has_header=False,
+        columns=["name", "street", "plz", "city"],
+    )
+    with scaled_pauses(0):
+        cli.run(output_file=tmp_path / "sync.csv", **options)
+        drivers.clear()
+        threads.clear()
+        asyncio.run(
+            async_run(
+                output_file=tmp_path / "async.csv", concurrency=6, driver_threads=2, **options
+            )
+        )
+
+    # Six browsers each searched rows, but their navigations ran on two pool threads.
+    assert len(drivers) == 6
+    assert all(driver.page_loads > 0 for driver in drivers)
+    assert len(threads) <= 2
+    assert all(name.startswith("webdriver") for name in threads)
+    expected = (tmp_path / "sync.csv").read_text(encoding="utf-8")
+    assert (tmp_path / "async.csv").read_text(encoding="utf-8") == expected
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import pytest
+
+from humanized_selenium_scraper import cli
+from humanized_selenium_scraper.analysis import AnalysisPool
+from humanized_selenium_scraper.compiled import compile_spec
+from humanized_selenium_scraper.config import ScraperConfig
+from humanized_selenium_scraper.extract_selenium import parse_phone_email_snapshot
+from humanized_selenium_scraper.human import scaled_pauses
+from humanized_selenium_scraper.metrics import METRICS
+from humanized_selenium_scraper.relevance import iter_page_chunks
+from humanized_selenium_scraper.simweb import SimWeb
+from humanized_selenium_scraper.snapshot import PageSnapshot, SnapshotLink
+from humanized_selenium_scraper.spec import SearchSpec
+
+
+@pytest.fixture(scope="module")
+def pool():
+    with AnalysisPool(2, min_chars=1) as analysis:
+        yield analysis
+
+
+def test_offloaded_analysis_matches_inline(pool) -> None:
+    row = {"name": "Brenner7", "street": "Hauptstrasse 5", "plz": "10115", "city": "Berlin"}
+    ctx = compile_spec(SearchSpec()).row_context(row, query="Brenner7 Berlin")
+    filler = "<p>qualitaet service angebot</p>\n" * 4000
+    pages = [
+        f"<html>{filler}Brenner7 contact address Hauptstrasse 5, 10115 Berlin " * 3 + "</html>",
+        f"<html>{filler}Brenner7 Straße über München</html>",
+        "",
+    ]
+    METRICS.reset()
+    for page in pages:
+        assert pool.evaluate(ctx, page) == ctx.evaluate_chunks(iter_page_chunks(page))
+    assert METRICS.get("analysis_offloaded") == 2  # the empty page stays inline
+
+    snapshot = PageSnapshot(
+        url="https://brenner7-berlin.de/kontakt",
+        html=f"{filler}Telefon: +49 30 1234 567890 Mail: info [at] brenner7-berlin.de",
+        links=(SnapshotLink("mailto:office@brenner7-berlin.de", "Mail", "mailto:x"),),
+        metas=("Brenner7 Berlin",),
+    )
+    assert pool.contacts(snapshot) == parse_phone_email_snapshot(snapshot)
+
+
+def test_run_with_analysis_workers_matches_inline_run(tmp_path, serve_web, write_input) -> None:
+    web = SimWeb(companies=6, filler_kb=80)
+    serve_web(web)
+    input_path = write_input(web)
+
+    outputs = []
+    for workers in (0, 2):
+        METRICS.reset()
+        output_path = tmp_path / f"output{workers}.csv"
+        with scaled_pauses(0):
+            cli.run(
+                input_file=input_path,
+                output_file=output_path,
+                config=ScraperConfig(chrome_profile_root=tmp_path, analysis_workers=workers),
+                spec=SearchSpec(query_template="{name} {city} contact"),
+                delimiter=",",
+                has_header=False,
+                columns=["name", "street", "plz", "city"],
+            )
+        outputs.append(output_path.read_text(encoding="utf-8"))
+    assert METRICS.get("analysis_offloaded") > 0
+    assert outputs[0] == outputs[1]
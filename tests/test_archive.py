@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import csv
+from dataclasses import replace
+from pathlib import Path
+
+import pytest
+
+from humanized_selenium_scraper import cli, scraper
+from humanized_selenium_scraper.archive import RecordingDriver, WebArchive
+from humanized_selenium_scraper.config import ScraperConfig
+from humanized_selenium_scraper.emulation import FakeDriver
+from humanized_selenium_scraper.human import scaled_pauses
+from humanized_selenium_scraper.metrics import METRICS
+from humanized_selenium_scraper.simweb import SimWeb
+from humanized_selenium_scraper.snapshot import PageSnapshot, SnapshotLink
+from humanized_selenium_scraper.spec import NavigationSpec, SearchSpec
+
+
+def _run(input_path: Path, config: ScraperConfig, spec: SearchSpec, output_path: Path):
+    with scaled_pauses(0):
+        cli.run(
+            input_file=input_path,
+            output_file=output_path,
+            config=config,
+            spec=spec,
+            delimiter=",",
+            has_header=False,
+            columns=["name", "street", "plz", "city"],
+        )
+    with output_path.open("r", encoding="utf-8", newline="") as handle:
+        return list(csv.reader(handle))[1:]
+
+
+def test_archive_returns_newest_capture_by_request_or_final_url(tmp_path) -> None:
+    archive = WebArchive(tmp_path / "rec")
+    link = SnapshotLink(href="https://a.de/kontakt", text="Kontakt", raw_href="/kontakt")
+    first = PageSnapshot(url="https://a.de/", html="<p>old</p>")
+    second = PageSnapshot(url="https://a.de/", html="<p>new</p>", links=(link,), metas=("m",))
+    archive.record(first, request_url="http://a.de", google_domain="google.com")
+    archive.record(second, request_url="http://a.de", google_domain="google.com")
+    serp = PageSnapshot(url="https://www.google.com/search?q=a+de&hl=de", html="<div></div>")
+    archive.record(serp, request_url="https://www.google.com/", google_domain="google.com")
+
+    assert len(archive) == 3
+    entry = archive.page("http://a.de")
+    assert entry is not None and entry.snapshot == second
+    assert archive.page("https://a.de/") == entry
+    assert archive.page("https://www.google.com/") is None
+    archive.record_error("https://gone.de/", "net::ERR_NAME_NOT_RESOLVED")
+    failed = archive.page("https://gone.de/")
+    assert failed is not None and failed.error == "net::ERR_NAME_NOT_RESOLVED"
+    found = archive.serp(" a  de ")
+    assert found is not None and found.kind == "serp" and found.snapshot.html == "<div></div>"
+    archive.close()
+
+
+@pytest.mark.parametrize("tab_pipeline", [0, 3])
+def test_replay_reproduces_recorded_run_without_browser(
+    tmp_path, monkeypatch, write_input, tab_pipeline
+) -> None:
+    web = SimWeb(companies=10, filler_kb=1)
+    input_path = write_input(web)
+    spec = SearchSpec(
+        query_template="{name} {city} contact",
+        navigation=NavigationSpec(tab_pipeline=tab_pipeline),
+    )
+    record_dir = tmp_path / "rec"
+    monkeypatch.setattr(
+        scraper,
+        "create_driver",
+        lambda config, *, profile_dir: RecordingDriver(
+            FakeDriver(web), WebArchive(record_dir), google_domain=config.google_domain
+        ),
+    )
+    recorded = _run(
+        input_path, ScraperConfig(chrome_profile_root=tmp_path), spec, tmp_path / "a.csv"
+    )
+    assert any(row[4] for row in recorded)
+
+    monkeypatch.undo()
+    replay = ScraperConfig(chrome_profile_root=tmp_path, replay_dir=record_dir)
+    assert _run(input_path, replay, spec, tmp_path / "b.csv") == recorded
+
+    no_email = _run(input_path, replay, replace(spec, extract_email=False), tmp_path / "c.csv")
+    assert [row[:6] for row in no_email] == [row[:6] for row in recorded]
+    assert all(row[6] == "" for row in no_email)
+
+
+def test_replaying_twice_gives_identical_output_and_metrics(
+    tmp_path, monkeypatch, write_input
+) -> None:
+    web = SimWeb(companies=10, filler_kb=1)
+    input_path = write_input(web)
+    spec = SearchSpec(query_template="{name} {city} contact")
+    record_dir = tmp_path / "rec"
+    monkeypatch.setattr(
+        scraper,
+        "create_driver",
+        lambda config, *, profile_dir: RecordingDriver(
+            FakeDriver(web), WebArchive(record_dir), google_domain=config.google_domain
+        ),
+    )
+    _run(input_path, ScraperConfig(chrome_profile_root=tmp_path), spec, tmp_path / "a.csv")
+    monkeypatch.undo()
+
+    replay = ScraperConfig(chrome_profile_root=tmp_path, replay_dir=record_dir)
+    runs = []
+    for name in ("b.csv", "c.csv"):
+        METRICS.reset()
+        output = _run(input_path, replay, spec, tmp_path / name)
+        # Wait durations are wall-clock time; every counter must match.
+        counters = {k: v for k, v in METRICS.snapshot().items() if not k.startswith("wait_s_")}
+        runs.append((output, counters))
+    assert runs[0] == runs[1]
+
+
+def test_record_and_replay_are_mutually_exclusive(tmp_path) -> None:
+    with pytest.raises(ValueError, match="mutually exclusive"):
+        ScraperConfig(record_dir=tmp_path, replay_dir=tmp_path)
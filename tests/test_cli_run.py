@@ -7,6 +7,7 @@ from humanized_selenium_scraper import cli
 from humanized_selenium_scraper.config import ScraperConfig
 from humanized_selenium_scraper.exceptions import SkipEntryError
 from humanized_selenium_scraper.spec import SearchSpec
+from humanized_selenium_scraper.steps import call
 
 
 class DummySession:
@@ -24,6 +25,9 @@ class DummySession:
             raise RuntimeError("boom")
         return "https://example.com", "123", "a@b.com"
 
+    def search_steps(self, **kwargs):
+        return call(self.search, **kwargs)
+
 
 def test_run_writes_output_and_handles_errors(tmp_path, monkeypatch) -> None:
     monkeypatch.setattr(cli, "Session", DummySession)
@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import pytest
+
+from humanized_selenium_scraper.compiled import CompiledSpec, compile_spec
+from humanized_selenium_scraper.relevance import evaluate_page
+from humanized_selenium_scraper.spec import RelevanceSpec, SearchSpec, UrlFilterSpec
+from humanized_selenium_scraper.url_filter import is_relevant_url
+
+ROW = {"name": "Firma", "street": "Hauptstraße 5", "plz": "10115", "city": "Berlin"}
+PAGES = [
+    "Firma contact address Hauptstr. 5, 10115 Berlin " * 2,
+    "Firma contact address 10115 Berlin " * 2,
+    "Firma contact address Hauptstr. 5 " * 3,
+    "nothing here",
+]
+URLS = [
+    "https://firma-berlin.de/kontakt",
+    "https://www.facebook.com/firma",
+    "https://firma.invalid/",
+    "https://other.de/",
+    "https://user@FIRMA.com:8080/x",
+    "https://firma.de/prospekt.pdf",
+    "data:text/html,firma.de",
+]
+
+
+def test_row_context_matches_uncompiled_relevance_and_url_filter() -> None:
+    spec = SearchSpec()
+    query = "Firma Hauptstraße 5 10115 Berlin"
+    ctx = compile_spec(spec).row_context(ROW, query=query)
+    assert ctx.keywords == ("contact", "address", "firma")
+    assert ctx.street_tokens == ("hauptstr", "5")
+
+    keywords = [k.lower() for k in ("Firma", "contact", "address")]
+    for page in PAGES:
+        expected = evaluate_page(
+            page,
+            keywords=keywords,
+            min_keyword_hits=6,
+            require_address=True,
+            street=ROW["street"],
+            plz=ROW["plz"],
+            city=ROW["city"],
+        )
+        assert ctx.evaluate_page(page) is expected
+    for url in URLS:
+        assert ctx.is_relevant_url(url) is is_relevant_url(query, url)
+
+
+def test_compile_validates_and_is_memoized() -> None:
+    spec = SearchSpec(relevance=RelevanceSpec(keyword_templates=("{{literal}}", "")))
+    assert compile_spec(spec) is compile_spec(spec)
+    assert compile_spec(spec).static_keywords == ("{literal}",)
+    with pytest.raises(ValueError, match="domain_match"):
+        CompiledSpec.compile(SearchSpec(url_filter=UrlFilterSpec(domain_match="fuzzy")))
@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+from humanized_selenium_scraper.config import ScraperConfig
+from humanized_selenium_scraper.consent import ConsentMemory
+from humanized_selenium_scraper.emulation import FakeDriver
+from humanized_selenium_scraper.human import scaled_pauses
+from humanized_selenium_scraper.metrics import METRICS
+from humanized_selenium_scraper.scraper import Session
+from humanized_selenium_scraper.simweb import SimWeb
+from humanized_selenium_scraper.spec import SearchSpec
+
+HOST = "www.google.com"
+
+
+def _search_all(session: Session, web: SimWeb) -> None:
+    spec = SearchSpec(query_template="{name} {city}")
+    with scaled_pauses(0):
+        for row in web.rows():
+            session.search(query=f"{row['name']} {row['city']}", row=row, spec=spec)
+
+
+def test_consent_is_probed_once_and_then_skipped_for_the_profile(tmp_path) -> None:
+    web = SimWeb(companies=3, consent="once")
+    config = ScraperConfig(chrome_profile_root=tmp_path)
+    driver = FakeDriver(web)
+    session = Session(
+        config=config, driver=driver, consent=ConsentMemory.for_profile(config, tmp_path)
+    )
+    METRICS.reset()
+    _search_all(session, web)
+    assert driver.consented
+    assert METRICS.get("consent_skipped") == 2
+
+    # A later run with the same profile skips the probe from the start.
+    memory = ConsentMemory.for_profile(config, tmp_path)
+    assert memory.is_given(HOST)
+    assert memory.patterns(HOST)[0][0] == "akzeptieren"
+    memory.forget(HOST)
+    assert not ConsentMemory.for_profile(config, tmp_path).is_given(HOST)
+
+
+def test_remote_browsers_remember_the_pattern_but_always_probe(tmp_path) -> None:
+    web = SimWeb(companies=3, consent="every_visit")
+    config = ScraperConfig(driver_backend="remote", webdriver_urls=("http://node:4444",))
+    memory = ConsentMemory.for_profile(config, tmp_path)
+    memory.given(HOST, "accept-id")
+    session = Session(config=config, driver=FakeDriver(web), consent=memory)
+    METRICS.reset()
+    _search_all(session, web)
+    assert METRICS.get("consent_skipped") == 0
+    assert memory.patterns(HOST)[0][0] == "accept-id"
+    assert not memory.is_given(HOST)
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import json
+import os
+
+from humanized_selenium_scraper.config import ScraperConfig
+from humanized_selenium_scraper.cookies import CookieStore
+from humanized_selenium_scraper.emulation import FakeDriver
+from humanized_selenium_scraper.human import scaled_pauses
+from humanized_selenium_scraper.metrics import METRICS
+from humanized_selenium_scraper.scraper import Session
+from humanized_selenium_scraper.simweb import SimWeb
+from humanized_selenium_scraper.spec import SearchSpec
+
+HOST = "www.google.com"
+
+
+def test_store_shares_unexpired_consent_cookies_through_its_file(tmp_path) -> None:
+    path = tmp_path / "cookies.json"
+    web = SimWeb(companies=1)
+    first = FakeDriver(web)
+    first.accept_consent()
+    assert CookieStore(path).export(first, HOST) == 1
+
+    # Another process: seeds a fresh browser before its first navigation.
+    fresh = FakeDriver(web)
+    assert CookieStore(path).seed(fresh) == {HOST}
+    assert fresh.consented
+    assert [c["name"] for c in fresh.get_cookies()] == ["SOCS"]
+
+    stored = json.loads(path.read_text())
+    stored[HOST][0]["expiry"] = 1
+    path.write_text(json.dumps(stored))
+    assert CookieStore(path).seed(FakeDriver(web)) == set()
+
+
+def test_restarted_remote_browsers_skip_consent_after_the_first_row(tmp_path, serve_web) -> None:
+    web = SimWeb(companies=4, consent="once")
+    drivers = serve_web(web)
+    # A new browser for every row; remote browsers keep no profile cookies of their own.
+    config = ScraperConfig(
+        restart_threshold=1,
+        driver_backend="remote",
+        webdriver_urls=("http://node:4444",),
+        chrome_profile_root=tmp_path,
+    )
+    session = Session.create(config, profile_dir=tmp_path)
+    spec = SearchSpec(query_template="{name} {city}")
+    METRICS.reset()
+    with scaled_pauses(0):
+        for row in web.rows():
+            session.search(query=f"{row['name']} {row['city']}", row=row, spec=spec)
+    assert len(drivers) == 4
+    assert all(d.consented for d in drivers)
+    assert METRICS.get("consent_skipped") == 3
+    assert METRICS.get("cookies_seeded") == 3
+
+
+def test_store_parses_its_file_only_after_it_changed(tmp_path) -> None:
+    path = tmp_path / "cookies.json"
+    driver = FakeDriver(SimWeb(companies=1))
+    driver.accept_consent()
+    CookieStore(path).export(driver, HOST)
+
+    store = CookieStore(path)
+    first = store._read()
+    assert store._read() is first
+    assert set(store.cookies()) == {HOST}
+
+    CookieStore(path).export(driver, "www.google.de")
+    os.utime(path, ns=(1, 1))
+    assert set(store.cookies()) == {HOST, "www.google.de"}
@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import csv
+from collections.abc import Callable
+from pathlib import Path
+
+from humanized_selenium_scraper import cli
+from humanized_selenium_scraper.config import ScraperConfig
+from humanized_selenium_scraper.dedup import QueryDeduper, dedup_key
+from humanized_selenium_scraper.exceptions import RetryLaterError, SearchFailedError
+from humanized_selenium_scraper.spec import RelevanceSpec, SearchSpec
+from humanized_selenium_scraper.steps import call
+
+
+class CountingSession:
+    queries: list[str] = []
+    fail_first: set[str] = set()
+    failure: Callable[[str], Exception] = SearchFailedError
+
+    @classmethod
+    def create(cls, config: ScraperConfig, *, profile_dir: Path):
+        return cls()
+
+    def close(self) -> None:
+        return None
+
+    def search(self, *, query: str, row: dict[str, str], spec: SearchSpec, attempt: int = 1):
+        CountingSession.queries.append(query)
+        if query.startswith("Broken"):
+            raise RuntimeError("boom")
+        if query in CountingSession.fail_first:
+            CountingSession.fail_first.remove(query)
+            raise CountingSession.failure(query)
+        return f"https://{query.split()[0].lower()}.de", "", ""
+
+    def search_steps(self, **kwargs):
+        return call(self.search, **kwargs)
+
+
+def test_dedup_key_normalizes_query_and_respects_address() -> None:
+    spec = SearchSpec(query_template="{name}", relevance=RelevanceSpec(keyword_templates=()))
+    a = {"name": "ACME  GmbH", "street": "A 1", "plz": "1", "city": "X"}
+    b = {"name": "acme gmbh", "street": "B 2", "plz": "2", "city": "Y"}
+    assert dedup_key(spec, a) != dedup_key(spec, b)  # address is part of relevance
+
+    no_address = SearchSpec(
+        query_template="{name}",
+        relevance=RelevanceSpec(keyword_templates=(), require_address=False),
+    )
+    assert dedup_key(no_address, a) == dedup_key(no_address, b)
+    assert dedup_key(no_address, {"other": "x"}) is None
+
+    deduper = QueryDeduper.from_rows(no_address, [a, b, {"name": "Solo"}])
+    assert deduper.duplicate_rows == 1
+    assert deduper.key({"name": "Solo"}) is None
+
+
+def test_run_searches_each_query_once_and_fans_out(tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr(cli, "Session", CountingSession)
+    monkeypatch.setattr(cli, "random_pause", lambda *_a, **_k: None)
+    input_path = tmp_path / "input.csv"
+    input_path.write_text(
+        "name,branch\nChain,1\nOther,1\nchain ,2\nBroken,1\nBroken,2\nChain,3\n",
+        encoding="utf-8",
+    )
+    spec = SearchSpec(
+        query_template="{name}",
+        relevance=RelevanceSpec(keyword_templates=("{name}",), require_address=False),
+    )
+
+    def run(output: Path, dedup: bool) -> list[list[str]]:
+        CountingSession.queries = []
+        cli.run(
+            input_file=input_path,
+            output_file=output,
+            config=ScraperConfig(),
+            spec=spec,
+            delimiter=",",
+            has_header=True,
+            columns=None,
+            dedup=dedup,
+        )
+        with output.open("r", encoding="utf-8", newline="") as handle:
+            return list(csv.reader(handle))
+
+    rows = run(tmp_path / "dedup.csv", dedup=True)
+    # Failed searches are not cached, so the second "Broken" row searches again.
+    assert CountingSession.queries == ["Chain", "Other", "Broken", "Broken"]
+    assert [r[2] for r in rows[1:]] == [
+        "https://chain.de",
+        "https://other.de",
+        "https://chain.de",
+        "",
+        "",
+        "https://chain.de",
+    ]
+    assert rows[3][:2] == ["chain ", "2"]
+
+    assert run(tmp_path / "plain.csv", dedup=False) == rows
+    assert len(CountingSession.queries) == 6
+
+
+def _run_chain(tmp_path: Path, config: ScraperConfig) -> list[list[str]]:
+    input_path = tmp_path / "input.csv"
+    input_path.write_text("name\nChain\nChain\nChain\n", encoding="utf-8")
+    output = tmp_path / "out.csv"
+    CountingSession.queries = []
+    cli.run(
+        input_file=input_path,
+        output_file=output,
+        config=config,
+        spec=SearchSpec(
+            query_template="{name}",
+            relevance=RelevanceSpec(keyword_templates=(), require_address=False),
+        ),
+        delimiter=",",
+        has_header=True,
+        columns=None,
+    )
+    with output.open("r", encoding="utf-8", newline="") as handle:
+        return list(csv.reader(handle))[1:]
+
+
+def test_transient_failures_are_not_fanned_out_and_deferred_rows_stay_pending(
+    tmp_path, monkeypatch
+) -> None:
+    monkeypatch.setattr(cli, "Session", CountingSession)
+    monkeypatch.setattr(cli, "random_pause", lambda *_a, **_k: None)
+
+    # Google did not load for the first row: only that row is empty, the next one searches.
+    CountingSession.fail_first, CountingSession.failure = {"Chain"}, SearchFailedError
+    rows = _run_chain(tmp_path, ScraperConfig())
+    assert CountingSession.queries == ["Chain", "Chain"]
+    assert [r[1] for r in rows] == ["", "https://chain.de", "https://chain.de"]
+
+    # A deferred row is not released: its retry caches the result for the other two rows.
+    CountingSession.fail_first = {"Chain"}
+    CountingSession.failure = lambda query: RetryLaterError(f"https://{query}.de", "timeout")
+    rows = _run_chain(tmp_path, ScraperConfig(retry_mode="deferred", retry_cooldown_s=0))
+    assert CountingSession.queries == ["Chain", "Chain"]
+    assert [r[1] for r in rows] == ["https://chain.de"] * 3
@@ -1,8 +1,15 @@
+import re
+import time
+
 from humanized_selenium_scraper.extract_text import (
     decode_antispam_mail,
     parse_phone_and_email_obfuscated,
+    scan_contacts,
 )
 
+# The phone pattern of the regex-based parser that ``scan_contacts`` replaced.
+_BASELINE_PHONE_RE = re.compile(r"\+?\d{2,4}[\s./-]*\(?\d{1,4}\)?[\s./-]*\d{3,}[\d\s./-]*")
+
 
 def test_decode_antispam_mail_shift_minus_one() -> None:
     assert decode_antispam_mail("nbjmup;") == "mailto:"
@@ -24,3 +31,39 @@ def test_parse_phone_and_email_obfuscated_normal_and_obf() -> None:
     assert any("1234" in p for p in phones)
     assert "info@example.org" in mails
     assert "sales@example.com" in mails
+
+
+def test_parse_phone_and_email_obfuscated_rejects_iso_dates_keeps_phones() -> None:
+    phones, _ = parse_phone_and_email_obfuscated("Stand 2024-01-15, Tel. 030/1234567")
+    assert phones == {"030/1234567"}
+
+
+def test_scan_contacts_bracketed_obfuscation_and_trailing_dot() -> None:
+    phones, mails = scan_contacts(
+        "kontakt [at] firma-berlin [punkt] de, mail a.b@sub.example.co.uk."
+    )
+    assert phones == set()
+    assert mails == {"kontakt@firma-berlin.de", "a.b@sub.example.co.uk"}
+
+
+def test_scan_contacts_pathological_inputs_stay_linear() -> None:
+    # The first two are quadratic for the previous regex-based parser (minutes at this size).
+    for text in ("a" * 200_000 + "@", "(12)(34)" * 50_000, "12 345 6789 " * 20_000):
+        started = time.perf_counter()
+        scan_contacts(text)
+        assert time.perf_counter() - started < 2.0
+
+
+def test_scan_contacts_keeps_phone_runs_longer_than_the_length_cap() -> None:
+    for text in (
+        "Tel 030 12345678 - 040 87654321 - 089 11223344",
+        "Konto 12345678901234567890123456789012345678901234",
+        "Filialen " + " ".join(["12 345 6789"] * 5),
+    ):
+        (baseline,) = (m.group(0).strip() for m in _BASELINE_PHONE_RE.finditer(text))
+        assert len(baseline) > 40
+        phones, _ = scan_contacts(text)
+        # The run comes back in pieces, together covering every digit the baseline matched.
+        pieces = sorted(phones, key=text.find)
+        assert re.sub(r"\D", "", "".join(pieces)) == re.sub(r"\D", "", baseline)
+        assert all(len(p) <= 40 for p in pieces) or pieces == [baseline]
@@ -1,8 +1,31 @@
 import pytest
 
-from humanized_selenium_scraper.io import parse_columns_arg
+from humanized_selenium_scraper.io import (
+    SHARD_MODES,
+    enumerate_csv_rows,
+    parse_columns_arg,
+    parse_shard_arg,
+)
 
 
 def test_parse_columns_arg_rejects_duplicates() -> None:
     with pytest.raises(ValueError):
         parse_columns_arg("a,b,a")
+
+
+def test_shards_partition_rows_disjointly(tmp_path) -> None:
+    path = tmp_path / "rows.csv"
+    path.write_text("".join(f"name{i},city{i % 3}\n" for i in range(50)), encoding="utf-8")
+    for mode in SHARD_MODES:
+        seen: list[int] = []
+        for index in (1, 2, 3):
+            shard = parse_shard_arg(f"{index}/3", mode=mode)
+            seen.extend(pos for pos, _row in enumerate_csv_rows(path, shard=shard))
+        assert sorted(seen) == list(range(50))
+
+
+def test_parse_shard_arg_rejects_out_of_range() -> None:
+    with pytest.raises(ValueError):
+        parse_shard_arg("0/4")
+    with pytest.raises(ValueError):
+        parse_shard_arg("5/4")
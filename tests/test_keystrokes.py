@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+from humanized_selenium_scraper.config import ScraperConfig
+from humanized_selenium_scraper.emulation import FakeDriver
+from humanized_selenium_scraper.human import scaled_pauses
+from humanized_selenium_scraper.keystrokes import (
+    MAX_BATCH_S,
+    TypingProfile,
+    keystroke_batches,
+)
+from humanized_selenium_scraper.metrics import METRICS
+from humanized_selenium_scraper.scraper import Session
+from humanized_selenium_scraper.simweb import SimWeb
+from humanized_selenium_scraper.spec import SearchSpec
+
+
+def test_profiles_scale_with_pauses_and_long_sequences_are_split() -> None:
+    human = TypingProfile.for_config(ScraperConfig())
+    assert all(0.05 <= d <= 0.3 for d in human.delays("x" * 50))
+    assert TypingProfile.for_config(ScraperConfig(typing_profile="instant")).delays("ab") == [0, 0]
+    with scaled_pauses(0):
+        assert human.delays("abc") == [0, 0, 0]
+
+    text = "x" * 100
+    batches = keystroke_batches(text, [0.5] * 100)
+    assert "".join(keys for keys, _ in batches) == text
+    assert all(sum(delays) <= MAX_BATCH_S for _, delays in batches)
+    assert len(batches) == 3
+    assert keystroke_batches(text, [0.0] * 100) == [(text, [0.0] * 100)]
+
+
+def test_each_search_types_its_query_in_one_call() -> None:
+    web = SimWeb(companies=4, seed=3)
+    session = Session(config=ScraperConfig(), driver=FakeDriver(web))
+    spec = SearchSpec(query_template="{name} {city}")
+    METRICS.reset()
+    with scaled_pauses(0):
+        results = [
+            session.search(query=f"{row['name']} {row['city']}", row=row, spec=spec)
+            for row in web.rows()
+        ]
+    assert any(url for url, _phone, _email in results)
+    assert METRICS.get("typing_calls") == 4
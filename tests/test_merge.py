@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import csv
+from pathlib import Path
+
+import pytest
+
+from humanized_selenium_scraper import cli
+from humanized_selenium_scraper.config import ScraperConfig
+from humanized_selenium_scraper.io import parse_shard_arg
+from humanized_selenium_scraper.spec import SearchSpec
+from humanized_selenium_scraper.steps import call
+
+
+class EchoSession:
+    @classmethod
+    def create(cls, config: ScraperConfig, *, profile_dir: Path):
+        return cls()
+
+    def close(self) -> None:
+        return None
+
+    def search(self, *, query: str, row: dict[str, str], spec: SearchSpec, attempt: int = 1):
+        return f"https://{query.lower()}.de", "", ""
+
+    def search_steps(self, **kwargs):
+        return call(self.search, **kwargs)
+
+
+def _run_shard(tmp_path, monkeypatch, input_path: Path, shard: str | None) -> Path:
+    monkeypatch.setattr(cli, "Session", EchoSession)
+    monkeypatch.setattr(cli, "random_pause", lambda *_a, **_k: None)
+    output = tmp_path / f"out-{(shard or 'all').replace('/', 'of')}.csv"
+    cli.run(
+        input_file=input_path,
+        output_file=output,
+        config=ScraperConfig(),
+        spec=SearchSpec(query_template="{name}"),
+        delimiter=",",
+        has_header=True,
+        columns=None,
+        shard=parse_shard_arg(shard) if shard else None,
+    )
+    return output
+
+
+def test_merge_restores_input_order_and_detects_gaps(tmp_path, monkeypatch) -> None:
+    input_path = tmp_path / "input.csv"
+    input_path.write_text("name\n" + "".join(f"Co{i}\n" for i in range(30)), encoding="utf-8")
+    full = _run_shard(tmp_path, monkeypatch, input_path, None)
+    shards = [_run_shard(tmp_path, monkeypatch, input_path, f"{i}/3") for i in (1, 2, 3)]
+
+    merged = tmp_path / "merged.csv"
+    assert (
+        cli.main(
+            ["merge", "--header", "--input", str(input_path), "--output", str(merged)]
+            + [str(p) for p in shards]
+        )
+        == 0
+    )
+    assert merged.read_text(encoding="utf-8") == full.read_text(encoding="utf-8")
+
+    with shards[1].open("r", encoding="utf-8", newline="") as handle:
+        rows = list(csv.reader(handle))
+    with shards[1].open("w", encoding="utf-8", newline="") as handle:
+        csv.writer(handle).writerows(rows[:-1])
+    with pytest.raises(ValueError, match="Shard 2 is missing"):
+        cli.main(
+            ["merge", "--header", "--input", str(input_path), "--output", str(merged)]
+            + [str(p) for p in shards]
+        )
+
+
+def test_merge_rejects_non_csv_shards_and_empty_input(tmp_path) -> None:
+    input_path = tmp_path / "input.csv"
+    input_path.write_text("name\n", encoding="utf-8")
+    shards = [str(tmp_path / "out-1of2.csv"), str(tmp_path / "out-2of2.csv")]
+    args = ["merge", "--header", "--input", str(input_path), "--output", str(tmp_path / "m.csv")]
+    with pytest.raises(ValueError, match="no rows, nothing to merge"):
+        cli.main(args + shards)
+    with pytest.raises(ValueError, match="CSV shard outputs only, got jsonl"):
+        cli.main(args + [shards[0], str(tmp_path / "out-2of2.jsonl")])
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import socket
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from humanized_selenium_scraper.compiled import compile_spec
+from humanized_selenium_scraper.metrics import METRICS
+from humanized_selenium_scraper.preflight import Preflight
+from humanized_selenium_scraper.retry import HostHealth
+from humanized_selenium_scraper.scraper import preflight_candidate
+from humanized_selenium_scraper.spec import SearchSpec, UrlFilterSpec
+
+ROUTES = {
+    "/page": (200, "text/html; charset=utf-8"),
+    "/download": (200, "application/pdf"),
+    "/gone": (404, "text/html"),
+}
+
+
+class _Handler(BaseHTTPRequestHandler):
+    def _respond(self, with_body: bool) -> None:
+        if self.path in ("/moved", "/elsewhere"):
+            port = self.server.server_address[1]
+            location = "/page" if self.path == "/moved" else f"http://localhost:{port}/page"
+            self.send_response(301)
+            self.send_header("Location", location)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        status, content_type = ROUTES.get(self.path, (404, "text/html"))
+        body = b"%PDF-1.7 " * 1000 if "pdf" in content_type else b"<html></html>"
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if with_body:
+            self.wfile.write(body)
+
+    def do_HEAD(self) -> None:
+        if self.path == "/download":
+            self.send_error(405)
+            return
+        self._respond(with_body=False)
+
+    def do_GET(self) -> None:
+        self._respond(with_body=True)
+
+    def log_message(self, format: str, *args: object) -> None:
+        return None
+
+
+@pytest.fixture
+def base_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def _closed_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def test_preflight_follows_redirects_and_classifies_targets(base_url) -> None:
+    preflight = Preflight(timeout_s=2)
+    try:
+        moved = preflight.check(f"{base_url}/moved")
+        assert (moved.final_url, moved.status, moved.failure) == (f"{base_url}/page", 200, None)
+        # HEAD refused: the ranged GET still reveals the PDF behind an extensionless URL.
+        assert preflight.check(f"{base_url}/download").failure == "not_html"
+        assert preflight.check(f"{base_url}/gone").failure == "http_4xx"
+        assert preflight.check(f"http://127.0.0.1:{_closed_port()}/").failure == "connection"
+    finally:
+        preflight.close()
+
+
+def test_preflight_candidate_feeds_health_and_url_filter(base_url) -> None:
+    # "127.0.0.1" passes as a host with the TLD "1"; "localhost" has no TLD and fails.
+    spec = SearchSpec(url_filter=UrlFilterSpec(domain_match="any", allowed_tlds=(".1",)))
+    ctx = compile_spec(spec).row_context({"name": "x"}, query="x")
+    health = HostHealth()
+    preflight = Preflight(timeout_s=2)
+    dead = f"http://127.0.0.1:{_closed_port()}/"
+    METRICS.reset()
+    try:
+        assert preflight_candidate(preflight, f"{base_url}/moved", ctx, health) == (
+            f"{base_url}/page"
+        )
+        assert preflight_candidate(preflight, f"{base_url}/elsewhere", ctx, health) is None
+        assert preflight_candidate(preflight, f"{base_url}/download", ctx, health) is None
+        for _ in range(3):
+            assert preflight_candidate(preflight, dead, ctx, health) is None
+    finally:
+        preflight.close()
+    assert health.skip_reason(dead) == "circuit open"
+    assert METRICS.get("preflight_rejected") == 5
@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import json
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from humanized_selenium_scraper.config import ScraperConfig
+from humanized_selenium_scraper.driver import create_driver
+from humanized_selenium_scraper.providers import GridProvider, endpoint_status
+
+
+class _RemoteStub:
+    def __init__(self, url: str) -> None:
+        self.url = url
+        self.closed = False
+
+    def set_page_load_timeout(self, timeout_s: float) -> None:
+        return None
+
+    def implicitly_wait(self, timeout_s: float) -> None:
+        return None
+
+    def quit(self) -> None:
+        self.closed = True
+
+
+def test_grid_assigns_least_loaded_ready_endpoint(tmp_path) -> None:
+    ready = {"http://a": True, "http://b": True, "http://c": False, "http://d": True}
+
+    def connect(url, options):
+        if url == "http://d":
+            raise ConnectionError("session not created")
+        return _RemoteStub(url)
+
+    grid = GridProvider(
+        ("http://a", "http://b", "http://c", "http://d"),
+        connect=connect,
+        status=lambda url: {"ready": ready[url]},
+    )
+    config = ScraperConfig()
+    drivers = [grid.create(config, profile_dir=tmp_path) for _ in range(4)]
+
+    assert sorted(d.url for d in drivers) == ["http://a", "http://a", "http://b", "http://b"]
+    assert grid.load() == {"http://a": 2, "http://b": 2, "http://c": 0, "http://d": 0}
+    drivers[0].quit()
+    drivers[0].quit()
+    assert drivers[0].closed
+    assert grid.load()[drivers[0].url] == 1
+    assert grid.create(config, profile_dir=tmp_path).url == drivers[0].url
+
+    ready.update({"http://a": False, "http://b": False})
+    grid.health_ttl_s = 0
+    with pytest.raises(RuntimeError, match="No ready WebDriver endpoint"):
+        grid.create(config, profile_dir=tmp_path)
+
+
+def test_endpoint_status_reads_w3c_status() -> None:
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            body = json.dumps({"value": {"ready": self.path == "/wd/status"}}).encode()
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args) -> None:
+            return None
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+    try:
+        assert endpoint_status(f"{base}/wd/") == {"ready": True}
+        assert endpoint_status(base) == {"ready": False}
+    finally:
+        server.shutdown()
+        server.server_close()
+    assert endpoint_status(base, timeout_s=0.5) is None
+
+
+def test_remote_backend_needs_one_url() -> None:
+    with pytest.raises(ValueError, match="exactly one"):
+        ScraperConfig(driver_backend="remote")
+    with pytest.raises(ValueError, match="Unknown driver_backend"):
+        ScraperConfig(driver_backend="cloud")
+
+
+@pytest.mark.skipif(
+    not os.environ.get("HSS_WEBDRIVER_URL"),
+    reason="set HSS_WEBDRIVER_URL to a running WebDriver server (e.g. chromedriver --port=9515)",
+)
+def test_remote_backend_against_live_server(tmp_path) -> None:
+    url = os.environ["HSS_WEBDRIVER_URL"]
+    status = endpoint_status(url)
+    assert status is not None
+    for backend in ("remote", "grid"):
+        config = ScraperConfig(driver_backend=backend, webdriver_urls=(url,))
+        driver = create_driver(config, profile_dir=tmp_path)
+        try:
+            driver.get("data:text/html,<title>hss</title><body>ok</body>")
+            assert driver.title == "hss"
+        finally:
+            driver.quit()
@@ -1,7 +1,11 @@
 from humanized_selenium_scraper.relevance import (
     address_score,
+    evaluate_chunks,
     evaluate_page,
+    iter_normalized,
+    iter_page_chunks,
     normalize_address_part,
+    tokenize_address_component,
 )
 
 
@@ -32,3 +36,45 @@ def test_evaluate_page_threshold() -> None:
         )
         is True
     )
+
+
+def test_evaluate_chunks_matches_across_chunk_boundaries() -> None:
+    page = "Kontakt: Hauptstraße 5, 10115 Berlin. contact contact"
+    tokens = {
+        "street_tokens": tokenize_address_component("Hauptstr. 5"),
+        "zip_tokens": ["10115"],
+        "city_tokens": ["berlin"],
+    }
+    for size in (1, 3, 7, len(page)):
+        verdict = evaluate_chunks(
+            iter_page_chunks(page, size),
+            keywords=["contact"],
+            min_keyword_hits=2,
+            require_address=True,
+            address_min_score=3,
+            **tokens,
+        )
+        assert verdict.relevant is True
+        assert verdict.address_score == 3
+    assert "".join(p for p, _n in iter_normalized(iter_page_chunks(page, 4))) == (
+        normalize_address_part(page)
+    )
+
+
+def test_evaluate_chunks_stops_reading_once_relevant() -> None:
+    page = "contact " * 10 + "filler " * 100_000
+    verdict = evaluate_chunks(
+        iter_page_chunks(page, 1024),
+        keywords=["contact"],
+        min_keyword_hits=6,
+        require_address=False,
+    )
+    assert verdict.relevant is True
+    assert verdict.keyword_hits == 6
+    assert verdict.chars_examined <= 1024
+    assert (
+        evaluate_page(
+            iter_page_chunks(page), keywords=["missing"], min_keyword_hits=1, require_address=False
+        )
+        is False
+    )
@@ -0,0 +1,203 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from dataclasses import replace
+
+import pytest
+from selenium.common.exceptions import TimeoutException, WebDriverException
+
+from humanized_selenium_scraper import cli, scraper
+from humanized_selenium_scraper.aio import async_run
+from humanized_selenium_scraper.config import ScraperConfig
+from humanized_selenium_scraper.emulation import FakeDriver, SimPage
+from humanized_selenium_scraper.exceptions import SkipEntryError
+from humanized_selenium_scraper.human import scaled_pauses
+from humanized_selenium_scraper.metrics import METRICS
+from humanized_selenium_scraper.retry import (
+    CircuitBreaker,
+    DeadHostCache,
+    HostHealth,
+    RetryLane,
+    classify_failure,
+    classify_page,
+)
+from humanized_selenium_scraper.selenium_ops import safe_get
+from humanized_selenium_scraper.simweb import SimWeb
+from humanized_selenium_scraper.spec import SearchSpec
+
+
+def test_failures_and_error_pages_are_classified() -> None:
+    def err(message: str) -> WebDriverException:
+        return WebDriverException(f"unknown error: net::{message}")
+
+    assert classify_failure(err("ERR_NAME_NOT_RESOLVED")) == "dns"
+    assert classify_failure(err("ERR_CERT_DATE_INVALID")) == "tls"
+    assert classify_failure(err("ERR_CONNECTION_REFUSED")) == "connection"
+    assert classify_failure(err("ERR_CONNECTION_TIMED_OUT")) == "timeout"
+    assert classify_failure(TimeoutException("page load")) == "timeout"
+    assert classify_failure(err("ERR_ABORTED")) == "other"
+
+    assert classify_page("https://a.de/x", "404 Not Found") == "http_4xx"
+    assert classify_page("https://a.de/", "Error 503") == "http_5xx"
+    assert classify_page("https://a.de/", "500 Pizza") is None
+    assert classify_page("https://www.google.com/sorry/index?continue=x", "") == "blocked"
+
+
+def test_breaker_opens_after_repeated_failures_and_half_opens_after_cooldown() -> None:
+    breaker = CircuitBreaker(threshold=3, cooldown_s=10)
+    for now in (0, 1, 2):
+        assert breaker.allow(now)
+        breaker.record(False, now)
+    assert not breaker.allow(5)
+    assert breaker.allow(12)  # half-open trial
+    breaker.record(False, 12)
+    assert not breaker.allow(13)  # one more failure re-opens it
+
+    health = HostHealth()
+    for _ in range(3):
+        health.record("https://slow.de/a", "timeout")
+    assert health.skip_reason("https://slow.de/b") == "circuit open"
+    health.record("https://gone.de/", "http_4xx")
+    assert health.skip_reason("https://gone.de/") is None
+
+
+def test_dead_host_cache_persists_merges_and_expires(tmp_path) -> None:
+    path = tmp_path / "dead.json"
+    first, second = DeadHostCache(path), DeadHostCache(path)
+    first.add("a.de", "dns")
+    second.add("b.de", "tls")
+    assert set(json.loads(path.read_text())) == {"a.de", "b.de"}
+    assert DeadHostCache(path).reason("a.de") == "dns"
+
+    expired = DeadHostCache(path, ttl_s=-1)
+    expired.add("c.de", "dns")
+    assert expired.reason("c.de") is None
+    assert DeadHostCache(path).reason("c.de") is None
+
+    # Hand-edited entries that do not parse are ignored, not fatal.
+    path.write_text(json.dumps({"a.de": ["dns", 4e12], "b.de": "tls", "c.de": ["dns", "x"]}))
+    assert DeadHostCache(path).reason("a.de") == "dns"
+    assert len(DeadHostCache(path)) == 1
+    path.write_text("[1, 2]")
+    assert len(DeadHostCache(path)) == 0
+
+
+def test_search_host_is_exempt_from_host_health() -> None:
+    web = SimWeb(companies=2, hit_rate=1.0)
+    health = HostHealth()
+    for _ in range(3):
+        health.record("https://www.google.com/", "timeout")
+    assert health.skip_reason("https://www.google.com/") == "circuit open"
+    session = scraper.Session(config=ScraperConfig(), driver=FakeDriver(web), health=health)
+    row = next(web.rows())
+    with scaled_pauses(0):
+        url, _phone, _email = session.search(
+            query=row["name"], row=row, spec=SearchSpec(query_template="{name}")
+        )
+    assert url is not None
+
+
+def test_safe_get_skips_dead_hosts_without_loading_them(tmp_path) -> None:
+    driver = FakeDriver(SimWeb(companies=1))
+    config = ScraperConfig(dead_host_file=tmp_path / "dead.json")
+    health = HostHealth.for_config(config)
+    METRICS.reset()
+    with scaled_pauses(0):
+        assert not safe_get(driver, config, "https://nowhere.invalid/", health=health)
+        assert not safe_get(driver, config, "https://nowhere.invalid/kontakt", health=health)
+        # A later run starts with the persisted cache.
+        fresh = HostHealth.for_config(config)
+        assert not safe_get(driver, config, "https://nowhere.invalid/", health=fresh)
+        with pytest.raises(SkipEntryError):
+            safe_get(driver, config, "https://www.google.com/sorry/index", health=health)
+    assert driver.page_loads == 2
+    assert METRICS.get("hosts_skipped") == 2
+    assert METRICS.get("retries") == 0
+
+
+def test_retry_lane_backs_off_per_row_and_cools_down_per_host() -> None:
+    now = [0.0]
+    lane = RetryLane(cooldown_s=10, max_attempts=3, clock=lambda: now[0])
+    assert lane.defer(0, 0, {}, attempt=1, url="https://down.de/a")
+    now[0] = 5
+    assert lane.defer(1, 1, {}, attempt=1, url="https://up.de/")
+    now[0] = 8
+    # A later failure on down.de holds back row 0 as well, although its own backoff ends at 10.
+    assert lane.defer(2, 2, {}, attempt=1, url="https://down.de/b")
+    now[0] = 12
+    assert lane.pop_ready() is None
+    assert lane.wait_s() == 3
+    now[0] = 15
+    assert lane.pop_ready().row_index == 1
+    assert lane.pop_ready() is None
+    now[0] = 18
+    assert [lane.pop_ready().row_index, lane.pop_ready().row_index] == [0, 2]
+    assert len(lane) == 0
+
+    # Attempt n waits cooldown * 2**(n-1); the last attempt is not deferred again.
+    assert lane.defer(3, 3, {}, attempt=2, url="https://up.de/")
+    now[0] = 37
+    assert lane.pop_ready() is None
+    now[0] = 38
+    assert lane.pop_ready().attempt == 3
+    assert not lane.defer(3, 3, {}, attempt=3, url="https://up.de/")
+
+
+class FlakyWeb:
+    """``SimWeb`` whose first load of ``host`` times out."""
+
+    def __init__(self, web: SimWeb, host: str) -> None:
+        self.web = web
+        self.consent = web.consent
+        self.host = host
+        self.failed = False
+
+    def resolve(self, url: str) -> SimPage | None:
+        if not self.failed and self.host in url:
+            self.failed = True
+            raise WebDriverException("unknown error: net::ERR_CONNECTION_TIMED_OUT")
+        return self.web.resolve(url)
+
+    def search(self, query: str) -> SimPage:
+        return self.web.search(query)
+
+
+def test_deferred_rows_are_searched_later_and_written_in_input_order(
+    tmp_path, monkeypatch, write_input
+) -> None:
+    web = SimWeb(companies=6, filler_kb=1)
+    host = next(c.host for c in map(web.company, range(6)) if c.host)
+    flaky = FlakyWeb(web, host)
+
+    def factory(config, *, profile_dir):
+        return FakeDriver(flaky if config.retry_mode == "deferred" else web)
+
+    monkeypatch.setattr(scraper, "create_driver", factory)
+    input_path = write_input(web)
+    options = dict(
+        input_file=input_path,
+        spec=SearchSpec(query_template="{name} {city} contact"),
+        delimiter=",",
+        has_header=False,
+        columns=["name", "street", "plz", "city"],
+    )
+    inline = ScraperConfig(chrome_profile_root=tmp_path / "profile")
+    deferred = replace(inline, retry_mode="deferred", retry_cooldown_s=1)
+    with scaled_pauses(0):
+        cli.run(output_file=tmp_path / "inline.csv", config=inline, **options)
+        METRICS.reset()
+        cli.run(output_file=tmp_path / "sync.csv", config=deferred, **options)
+        assert flaky.failed
+        assert METRICS.get("rows_deferred") == 1
+        assert METRICS.get("retries") == 0
+        flaky.failed = False
+        asyncio.run(
+            async_run(output_file=tmp_path / "async.csv", config=deferred, concurrency=2, **options)
+        )
+        assert flaky.failed
+
+    expected = (tmp_path / "inline.csv").read_text(encoding="utf-8")
+    assert host in expected
+    assert (tmp_path / "sync.csv").read_text(encoding="utf-8") == expected
+    assert (tmp_path / "async.csv").read_text(encoding="utf-8") == expected
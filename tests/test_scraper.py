@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from humanized_selenium_scraper import cli, scraper
+from humanized_selenium_scraper.aio import async_run
+from humanized_selenium_scraper.compiled import compile_spec
+from humanized_selenium_scraper.config import ScraperConfig
+from humanized_selenium_scraper.human import HEIGHT_SCRIPT, SCROLL_SCRIPT, scaled_pauses
+from humanized_selenium_scraper.metrics import METRICS
+from humanized_selenium_scraper.scraper import results_url, scroll_and_evaluate
+from humanized_selenium_scraper.simweb import SimWeb
+from humanized_selenium_scraper.spec import NavigationSpec, RelevanceSpec, SearchSpec
+
+
+class LazyPageDriver:
+    """Infinite-scroll page that appends one block of content per scroll."""
+
+    def __init__(self, blocks: list[str]) -> None:
+        self.blocks = blocks
+        self.loaded = 1
+        self.scrolls = 0
+
+    current_url = "https://firma.de/"
+
+    @property
+    def page_source(self) -> str:
+        return "".join(self.blocks[: self.loaded])
+
+    def execute_script(self, script: str, *args):
+        if script == HEIGHT_SCRIPT:
+            return 1000 * self.loaded
+        if script == SCROLL_SCRIPT:
+            self.scrolls += 1
+            self.loaded = min(self.loaded + 1, len(self.blocks))
+        return None
+
+
+def _ctx():
+    spec = SearchSpec(
+        relevance=RelevanceSpec(
+            keyword_templates=("{name}",), min_total_keyword_hits=1, require_address=False
+        )
+    )
+    return compile_spec(spec).row_context({"name": "Firma"}, query="Firma")
+
+
+def test_incremental_relevance_stops_scrolling_once_page_passes() -> None:
+    ctx = _ctx()
+    with scaled_pauses(0):
+        above_fold = LazyPageDriver(["<p>Firma</p>", "more", "more", "more"])
+        passed, snapshot = scroll_and_evaluate(
+            above_fold, ctx, max_scroll=3, pause_s=1, incremental=True
+        )
+        assert passed and snapshot.html == "<p>Firma</p>"
+        assert above_fold.scrolls == 0
+
+        below_fold = LazyPageDriver(["nav", "more", "<p>Firma</p>", "more"])
+        assert scroll_and_evaluate(below_fold, ctx, max_scroll=3, pause_s=1, incremental=True)[0]
+        assert below_fold.scrolls == 2
+
+        # Failing pages are scrolled as far as the full mode would go.
+        failing = LazyPageDriver(["nav", "more"])
+        assert not scroll_and_evaluate(failing, ctx, max_scroll=3, pause_s=1, incremental=True)[0]
+        full = LazyPageDriver(["nav", "more"])
+        assert not scroll_and_evaluate(full, ctx, max_scroll=3, pause_s=1, incremental=False)[0]
+        assert failing.scrolls == full.scrolls == 2
+
+
+def test_incremental_relevance_reads_each_scroll_step_once() -> None:
+    ctx = _ctx()
+    blocks = ["<main>nav", "<p>more</p>" * 50, "<p>more</p>" * 50, "</main>"]
+    METRICS.reset()
+    with scaled_pauses(0):
+        failing = LazyPageDriver(blocks)
+        passed, snapshot = scroll_and_evaluate(
+            failing, ctx, max_scroll=3, pause_s=1, incremental=True
+        )
+    assert not passed and snapshot.html == "".join(blocks)
+    # Only the text each step added is evaluated, not the whole page again.
+    assert METRICS.get("relevance_chars_examined") == len(snapshot.html)
+
+    with scaled_pauses(0):
+        late = LazyPageDriver(["<main>nav", "<p>more</p>" * 50, "<p>Firma</p>", "</main>"])
+        assert scroll_and_evaluate(late, ctx, max_scroll=3, pause_s=1, incremental=True)[0]
+    assert late.scrolls == 2
+
+
+def test_direct_serp_mode_finds_the_same_sites_with_fewer_loads(
+    tmp_path, monkeypatch, serve_web, write_input
+) -> None:
+    web = SimWeb(companies=6, filler_kb=1)
+    serve_web(web)
+    # Same candidate order in both modes, so only the SERP phase differs in page loads.
+    monkeypatch.setattr(scraper.random, "shuffle", lambda _items: None)
+    input_path = write_input(web)
+    options = dict(
+        input_file=input_path,
+        config=ScraperConfig(chrome_profile_root=tmp_path / "profile"),
+        delimiter=",",
+        has_header=False,
+        columns=["name", "street", "plz", "city"],
+    )
+    loads = {}
+    with scaled_pauses(0):
+        for mode in ("homepage", "direct"):
+            spec = SearchSpec(
+                query_template="{name} {city} contact", navigation=NavigationSpec(serp_mode=mode)
+            )
+            METRICS.reset()
+            cli.run(output_file=tmp_path / f"{mode}.csv", spec=spec, **options)
+            loads[mode] = METRICS.get("page_loads")
+        asyncio.run(async_run(output_file=tmp_path / "async.csv", spec=spec, **options))
+
+    expected = (tmp_path / "homepage.csv").read_text(encoding="utf-8")
+    assert "https://" in expected
+    assert (tmp_path / "direct.csv").read_text(encoding="utf-8") == expected
+    assert (tmp_path / "async.csv").read_text(encoding="utf-8") == expected
+    # The homepage load and the submitted search become one results-URL load per row.
+    assert loads["homepage"] - loads["direct"] == 6
+
+
+def test_results_url_carries_query_language_and_result_count() -> None:
+    url = results_url("google.de", "Firma Köln & Co", num=20, language="de")
+    assert url == "https://www.google.de/search?q=Firma+K%C3%B6ln+%26+Co&num=20&hl=de"
+    assert results_url("google.com", "x", num=10) == "https://www.google.com/search?q=x&num=10"
+    with pytest.raises(ValueError, match="serp_mode"):
+        NavigationSpec(serp_mode="api")
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import csv
+
+import pytest
+from selenium.common.exceptions import WebDriverException
+
+from humanized_selenium_scraper import cli
+from humanized_selenium_scraper.config import ScraperConfig
+from humanized_selenium_scraper.emulation import FakeDriver
+from humanized_selenium_scraper.human import scaled_pauses
+from humanized_selenium_scraper.simweb import SimWeb
+from humanized_selenium_scraper.spec import SearchSpec
+
+
+def test_fake_driver_unknown_host_raises() -> None:
+    driver = FakeDriver(SimWeb(companies=3))
+    with pytest.raises(WebDriverException, match="ERR_NAME_NOT_RESOLVED"):
+        driver.get("https://nowhere.invalid/")
+    assert driver.page_loads == 1
+
+
+def test_run_end_to_end_on_simulated_web(tmp_path, serve_web, write_input) -> None:
+    web = SimWeb(companies=12, filler_kb=1)
+    serve_web(web)
+    input_path = write_input(web)
+    output_path = tmp_path / "output.csv"
+
+    with scaled_pauses(0):
+        cli.run(
+            input_file=input_path,
+            output_file=output_path,
+            config=ScraperConfig(chrome_profile_root=tmp_path / "profile"),
+            spec=SearchSpec(query_template="{name} {city} contact"),
+            delimiter=",",
+            has_header=False,
+            columns=["name", "street", "plz", "city"],
+        )
+
+    with output_path.open("r", encoding="utf-8", newline="") as handle:
+        rows = list(csv.reader(handle))[1:]
+    assert len(rows) == 12
+    for index, row in enumerate(rows):
+        host = web.company(index).host
+        if host is None:
+            assert row[4:] == ["", "", ""]
+        else:
+            assert row[4] == f"https://{host}/"
+            assert row[5]
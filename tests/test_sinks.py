@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import csv
+import json
+import sqlite3
+import threading
+
+import pytest
+
+from humanized_selenium_scraper.sinks import (
+    CsvSink,
+    SinkOptions,
+    SinkWriter,
+    infer_output_format,
+    open_sink,
+)
+
+
+def test_sink_writer_collects_rows_from_many_threads(tmp_path) -> None:
+    path = tmp_path / "out.sqlite"
+    writer = SinkWriter(open_sink(path, ["name", "Website"]), SinkOptions(batch_size=7))
+
+    def worker(offset: int) -> None:
+        for i in range(offset, 100, 4):
+            writer.submit(i, [f"n{i}", f"https://{i}.de"])
+
+    threads = [threading.Thread(target=worker, args=(k,)) for k in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    writer.close()
+
+    with sqlite3.connect(path) as conn:
+        rows = conn.execute("SELECT row_index, name FROM results ORDER BY row_index").fetchall()
+        indexes = conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'").fetchall()
+    assert rows == [(i, f"n{i}") for i in range(100)]
+    assert indexes == [("results_row_index",)]
+
+
+def test_jsonl_sink_writes_row_index_and_columns(tmp_path) -> None:
+    path = tmp_path / "out.jsonl"
+    assert infer_output_format(path) == "jsonl"
+    with SinkWriter(open_sink(path, ["name", "Email"])) as writer:
+        writer.submit(0, ["ACME", "a@b.de"])
+    records = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+    assert records == [{"row_index": 0, "name": "ACME", "Email": "a@b.de"}]
+
+
+def test_csv_sink_not_created_without_rows(tmp_path) -> None:
+    path = tmp_path / "out.csv"
+    SinkWriter(CsvSink(path, ["name"])).close()
+    assert not path.exists()
+
+    with SinkWriter(CsvSink(path, ["name"])) as writer:
+        writer.submit(0, ["ACME"])
+    with path.open("r", encoding="utf-8", newline="") as handle:
+        assert list(csv.reader(handle)) == [["name"], ["ACME"]]
+
+
+def test_parquet_sink_round_trip(tmp_path) -> None:
+    pq = pytest.importorskip("pyarrow.parquet")
+    path = tmp_path / "out.parquet"
+    with SinkWriter(open_sink(path, ["name"]), SinkOptions(batch_size=2)) as writer:
+        for i in range(5):
+            writer.submit(i, [f"n{i}"])
+    table = pq.read_table(path)
+    assert table.column("name").to_pylist() == [f"n{i}" for i in range(5)]
@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+from humanized_selenium_scraper.emulation import FakeDriver
+from humanized_selenium_scraper.extract_selenium import parse_phone_email_snapshot
+from humanized_selenium_scraper.simweb import SimWeb
+from humanized_selenium_scraper.snapshot import capture_snapshot
+
+
+def test_snapshot_captures_the_page_in_one_call() -> None:
+    web = SimWeb(companies=6, hit_rate=1.0)
+    driver = FakeDriver(web)
+    for index in range(6):
+        driver.get(f"https://{web.company(index).host}/kontakt")
+        snapshot = capture_snapshot(driver)
+        assert snapshot.url == driver.current_url
+        assert snapshot.html == driver.page_source
+        anchors = [a.get_attribute("href") for a in driver.find_elements("tag name", "a")]
+        assert [link.href for link in snapshot.links] == anchors
+        phone, email = parse_phone_email_snapshot(snapshot)
+        assert phone and email
+
+
+class ScriptlessDriver:
+    current_url = "https://example.org/"
+    page_source = "<html>tel. 030 1234567</html>"
+
+    def execute_script(self, script: str, *args):
+        return None
+
+
+def test_capture_snapshot_falls_back_to_page_source() -> None:
+    snapshot = capture_snapshot(ScriptlessDriver())
+    assert snapshot.url == "https://example.org/"
+    assert snapshot.links == ()
+    assert parse_phone_email_snapshot(snapshot)[0] == "030 1234567"
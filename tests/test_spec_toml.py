@@ -59,6 +59,8 @@ min_query_part_len = 4
 max_google_results = 5
 max_links_per_page = 10
 subpage_depth = 1
+serp_mode = "direct"
+serp_language = "de"
 """
     path = tmp_path / "spec.toml"
     path.write_text(toml_content, encoding="utf-8")
@@ -84,6 +86,7 @@ subpage_depth = 1
     assert spec.navigation.max_google_results == 5
     assert spec.navigation.max_links_per_page == 10
     assert spec.navigation.subpage_depth == 1
+    assert (spec.navigation.serp_mode, spec.navigation.serp_language) == ("direct", "de")
 
 
 def test_searchspec_from_toml_single_string_list_fields(tmp_path) -> None:
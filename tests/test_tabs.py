@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import time
+
+import pytest
+
+from humanized_selenium_scraper import scraper
+from humanized_selenium_scraper.config import ScraperConfig
+from humanized_selenium_scraper.emulation import FakeDriver, SimPage
+from humanized_selenium_scraper.exceptions import RetryLaterError
+from humanized_selenium_scraper.human import scaled_pauses
+from humanized_selenium_scraper.metrics import METRICS
+from humanized_selenium_scraper.retry import HostHealth
+from humanized_selenium_scraper.selenium_ops import check_loaded
+from humanized_selenium_scraper.simweb import SimWeb
+from humanized_selenium_scraper.spec import NavigationSpec, SearchSpec
+from humanized_selenium_scraper.tabs import TabPipeline
+
+
+def test_tab_pipeline_overlaps_loads_and_closes_tabs() -> None:
+    web = SimWeb(companies=4)
+    driver = FakeDriver(web, load_latency_s=0.05)
+    urls = [f"https://{web.company(i).host or 'nowhere.invalid'}/" for i in range(4)]
+    pipeline = TabPipeline(driver, width=4, load_timeout_s=5, poll_s=0.005)
+    started = time.monotonic()
+    with scaled_pauses(0):
+        seen = [(tab.url, driver.current_url) for tab, _ready in pipeline.run(urls)]
+    # Four 50 ms loads in parallel tabs take about one load, not four.
+    assert time.monotonic() - started < 0.15
+    assert [url for url, _current in seen] == urls
+    assert all(url == current for url, current in seen if "invalid" not in url)
+    assert driver.window_handles == [pipeline.home]
+
+
+def test_search_in_tabs_matches_sequential_search(monkeypatch) -> None:
+    web = SimWeb(companies=8, filler_kb=1, seed=3)
+    monkeypatch.setattr(scraper.random, "shuffle", lambda _items: None)
+    results = {}
+    for width in (0, 3):
+        driver = FakeDriver(web)
+        session = scraper.Session(config=ScraperConfig(), driver=driver)
+        spec = SearchSpec(
+            query_template="{name} {city}", navigation=NavigationSpec(tab_pipeline=width)
+        )
+        METRICS.reset()
+        with scaled_pauses(0):
+            results[width] = [
+                session.search(query=f"{c['name']} {c['city']}", row=c, spec=spec)
+                for c in web.rows()
+            ]
+        assert driver.window_handles == ["w0"]
+        if width:
+            assert METRICS.get("history_back") == 0
+            assert METRICS.get("tabs_opened") > 0
+    assert results[3] == results[0]
+    assert any(url for url, _phone, _email in results[0])
+
+
+class _DownWeb(SimWeb):
+    def resolve(self, url: str) -> SimPage | None:
+        if "down.de" in url:
+            return SimPage(url=url, title="503 Service Unavailable", text="")
+        return super().resolve(url)
+
+
+def test_tab_loads_are_classified_and_recorded_like_safe_get() -> None:
+    driver = FakeDriver(_DownWeb(companies=1))
+    config = ScraperConfig(retry_mode="deferred")
+    health = HostHealth()
+    pipeline = TabPipeline(driver, width=2, load_timeout_s=5, poll_s=0.005)
+    outcomes: dict[str, object] = {}
+    with scaled_pauses(0):
+        for tab, ready in pipeline.run(["https://nowhere.invalid/", "https://down.de/"]):
+            assert ready
+            try:
+                outcomes[tab.url] = check_loaded(driver, config, tab.url, health=health)
+            except RetryLaterError as exc:
+                outcomes[tab.url] = exc.kind
+    # Chrome's DNS error page marks the host dead; the 5xx page is deferred, not evaluated.
+    assert outcomes == {"https://nowhere.invalid/": False, "https://down.de/": "http_5xx"}
+    assert health.skip_reason("https://nowhere.invalid/kontakt") is not None
+    with pytest.raises(RetryLaterError):
+        check_loaded(driver, config, "https://down.de/", health=health, failure="timeout")
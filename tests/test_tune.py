@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import tomllib
+
+import pytest
+
+from humanized_selenium_scraper import cli, scraper
+from humanized_selenium_scraper.archive import RecordingDriver, WebArchive
+from humanized_selenium_scraper.config import ScraperConfig
+from humanized_selenium_scraper.emulation import FakeDriver
+from humanized_selenium_scraper.human import scaled_pauses
+from humanized_selenium_scraper.simweb import SimWeb
+from humanized_selenium_scraper.spec import SearchSpec
+from humanized_selenium_scraper.tune import load_variants, tune
+
+GRID = """
+[[variant]]
+name = "base"
+
+[[variant]]
+name = "strict"
+relevance = { min_total_keyword_hits = 500 }
+
+[grid]
+"navigation.subpage_depth" = [0, 2]
+"""
+
+
+def test_load_variants_expands_grid_over_base_tables() -> None:
+    base = {"search": {"query_template": "{name} {city} contact"}}
+    variants = load_variants(tomllib.loads(GRID), base)
+
+    assert [v.name for v in variants] == [
+        "base subpage_depth=0",
+        "base subpage_depth=2",
+        "strict subpage_depth=0",
+        "strict subpage_depth=2",
+    ]
+    assert all(v.spec.query_template == "{name} {city} contact" for v in variants)
+    assert [v.spec.navigation.subpage_depth for v in variants] == [0, 2, 0, 2]
+    assert variants[2].spec.relevance.min_total_keyword_hits == 500
+    assert load_variants({}, base)[0].name == "base"
+    with pytest.raises(ValueError, match="non-empty lists"):
+        load_variants({"grid": {"navigation.subpage_depth": []}}, base)
+
+
+def test_tune_reports_variants_over_recorded_archive(tmp_path, monkeypatch, write_input) -> None:
+    web = SimWeb(companies=8, filler_kb=1)
+    record_dir = tmp_path / "rec"
+    input_path = write_input(web)
+    monkeypatch.setattr(
+        scraper,
+        "create_driver",
+        lambda config, *, profile_dir: RecordingDriver(
+            FakeDriver(web), WebArchive(record_dir), google_domain=config.google_domain
+        ),
+    )
+    with scaled_pauses(0):
+        cli.run(
+            input_file=input_path,
+            output_file=tmp_path / "output.csv",
+            config=ScraperConfig(chrome_profile_root=tmp_path),
+            spec=SearchSpec(query_template="{name} {city} contact"),
+            delimiter=",",
+            has_header=False,
+            columns=["name", "street", "plz", "city"],
+        )
+    monkeypatch.undo()
+
+    base = {"search": {"query_template": "{name} {city} contact"}}
+    options = dict(
+        variants=load_variants(tomllib.loads(GRID), base),
+        rows=list(web.rows()),
+        config=ScraperConfig(chrome_profile_root=tmp_path, replay_dir=record_dir),
+    )
+    results = tune(**options, workers=2)
+    # Replays are deterministic, so the split over workers does not change the report.
+    assert tune(**options, workers=1) == results
+
+    by_name = {r.variant: r for r in results}
+    hosts = sum(web.company(i).host is not None for i in range(8))
+    assert by_name["base subpage_depth=2"].matched == hosts
+    assert by_name["base subpage_depth=2"].extracted == hosts
+    assert by_name["base subpage_depth=0"].matched == hosts
+    assert by_name["strict subpage_depth=2"].matched == 0
+    assert all(r.rows == 8 for r in results)
+    assert by_name["strict subpage_depth=0"].page_loads > by_name["base subpage_depth=0"].page_loads
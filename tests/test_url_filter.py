@@ -1,4 +1,9 @@
-from humanized_selenium_scraper.url_filter import is_relevant_url
+from humanized_selenium_scraper.url_filter import (
+    PublicSuffixList,
+    UrlFilter,
+    is_relevant_url,
+    load_public_suffix_list,
+)
 
 
 def test_is_relevant_url_filters_blacklist() -> None:
@@ -8,3 +13,44 @@ def test_is_relevant_url_filters_blacklist() -> None:
 def test_is_relevant_url_requires_tld_and_query_part() -> None:
     assert is_relevant_url("firma berlin", "https://example.invalid/") is False
     assert is_relevant_url("firma berlin", "https://firma-berlin.de/contact") is True
+
+
+def test_url_filter_filter_many_reports_reasons() -> None:
+    url_filter = UrlFilter(allowed_tlds=(".de", ".co.uk"), domain_keyword_blacklist=("facebook",))
+    accepted, rejected = url_filter.filter_many(
+        [
+            "https://firma-berlin.de/",
+            "https://shop.firma.co.uk/x",
+            "https://www.facebook.de/firma",
+            "https://firma.made/",
+            "https://other.de/",
+            "https://firma.de/flyer.pdf",
+            "blob:https://firma.de/1",
+        ],
+        query="Firma Berlin",
+    )
+    assert accepted == ["https://firma-berlin.de/", "https://shop.firma.co.uk/x"]
+    assert [reason for _url, reason in rejected] == [
+        "blacklist",
+        "tld",
+        "query_part",
+        "pdf",
+        "scheme",
+    ]
+
+
+def test_public_suffix_list_and_suffix_aware_query_match() -> None:
+    psl = load_public_suffix_list()
+    assert psl.public_suffix("shop.example.co.uk") == "co.uk"
+    assert psl.registrable_domain("shop.example.co.uk") == "example.co.uk"
+    assert psl.registrable_domain("co.uk") is None
+
+    rules = PublicSuffixList(["de", "*.ck", "!www.ck"])
+    assert rules.public_suffix("a.b.ck") == "b.ck"
+    assert rules.public_suffix("www.ck") == "ck"
+
+    plain = UrlFilter(allowed_tlds=(".berlin",))
+    aware = UrlFilter(allowed_tlds=(".berlin",), public_suffixes=psl)
+    assert plain.accepts("https://bar.berlin/", query="Firma Berlin")
+    assert not aware.accepts("https://bar.berlin/", query="Firma Berlin")
+    assert aware.accepts("https://firma.berlin/", query="Firma Berlin")
@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import pytest
+from selenium.common.exceptions import TimeoutException
+
+from humanized_selenium_scraper.config import ScraperConfig
+from humanized_selenium_scraper.emulation import FakeDriver
+from humanized_selenium_scraper.human import scaled_pauses
+from humanized_selenium_scraper.metrics import METRICS
+from humanized_selenium_scraper.providers import RemoteProvider
+from humanized_selenium_scraper.scraper import Session
+from humanized_selenium_scraper.simweb import SimWeb
+from humanized_selenium_scraper.spec import SearchSpec
+from humanized_selenium_scraper.waits import WaitPolicy
+
+
+class _RemoteStub:
+    def __init__(self) -> None:
+        self.implicit_wait_s: float | None = None
+
+    def set_page_load_timeout(self, timeout_s: float) -> None:
+        return None
+
+    def implicitly_wait(self, timeout_s: float) -> None:
+        self.implicit_wait_s = timeout_s
+
+
+def test_browsers_start_without_implicit_waits_and_phases_come_from_config(tmp_path) -> None:
+    driver = RemoteProvider("http://node:4444", connect=lambda url, options: _RemoteStub()).create(
+        ScraperConfig(), profile_dir=tmp_path
+    )
+    assert driver.implicit_wait_s == 0
+
+    policy = WaitPolicy.for_config(ScraperConfig.from_mapping({"results_wait_s": 3}))
+    assert (policy.timeout("page_body"), policy.timeout("results")) == (10, 3)
+    with pytest.raises(ValueError, match="Unknown wait phase"):
+        policy.timeout("anything")
+    with pytest.raises(ValueError, match="wait timeouts"):
+        ScraperConfig(search_box_wait_s=0)
+
+
+def test_waits_are_recorded_per_phase_and_time_out() -> None:
+    web = SimWeb(companies=1)
+    driver = FakeDriver(web)
+    session = Session(config=ScraperConfig(), driver=driver, waits=WaitPolicy())
+    row = next(web.rows())
+    METRICS.reset()
+    with scaled_pauses(0):
+        session.search(query=row["name"], row=row, spec=SearchSpec(query_template="{name}"))
+    assert {"wait_s_page_body", "wait_s_search_box", "wait_s_results"} <= set(METRICS.snapshot())
+    assert METRICS.get("wait_timeouts") == 0
+
+    short = WaitPolicy(page_body_s=0.05, poll_s=0.01)
+    with pytest.raises(TimeoutException):
+        short.until(driver, "page_body", lambda d: d.find_elements("id", "missing"))
+    assert METRICS.get("wait_timeouts") == 1
+    assert METRICS.get("wait_s_page_body") >= 0.05
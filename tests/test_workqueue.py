@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import csv
+import time
+from pathlib import Path
+
+from humanized_selenium_scraper import cli
+from humanized_selenium_scraper.config import ScraperConfig
+from humanized_selenium_scraper.exceptions import RetryLaterError, SkipEntryError
+from humanized_selenium_scraper.steps import call
+from humanized_selenium_scraper.workqueue import WorkQueue
+
+
+class FlakySession:
+    calls: list[str] = []
+
+    @classmethod
+    def create(cls, config: ScraperConfig, *, profile_dir: Path):
+        return cls()
+
+    def close(self) -> None:
+        return None
+
+    def search(self, *, query: str, row: dict[str, str], spec, attempt: int = 1):
+        FlakySession.calls.append(query)
+        if query == "ErrorCo":
+            raise RuntimeError("boom")
+        if query == "SkipCo":
+            raise SkipEntryError("not a company")
+        if query == "FlakyCo" and FlakySession.calls.count(query) == 1:
+            raise RetryLaterError("https://flakyco.de/", "timeout")
+        return f"https://{query.lower()}.de", "", ""
+
+    def search_steps(self, **kwargs):
+        return call(self.search, **kwargs)
+
+
+def test_claim_complete_fail_and_expired_lease(tmp_path) -> None:
+    queue = WorkQueue(tmp_path / "q.sqlite", max_attempts=2)
+    rows = [(i, {"name": f"Co{i}"}) for i in range(3)]
+    assert queue.load(rows, columns=["name"]) == 3
+    assert queue.load(rows, columns=["name"]) == 0
+    assert queue.columns() == ["name"]
+
+    first = queue.claim("w1", lease_s=60)
+    assert first is not None and first.row_index == 0 and first.attempts == 1
+    assert queue.complete(0, "w1", ["Co0", "https://co0.de", "", ""])
+
+    second = queue.claim("w1", lease_s=0.01)
+    assert second is not None and second.row_index == 1
+    time.sleep(0.02)
+    # The expired lease is reclaimed by another worker; the stale owner can no longer complete.
+    reclaimed = queue.claim("w2", lease_s=60)
+    assert reclaimed is not None and reclaimed.row_index == 1 and reclaimed.attempts == 2
+    assert not queue.complete(1, "w1", ["stale"])
+    assert queue.fail(1, "w2", "boom") == "failed"
+
+    third = queue.claim("w2", lease_s=60)
+    assert third is not None and third.row_index == 2
+    assert queue.fail(2, "w2", "boom") == "pending"
+    assert queue.counts() == {"pending": 1, "leased": 0, "done": 1, "failed": 1}
+    assert not queue.is_drained()
+    assert [i for i, _row, _values in queue.results(batch_size=2)] == [0, 1, 2]
+    queue.close()
+
+
+def test_queue_subcommand_processes_and_exports_in_order(tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr(cli, "Session", FlakySession)
+    monkeypatch.setattr(cli, "random_pause", lambda *_a, **_k: None)
+    FlakySession.calls = []
+    input_path = tmp_path / "input.csv"
+    input_path.write_text("name\nCo0\nErrorCo\nSkipCo\nFlakyCo\nCo2\n", encoding="utf-8")
+    output_path = tmp_path / "out.csv"
+    args = [
+        "queue",
+        "--header",
+        "--input",
+        str(input_path),
+        "--output",
+        str(output_path),
+        "--queue-db",
+        str(tmp_path / "q.sqlite"),
+        "--query-template",
+        "{name}",
+        "--max-attempts",
+        "2",
+    ]
+
+    assert cli.main(args) == 0
+    assert FlakySession.calls.count("ErrorCo") == 2
+    # A skipped row is final: it is completed once, not retried as a failure.
+    assert FlakySession.calls.count("SkipCo") == 1
+    # A transient failure releases the row for another attempt instead of finalising it.
+    assert FlakySession.calls.count("FlakyCo") == 2
+    with output_path.open("r", encoding="utf-8", newline="") as handle:
+        rows = list(csv.reader(handle))
+    assert rows == [
+        ["name", "Website", "Phone", "Email"],
+        ["Co0", "https://co0.de", "", ""],
+        ["ErrorCo", "", "", ""],
+        ["SkipCo", "", "", ""],
+        ["FlakyCo", "https://flakyco.de", "", ""],
+        ["Co2", "https://co2.de", "", ""],
+    ]
+
+    # A worker joining a drained queue does no work and re-exports the same result.
+    FlakySession.calls = []
+    assert cli.main(args) == 0
+    assert FlakySession.calls == []
+    assert output_path.read_text(encoding="utf-8").count("\n") == 6